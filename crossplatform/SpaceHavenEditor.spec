@@ -6,7 +6,10 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=['lxml', 'lxml.etree', 'lxml._elementpath', 'PySide6.QtCore', 'PySide6.QtGui', 'PySide6.QtWidgets'],
+    hiddenimports=['lxml', 'lxml.etree', 'lxml._elementpath', 'PySide6.QtCore', 'PySide6.QtGui', 'PySide6.QtWidgets',
+                   # main.py imports these on first use, so the analysis cannot find them
+                   'models', 'save_loader', 'save_cache', 'backups', 'save_diff',
+                   'journal', 'element_views', 'splice_writer', 'table_models', 'crew_index', 'sidecars'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -0,0 +1,166 @@
+from __future__ import annotations
+import hashlib
+import json
+import lzma
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+try:
+    from .sidecars import CACHE_SUFFIX
+except ImportError:
+    # Fallback for when running as standalone (PyInstaller)
+    from sidecars import CACHE_SUFFIX
+
+
+# Automatic backups taken when a save is opened. Like the original editor, the
+# whole save folder (the one holding "game") is backed up into the savegames
+# folder, but files are stored once per content hash, compressed with lzma:
+#
+#   savegames/editor_backups/objects/ab/abcdef....xz
+#   savegames/editor_backups/snapshots/<save name>/<timestamp>.json
+#
+# A snapshot maps the folder's file names to hashes. Reopening an unchanged save
+# writes nothing, and only the newest KEEP_SNAPSHOTS snapshots per save are kept.
+
+BACKUP_DIR_NAME = "editor_backups"
+KEEP_SNAPSHOTS = 10
+LZMA_PRESET = 1
+
+# One backup at a time, so pruning never races with a snapshot being written
+_lock = threading.Lock()
+
+
+def backup_root_for(save_path: str) -> str:
+    """savegames/editor_backups for savegames/<name>/save/game."""
+    save_dir = os.path.dirname(os.path.abspath(save_path))
+    name_dir = os.path.dirname(save_dir)
+    return os.path.join(os.path.dirname(name_dir) or name_dir, BACKUP_DIR_NAME)
+
+
+def _save_name(save_path: str) -> str:
+    save_dir = os.path.dirname(os.path.abspath(save_path))
+    return os.path.basename(os.path.dirname(save_dir)) or "save"
+
+
+def _object_path(root: str, digest: str) -> str:
+    return os.path.join(root, "objects", digest[:2], digest + ".xz")
+
+
+def _hash_file(path: str) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _store(root: str, path: str, digest: str) -> None:
+    target = _object_path(root, digest)
+    if os.path.exists(target):
+        return
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    tmp = target + ".tmp"
+    compressor = lzma.LZMACompressor(preset=LZMA_PRESET)
+    with open(path, "rb") as src, open(tmp, "wb") as out:
+        for chunk in iter(lambda: src.read(1024 * 1024), b""):
+            out.write(compressor.compress(chunk))
+        out.write(compressor.flush())
+    os.replace(tmp, target)
+
+
+def list_snapshots(save_path: str, root: Optional[str] = None) -> List[str]:
+    """Snapshot files of a save, oldest first."""
+    folder = os.path.join(root or backup_root_for(save_path), "snapshots", _save_name(save_path))
+    if not os.path.isdir(folder):
+        return []
+    return [os.path.join(folder, n) for n in sorted(os.listdir(folder)) if n.endswith(".json")]
+
+
+def _read_snapshot(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def backup_save(save_path: str, root: Optional[str] = None, keep: int = KEEP_SNAPSHOTS) -> Optional[str]:
+    """Back up the folder containing save_path; returns the new snapshot, or None if nothing changed."""
+    root = root or backup_root_for(save_path)
+    save_dir = os.path.dirname(os.path.abspath(save_path))
+    with _lock:
+        stats = {}
+        for name in sorted(os.listdir(save_dir)):
+            path = os.path.join(save_dir, name)
+            if os.path.isfile(path) and not name.endswith((CACHE_SUFFIX, ".tmp")):
+                st = os.stat(path)
+                stats[name] = [st.st_size, st.st_mtime_ns]
+
+        snapshots = list_snapshots(save_path, root)
+        latest = _read_snapshot(snapshots[-1]) if snapshots else None
+        # Same sizes and mtimes as the last snapshot: nothing to hash or copy
+        if latest is not None and latest.get("stats") == stats:
+            return None
+
+        files: Dict[str, str] = {}
+        for name in stats:
+            path = os.path.join(save_dir, name)
+            files[name] = _hash_file(path)
+            _store(root, path, files[name])
+        if latest is not None and latest.get("files") == files:
+            # Touched but identical content: refresh the stats so the next open skips hashing
+            latest["stats"] = stats
+            _write_json(snapshots[-1], latest)
+            return None
+
+        folder = os.path.join(root, "snapshots", _save_name(save_path))
+        os.makedirs(folder, exist_ok=True)
+        snapshot = os.path.join(folder, time.strftime("%Y%m%d_%H%M%S") + f"_{time.time_ns() % 1_000_000_000:09d}.json")
+        _write_json(snapshot, {"source": save_dir, "created": time.time(), "files": files, "stats": stats})
+        prune(root, keep)
+        return snapshot
+
+
+def _write_json(path: str, data: Dict) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def prune(root: str, keep: int = KEEP_SNAPSHOTS) -> int:
+    """Keep the newest `keep` snapshots per save and delete objects no snapshot uses; returns objects deleted."""
+    snapshots_dir = os.path.join(root, "snapshots")
+    referenced = set()
+    if os.path.isdir(snapshots_dir):
+        for name in os.listdir(snapshots_dir):
+            folder = os.path.join(snapshots_dir, name)
+            snaps = sorted(n for n in os.listdir(folder) if n.endswith(".json"))
+            for old in snaps[:max(0, len(snaps) - keep)]:
+                os.remove(os.path.join(folder, old))
+            for n in snaps[max(0, len(snaps) - keep):]:
+                referenced.update(_read_snapshot(os.path.join(folder, n))["files"].values())
+    deleted = 0
+    objects_dir = os.path.join(root, "objects")
+    if os.path.isdir(objects_dir):
+        for dirpath, _dirnames, filenames in os.walk(objects_dir):
+            for n in filenames:
+                if n.endswith(".xz") and n[:-3] not in referenced:
+                    os.remove(os.path.join(dirpath, n))
+                    deleted += 1
+    return deleted
+
+
+def restore_snapshot(snapshot_path: str, target_dir: Optional[str] = None) -> str:
+    """Write a snapshot's files back (by default into the folder it was taken from); returns that folder."""
+    snapshot = _read_snapshot(snapshot_path)
+    root = os.path.dirname(os.path.dirname(os.path.dirname(snapshot_path)))
+    target_dir = target_dir or snapshot["source"]
+    os.makedirs(target_dir, exist_ok=True)
+    for name, digest in snapshot["files"].items():
+        target = os.path.join(target_dir, name)
+        tmp = target + ".tmp"
+        with lzma.open(_object_path(root, digest), "rb") as src, open(tmp, "wb") as out:
+            for chunk in iter(lambda: src.read(1024 * 1024), b""):
+                out.write(chunk)
+        os.replace(tmp, target)
+    return target_dir
@@ -0,0 +1,235 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+
+from lxml import etree
+
+try:
+    from .models import SaveData, StorageContainer
+    from .save_loader import (
+        load_storage_containers,
+        update_globals_in_memory,
+        add_item_to_container,
+        delete_item_from_container,
+        update_item_quantity,
+        refresh_character,
+        refresh_models,
+    )
+except ImportError:
+    # Fallback for when running as standalone (PyInstaller)
+    from models import SaveData, StorageContainer
+    from save_loader import (
+        load_storage_containers,
+        update_globals_in_memory,
+        add_item_to_container,
+        delete_item_from_container,
+        update_item_quantity,
+        refresh_character,
+        refresh_models,
+    )
+
+
+@dataclass
+class SkillEdit:
+    entity_id: int
+    skill_id: int
+    level: int
+
+
+@dataclass
+class AttributeEdit:
+    entity_id: int
+    attr_id: int
+    value: int
+
+
+@dataclass
+class TraitEdit:
+    entity_id: int
+    trait_id: int
+    remove: bool = False
+
+
+@dataclass
+class ConditionEdit:
+    """Removes a condition from a character."""
+    entity_id: int
+    condition_id: int
+
+
+@dataclass
+class StorageEdit:
+    """Changes one item stack in a container.
+
+    container is the position in load_storage_containers(save, ship_sid) before the
+    batch runs. mode is "set" (quantity <= 0 deletes), "add" or "delete".
+    """
+    ship_sid: int
+    container: int
+    item_id: int
+    quantity: int = 0
+    mode: str = "set"
+
+
+@dataclass
+class GlobalsEdit:
+    credits: Optional[int] = None
+    sandbox: Optional[bool] = None
+    prestige_points: Optional[int] = None
+
+
+EditOp = Union[SkillEdit, AttributeEdit, TraitEdit, ConditionEdit, StorageEdit, GlobalsEdit]
+
+_CHARACTER_OPS = (SkillEdit, AttributeEdit, TraitEdit, ConditionEdit)
+_STORAGE_MODES = ("set", "add", "delete")
+
+
+class SaveEditBatch:
+    """Applies a list of edit operations as one transaction.
+
+    Operations are grouped by target (character, container, globals) so each
+    target is located once and its sections are indexed once. The batch is a
+    single undo step. If any operation fails, every change made by the batch is
+    rolled back through the save's EditJournal and the models are refreshed;
+    invalid edits (a ValueError or KeyError from the save helpers) are then
+    reported as a ValueError, anything else is re-raised unchanged.
+    """
+
+    def __init__(self, save: SaveData, ops: Optional[List[EditOp]] = None) -> None:
+        self.save = save
+        self.ops: List[EditOp] = list(ops or [])
+
+    def add(self, op: EditOp) -> SaveEditBatch:
+        self.ops.append(op)
+        return self
+
+    def apply(self, label: str = "Batch Edit") -> int:
+        """Apply all operations as one undo step named label; returns how many were applied."""
+        assert self.save.xml_doc is not None
+        mark = self.save.journal.mark()
+        containers: Dict[int, List[StorageContainer]] = {}
+        try:
+            with self.save.journal.transaction(label):
+                for target, ops in self._group(containers).items():
+                    if target[0] == "character":
+                        self._apply_character(target[1], ops)
+                    elif target[0] == "storage":
+                        self._apply_storage(containers[target[1]][target[2]], ops)
+                    else:
+                        for op in ops:
+                            update_globals_in_memory(self.save, op.credits, op.sandbox, op.prestige_points)
+        except (ValueError, KeyError) as ex:
+            refresh_models(self.save, self.save.journal.rollback(mark))
+            raise ValueError(f"Batch edit failed and was rolled back: {ex}") from ex
+        except BaseException:
+            # A bug rather than a bad edit: still leave the save as it was, but keep the original error
+            refresh_models(self.save, self.save.journal.rollback(mark))
+            raise
+        return len(self.ops)
+
+    def _group(self, containers: Dict[int, List[StorageContainer]]) -> Dict[Tuple, List[EditOp]]:
+        """Group operations by target, keeping the original order within each group.
+
+        Storage containers are resolved into containers up front, since edits may
+        change a ship's container list.
+        """
+        groups: Dict[Tuple, List[EditOp]] = {}
+        for op in self.ops:
+            if isinstance(op, _CHARACTER_OPS):
+                key: Tuple = ("character", op.entity_id)
+            elif isinstance(op, StorageEdit):
+                if op.mode not in _STORAGE_MODES:
+                    raise ValueError(f"Unknown storage edit mode '{op.mode}'.")
+                if op.ship_sid not in containers:
+                    containers[op.ship_sid] = list(load_storage_containers(self.save, op.ship_sid))
+                ship_containers = containers[op.ship_sid]
+                if not 0 <= op.container < len(ship_containers):
+                    raise ValueError(f"Container {op.container} not found on ship SID {op.ship_sid}.")
+                key = ("storage", op.ship_sid, op.container)
+            elif isinstance(op, GlobalsEdit):
+                key = ("globals",)
+            else:
+                raise ValueError(f"Unsupported edit operation: {op!r}")
+            groups.setdefault(key, []).append(op)
+        return groups
+
+    def _apply_character(self, entity_id: int, ops: List[EditOp]) -> None:
+        character = self.save.character_index.get(entity_id)
+        char_el = self.save.character_elements.get(entity_id)
+        pers = char_el.find("pers") if char_el is not None else None
+        if character is None or pers is None:
+            raise ValueError(f"Character with entId {entity_id} not found.")
+
+        journal = self.save.journal
+        skills = _Section(journal, pers, "skills", "s", "sk")
+        attrs = _Section(journal, pers, "attr", "a", "id")
+        traits = _Section(journal, pers, "traits", "t", "id")
+        conditions = _Section(journal, pers, "conditions", "c", "id")
+        for op in ops:
+            if isinstance(op, SkillEdit):
+                journal.set(skills.get(op.skill_id, create=True), "level", str(op.level))
+            elif isinstance(op, AttributeEdit):
+                journal.set(attrs.get(op.attr_id, create=True), "points", str(op.value))
+            elif isinstance(op, TraitEdit):
+                if op.remove:
+                    traits.remove(op.trait_id)
+                else:
+                    traits.get(op.trait_id, create=True)
+            else:
+                conditions.remove(op.condition_id)
+        refresh_character(self.save, character)
+
+    def _apply_storage(self, container: StorageContainer, ops: List[EditOp]) -> None:
+        for op in ops:
+            if op.mode == "add":
+                if op.quantity <= 0:
+                    raise ValueError(f"Quantity to add must be positive, got {op.quantity}.")
+                add_item_to_container(self.save, container, op.item_id, op.quantity)
+            elif op.mode == "delete":
+                delete_item_from_container(self.save, container, op.item_id)
+            else:
+                update_item_quantity(self.save, container, op.item_id, op.quantity)
+
+
+class _Section:
+    """Children of one <pers> section indexed by their id attribute, built on first use."""
+
+    def __init__(self, journal, pers, tag: str, child_tag: str, key: str) -> None:
+        self.journal = journal
+        self.pers = pers
+        self.tag = tag
+        self.child_tag = child_tag
+        self.key = key
+        self.element = None
+        self.children: Optional[Dict[str, object]] = None
+
+    def _index(self, create: bool) -> Dict[str, object]:
+        if self.children is None:
+            self.element = self.pers.find(self.tag)
+            if self.element is None and create:
+                self.element = etree.Element(self.tag)
+                self.journal.append(self.pers, self.element)
+            self.children = {}
+            if self.element is not None:
+                for child in self.element.iterchildren(self.child_tag):
+                    self.children.setdefault(child.get(self.key), child)
+        elif self.element is None and create:
+            self.element = etree.Element(self.tag)
+            self.journal.append(self.pers, self.element)
+        return self.children
+
+    def get(self, id_: int, create: bool = False):
+        children = self._index(create)
+        child = children.get(str(id_))
+        if child is None and create:
+            child = etree.Element(self.child_tag)
+            child.set(self.key, str(id_))
+            self.journal.append(self.element, child)
+            children[str(id_)] = child
+        return child
+
+    def remove(self, id_: int) -> None:
+        children = self._index(create=False)
+        child = children.pop(str(id_), None)
+        if child is not None:
+            self.journal.remove(self.element, child)
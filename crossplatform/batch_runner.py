@@ -0,0 +1,203 @@
+from __future__ import annotations
+import argparse
+import hashlib
+import json
+import os
+import shlex
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+try:
+    from .save_loader import load_save, save_to_disk
+    from .batch_edit import SaveEditBatch, EditOp
+    from .catalog import find_saves
+    from .cli import build_parser
+except ImportError:
+    # Fallback for when running as standalone (PyInstaller)
+    from save_loader import load_save, save_to_disk
+    from batch_edit import SaveEditBatch, EditOp
+    from catalog import find_saves
+    from cli import build_parser
+
+
+# Applies the same edits to many saves in parallel. Run with:
+#   python -m crossplatform.batch_runner spec.json path/to/savegames --manifest run.jsonl
+#
+# The spec is a JSON object whose "edits" list holds cli edit commands without the
+# save path, e.g. {"edits": ["set-credits 50000", "add-item --ship 1234 Water 100"]}.
+# Every finished file is appended to the manifest, so re-running the same command
+# after a crash skips files that were already edited. Before any save is edited
+# a "started" record with its size, mtime and inode goes into the manifest: a
+# save that changed since then but has no result was rewritten by the crashed
+# run, so it is reported as "unconfirmed" and not edited a second time.
+
+
+def load_spec(path: str) -> List[str]:
+    with open(path, "r", encoding="utf-8") as f:
+        spec = json.load(f)
+    edits = spec.get("edits") if isinstance(spec, dict) else None
+    if not isinstance(edits, list) or not edits or not all(isinstance(e, str) for e in edits):
+        raise ValueError(f"{path}: expected {{\"edits\": [\"<cli command>\", ...]}}")
+    for edit in edits:
+        parse_edit(edit)
+    return edits
+
+
+def parse_edit(edit: str) -> argparse.Namespace:
+    """Parse one spec entry with the cli parser; only commands that change the save are accepted."""
+    words = shlex.split(edit)
+    if not words:
+        raise ValueError("Empty edit in spec.")
+    try:
+        args = build_parser().parse_args([words[0], "<save>"] + words[1:])
+    except SystemExit:
+        raise ValueError(f"Invalid edit '{edit}'.")
+    if not hasattr(args, "dry_run"):
+        raise ValueError(f"'{words[0]}' does not edit a save.")
+    # Every save is edited in place; a per-edit output file or dry run would be silently ignored
+    if args.output or args.dry_run:
+        raise ValueError(f"Invalid edit '{edit}': -o/--output and --dry-run cannot be used in a batch spec.")
+    return args
+
+
+def spec_digest(edits: List[str]) -> str:
+    return hashlib.sha256("\n".join(edits).encode("utf-8")).hexdigest()[:16]
+
+
+def apply_spec(path: str, edits: List[str]) -> Dict[str, object]:
+    """Load one save, apply every edit as a single batch and write it back; returns a manifest record."""
+    record: Dict[str, object] = {"path": path}
+    try:
+        started = time.perf_counter()
+        save = load_save(path, streaming=True, lazy=True)
+        loaded = time.perf_counter()
+        ops: List[EditOp] = []
+        for edit in edits:
+            args = parse_edit(edit)
+            ops.extend(args.handler(save, args))
+        SaveEditBatch(save, ops).apply()
+        edited = time.perf_counter()
+        # save_to_disk writes a temporary file and swaps it in, so a crash never leaves a half-written save
+        save_to_disk(save)
+        written = time.perf_counter()
+        record.update(status="ok", edits=len(ops), load_s=round(loaded - started, 4),
+                      edit_s=round(edited - loaded, 4), write_s=round(written - edited, 4),
+                      total_s=round(written - started, 4))
+    except Exception as ex:
+        record.update(status="error", error=f"{type(ex).__name__}: {ex}")
+    return record
+
+
+def _file_key(path: str) -> Optional[List[int]]:
+    # os.replace gives the rewritten save a new inode, so this changes even if size and mtime happen to match
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
+def read_manifest(path: str, digest: str) -> Dict[str, Dict[str, object]]:
+    """Latest record of each save path from a previous run of the same spec."""
+    records: Dict[str, Dict[str, object]] = {}
+    if not os.path.exists(path):
+        return records
+    with open(path, "r", encoding="utf-8") as f:
+        lines = [line for line in f if line.strip()]
+    if not lines:
+        return records
+    header = json.loads(lines[0])
+    if header.get("spec") != digest:
+        raise ValueError(f"Manifest {path} belongs to a different spec; remove it or pick another manifest.")
+    for line in lines[1:]:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue  # torn last line after a crash
+        records[record["path"]] = record
+    return records
+
+
+def run_batch(edits: List[str], paths: List[str], manifest: str, workers: Optional[int] = None) -> List[Dict[str, object]]:
+    """Apply the edits to every save not yet done according to the manifest; returns this run's records."""
+    digest = spec_digest(edits)
+    previous = read_manifest(manifest, digest)
+    done = {p for p, r in previous.items() if r.get("status") in ("ok", "unconfirmed")}
+    # Started by an interrupted run and rewritten since, but the result never made it into the manifest
+    unconfirmed = [p for p in paths if p not in done and previous.get(p, {}).get("status") == "started"
+                   and previous[p].get("key") != _file_key(p)]
+    todo = [p for p in paths if p not in done and p not in unconfirmed]
+    records: List[Dict[str, object]] = []
+    new_manifest = not os.path.exists(manifest) or os.path.getsize(manifest) == 0
+    with open(manifest, "a", encoding="utf-8") as out:
+        if new_manifest:
+            out.write(json.dumps({"spec": digest, "edits": edits}) + "\n")
+        if done:
+            print(f"{len(done)} save(s) already done according to {manifest}, skipping them")
+
+        def record(r: Dict[str, object]) -> None:
+            out.write(json.dumps(r) + "\n")
+            out.flush()
+            records.append(r)
+            if r["status"] == "ok":
+                print(f"{r['total_s']:>8.3f}s  (load {r['load_s']:.3f}, edit {r['edit_s']:.3f}, "
+                      f"write {r['write_s']:.3f})  {r['path']}")
+            else:
+                print(f"{'failed' if r['status'] == 'error' else r['status']:>9}  {r['path']}: {r['error']}")
+
+        for p in unconfirmed:
+            record({"path": p, "status": "unconfirmed",
+                    "error": "rewritten by an interrupted run whose result was not recorded; not edited again. "
+                             "Check the save, and remove its lines from the manifest to edit it anyway."})
+        # The markers must be on disk before any worker can replace a save
+        for p in todo:
+            out.write(json.dumps({"path": p, "status": "started", "key": _file_key(p)}) + "\n")
+        out.flush()
+        os.fsync(out.fileno())
+
+        if workers == 1 or len(todo) <= 1:
+            for p in todo:
+                record(apply_spec(p, edits))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(apply_spec, p, edits) for p in todo]
+                for future in as_completed(futures):
+                    record(future.result())
+    return records
+
+
+def expand_paths(inputs: List[str]) -> List[str]:
+    """Save files given directly, plus every save file below the given directories."""
+    paths: List[str] = []
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.extend(p for p, _mtime, _size in find_saves(item))
+        else:
+            paths.append(os.path.abspath(item))
+    return list(dict.fromkeys(paths))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Apply the same edits to many Space Haven saves in parallel")
+    parser.add_argument("spec", help='JSON file: {"edits": ["set-credits 50000", ...]}')
+    parser.add_argument("saves", nargs="+", help="save files or directories to search for saves")
+    parser.add_argument("--manifest", default="batch_manifest.jsonl", help="progress file used to resume a run")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+    try:
+        edits = load_spec(args.spec)
+        paths = expand_paths(args.saves)
+        started = time.perf_counter()
+        records = run_batch(edits, paths, args.manifest, args.workers)
+    except (OSError, ValueError) as ex:
+        print(f"error: {ex}", file=sys.stderr)
+        return 1
+    failed = sum(1 for r in records if r["status"] != "ok")
+    print(f"{len(records) - failed} edited, {failed} failed in {time.perf_counter() - started:.2f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,175 @@
+from __future__ import annotations
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List, Tuple
+
+try:
+    from .save_loader import load_save
+    from .id_collections import DefaultAttributeIDs, DefaultSkillIDs, DefaultTraitIDs, DefaultStorageIDs, ConditionsIDs
+except ImportError:
+    # Fallback for when running as standalone
+    from save_loader import load_save
+    from id_collections import DefaultAttributeIDs, DefaultSkillIDs, DefaultTraitIDs, DefaultStorageIDs, ConditionsIDs
+
+
+# Developer benchmarks for the save loader. Run with:
+#   python -m crossplatform.benchmarks scaling
+#   python -m crossplatform.benchmarks memory
+
+# Peak Python heap per character allowed while loading (measured: about 5.0 KB
+# eager, 0.5 KB lazy), and how large the lazy peak may be next to the eager one
+# of the same save (measured: about 0.1). `memory` exits with status 1 when a
+# load breaks either; selftest runs the same check in CI.
+MEMORY_BUDGET_PER_CHARACTER = {"eager": 8192, "lazy": 1024}
+MAX_LAZY_TO_EAGER_PEAK = 0.25
+
+
+def write_synthetic_save(path: str, characters: int, crew_per_ship: int = 20, containers_per_ship: int = 4,
+                         items_per_container: int = 10, seed: int = 0) -> None:
+    """Write a synthetic save with the given crew size, shaped like a real <game> document.
+
+    Crew are split over ships of crew_per_ship members, and every crew member
+    has a relationship with each of their shipmates, so the relationship count
+    grows linearly with the number of characters.
+    """
+    rnd = random.Random(seed)
+    item_ids = sorted(DefaultStorageIDs)
+    condition_ids = sorted(ConditionsIDs)
+    trait_ids = sorted(DefaultTraitIDs)
+    out: List[str] = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<game idCounter="{10000 + characters}">',
+        '<playerBank ca="25000"/>',
+        '<settings><diff sandbox="false"/></settings>',
+        '<questLines><questLines><l type="ExodusFleet" playerPrestigePoints="3"/></questLines></questLines>',
+        '<ships>',
+    ]
+    next_ent = 1000
+    remaining = characters
+    sid = 1
+    while remaining > 0 or sid == 1:
+        crew = list(range(next_ent, next_ent + min(crew_per_ship, remaining)))
+        next_ent += len(crew)
+        remaining -= len(crew)
+        out.append(f'<ship sid="{sid}" sname="Ship {sid}" sx="112" sy="112"><settings owner="Player"/><characters>')
+        for ent in crew:
+            out.append(f'<c name="Crew {ent}" entId="{ent}"><state bedLink="0"/><pers>')
+            out.append("<attr>" + "".join(f'<a id="{a}" points="{rnd.randint(1, 5)}"/>' for a in DefaultAttributeIDs) + "</attr>")
+            out.append("<skills>" + "".join(f'<s sk="{k}" level="{rnd.randint(0, 8)}" mxn="8"/>' for k in DefaultSkillIDs) + "</skills>")
+            out.append("<traits>" + "".join(f'<t id="{t}"/>' for t in rnd.sample(trait_ids, 2)) + "</traits>")
+            out.append("<conditions>" + "".join(f'<c id="{c}"/>' for c in rnd.sample(condition_ids, 2)) + "</conditions>")
+            out.append("<sociality><relationships>")
+            out.append("".join(
+                f'<l targetId="{t}" friendship="{rnd.randint(-20, 100)}" attraction="{rnd.randint(0, 20)}" compatibility="{rnd.randint(0, 10)}"/>'
+                for t in crew if t != ent
+            ))
+            out.append("</relationships></sociality></pers></c>")
+        out.append("</characters>")
+        for k in range(containers_per_ship):
+            out.append(f'<e entId="{sid * 1000 + k}" objId="{k}"><feat eatAllowed="false"><inv>')
+            out.append("".join(
+                f'<s elementaryId="{i}" inStorage="{rnd.randint(1, 100)}" onTheWayIn="0" onTheWayOut="0"/>'
+                for i in rnd.sample(item_ids, min(items_per_container, len(item_ids)))
+            ))
+            out.append("</inv></feat></e>")
+        out.append("</ship>")
+        sid += 1
+    out.append("</ships></game>")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("".join(out))
+
+
+def _best_of(path: str, repeat: int, streaming: bool, lazy: bool = False) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        load_save(path, streaming=streaming, lazy=lazy)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_scaling(sizes: List[int], repeat: int) -> None:
+    """Print load time per crew size; per-character cost should stay flat if loading is linear."""
+    print(f"{'chars':>6} {'MB':>7} {'tree s':>8} {'stream s':>9} {'lazy s':>8} {'us/char':>8}")
+    per_char: List[float] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            path = os.path.join(tmp, f"game_{n}")
+            write_synthetic_save(path, n)
+            mb = os.path.getsize(path) / (1024 * 1024)
+            tree_s = _best_of(path, repeat, streaming=False)
+            stream_s = _best_of(path, repeat, streaming=True)
+            lazy_s = _best_of(path, repeat, streaming=True, lazy=True)
+            per_char.append(tree_s / n * 1e6)
+            print(f"{n:>6} {mb:>7.2f} {tree_s:>8.4f} {stream_s:>9.4f} {lazy_s:>8.4f} {per_char[-1]:>8.1f}")
+    if len(per_char) > 1:
+        print(f"per-character cost, largest vs smallest-but-one size: {per_char[-1] / per_char[1]:.2f}x (1.0 = linear)")
+
+
+def measure_memory(characters: int) -> Dict[str, Tuple[int, int]]:
+    """(retained, peak) Python heap bytes of an eager and a lazy load of one synthetic save, by "eager"/"lazy".
+
+    libxml2 memory is not traced, so this is what the models cost on top of the tree.
+    """
+    results: Dict[str, Tuple[int, int]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "game")
+        write_synthetic_save(path, characters)
+        for label, lazy in (("eager", False), ("lazy", True)):
+            tracemalloc.start()
+            save = load_save(path, lazy=lazy)
+            results[label] = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del save
+    return results
+
+
+def memory_problems(results: Dict[str, Tuple[int, int]], characters: int) -> List[str]:
+    """What measure_memory's results break: the per-character budgets or the lazy-to-eager ratio."""
+    problems = []
+    for label, (_current, peak) in results.items():
+        budget = MEMORY_BUDGET_PER_CHARACTER[label]
+        if peak / characters > budget:
+            problems.append(f"{label} load peaks at {peak / characters:.0f} bytes/char, over the {budget} budget")
+    ratio = results["lazy"][1] / results["eager"][1]
+    if ratio > MAX_LAZY_TO_EAGER_PEAK:
+        problems.append(f"lazy load peaks at {ratio:.2f}x the eager one, over {MAX_LAZY_TO_EAGER_PEAK}")
+    return problems
+
+
+def bench_memory(characters: int) -> bool:
+    """Print Python heap bytes per character held by the loaded models; returns False if memory_problems finds any."""
+    results = measure_memory(characters)
+    for label, (current, peak) in results.items():
+        print(f"{label:>6}: {current / characters:>9.0f} bytes/char retained, {peak / characters:>9.0f} bytes/char peak"
+              f" (budget {MEMORY_BUDGET_PER_CHARACTER[label]})")
+    print(f"lazy/eager peak: {results['lazy'][1] / results['eager'][1]:.2f} (limit {MAX_LAZY_TO_EAGER_PEAK})")
+    problems = memory_problems(results, characters)
+    for problem in problems:
+        print(f"OVER BUDGET: {problem}")
+    return not problems
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Space Haven save editor benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_scaling = sub.add_parser("scaling", help="load time vs. number of characters")
+    p_scaling.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 100, 250, 500, 1000, 2000])
+    p_scaling.add_argument("--repeat", type=int, default=3)
+    p_memory = sub.add_parser("memory", help="model memory per character (tracemalloc)")
+    p_memory.add_argument("--characters", type=int, default=1000)
+    args = parser.parse_args(argv)
+    if args.command == "scaling":
+        bench_scaling(args.sizes, args.repeat)
+    elif args.command == "memory":
+        return 0 if bench_memory(args.characters) else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
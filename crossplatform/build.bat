@@ -12,6 +12,17 @@ pyinstaller --name=SpaceHavenEditor ^
     --hidden-import=lxml ^
     --hidden-import=lxml.etree ^
     --hidden-import=lxml._elementpath ^
+    --hidden-import=models ^
+    --hidden-import=save_loader ^
+    --hidden-import=save_cache ^
+    --hidden-import=backups ^
+    --hidden-import=save_diff ^
+    --hidden-import=journal ^
+    --hidden-import=element_views ^
+    --hidden-import=splice_writer ^
+    --hidden-import=table_models ^
+    --hidden-import=crew_index ^
+    --hidden-import=sidecars ^
     --collect-all PySide6 ^
     --noconfirm ^
     main.py
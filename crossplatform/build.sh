@@ -22,6 +22,17 @@ build_venv/bin/python -m PyInstaller --name="SpaceHavenEditor" \
     --hidden-import=PySide6.QtCore \
     --hidden-import=PySide6.QtGui \
     --hidden-import=PySide6.QtWidgets \
+    --hidden-import=models \
+    --hidden-import=save_loader \
+    --hidden-import=save_cache \
+    --hidden-import=backups \
+    --hidden-import=save_diff \
+    --hidden-import=journal \
+    --hidden-import=element_views \
+    --hidden-import=splice_writer \
+    --hidden-import=table_models \
+    --hidden-import=crew_index \
+    --hidden-import=sidecars \
     --noconfirm \
     main.py
 
@@ -0,0 +1,148 @@
+from __future__ import annotations
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, astuple, fields
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    from .save_loader import load_save, load_storage_containers
+except ImportError:
+    # Fallback for when running as standalone (PyInstaller)
+    from save_loader import load_save, load_storage_containers
+
+
+SAVE_FILE_NAME = "game"
+DEFAULT_DB_NAME = "save_catalog.sqlite"
+
+
+@dataclass
+class SaveSummary:
+    path: str
+    mtime_ns: int
+    size: int
+    credits: int = 0
+    sandbox: bool = False
+    prestige_points: int = 0
+    ships: int = 0
+    crew: int = 0
+    storage_items: int = 0
+    # Set instead of the fields above when the file could not be loaded
+    error: Optional[str] = None
+
+
+_COLUMNS = [f.name for f in fields(SaveSummary)]
+
+
+def summarize_save(path: str, mtime_ns: int, size: int) -> SaveSummary:
+    """Load a save and extract its catalog summary; load errors are recorded, not raised."""
+    summary = SaveSummary(path, mtime_ns, size)
+    try:
+        save = load_save(path, streaming=True, lazy=True)
+        summary.credits = save.credits
+        summary.sandbox = save.sandbox
+        summary.prestige_points = save.prestige_points
+        summary.ships = len(save.ships)
+        summary.crew = len(save.characters)
+        summary.storage_items = sum(
+            item.quantity
+            for ship in save.ships
+            for container in load_storage_containers(save, ship.sid)
+            for item in container.items
+        )
+    except Exception as ex:
+        summary.error = f"{type(ex).__name__}: {ex}"
+    return summary
+
+
+def _summarize(args: Tuple[str, int, int]) -> SaveSummary:
+    return summarize_save(*args)
+
+
+def find_saves(directory: str, file_name: str = SAVE_FILE_NAME) -> Iterator[Tuple[str, int, int]]:
+    """Yield (path, mtime_ns, size) for every save file below directory."""
+    for dirpath, _dirnames, filenames in os.walk(directory):
+        if file_name in filenames:
+            path = os.path.abspath(os.path.join(dirpath, file_name))
+            st = os.stat(path)
+            yield path, st.st_mtime_ns, st.st_size
+
+
+class SaveCatalog:
+    """SQLite index of save summaries keyed by (path, mtime, size).
+
+    scan() only parses files that are new or whose mtime or size changed since
+    the last scan, spreading them over a process pool; files that disappeared
+    are dropped from the index.
+    """
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS saves ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, "
+            "credits INTEGER, sandbox INTEGER, prestige_points INTEGER, ships INTEGER, "
+            "crew INTEGER, storage_items INTEGER, error TEXT)"
+        )
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> SaveCatalog:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def scan(self, directory: str, workers: Optional[int] = None, file_name: str = SAVE_FILE_NAME) -> Dict[str, int]:
+        """Bring the index up to date with directory; returns counts of parsed, unchanged and removed files."""
+        started = time.perf_counter()
+        root = os.path.abspath(directory)
+        where, params = _under(root)
+        known = {row[0]: (row[1], row[2]) for row in self.conn.execute(
+            f"SELECT path, mtime_ns, size FROM saves WHERE {where}", params)}
+        found = list(find_saves(root, file_name))
+        changed = [entry for entry in found if known.get(entry[0]) != (entry[1], entry[2])]
+
+        if len(changed) > 1 and workers != 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                summaries = list(pool.map(_summarize, changed, chunksize=max(1, len(changed) // 64)))
+        else:
+            summaries = [_summarize(entry) for entry in changed]
+
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        self.conn.executemany(
+            f"INSERT OR REPLACE INTO saves ({', '.join(_COLUMNS)}) VALUES ({placeholders})",
+            [astuple(s) for s in summaries],
+        )
+        removed = set(known) - {entry[0] for entry in found}
+        self.conn.executemany("DELETE FROM saves WHERE path = ?", [(p,) for p in removed])
+        self.conn.commit()
+        return {
+            "parsed": len(changed),
+            "unchanged": len(found) - len(changed),
+            "removed": len(removed),
+            "ms": int((time.perf_counter() - started) * 1000),
+        }
+
+    def entries(self, directory: Optional[str] = None) -> List[SaveSummary]:
+        """All indexed summaries, optionally limited to one directory tree, ordered by path."""
+        query = f"SELECT {', '.join(_COLUMNS)} FROM saves"
+        params: Tuple = ()
+        if directory is not None:
+            where, params = _under(os.path.abspath(directory))
+            query += f" WHERE {where}"
+        rows = self.conn.execute(query + " ORDER BY path", params).fetchall()
+        summaries = [SaveSummary(*row) for row in rows]
+        for s in summaries:
+            s.sandbox = bool(s.sandbox)
+        return summaries
+
+
+def _under(root: str) -> Tuple[str, Tuple]:
+    """SQL condition matching paths inside root (no LIKE, since paths may contain % or _)."""
+    prefix = os.path.join(root, "")
+    return "path = ? OR substr(path, 1, ?) = ?", (root, len(prefix), prefix)
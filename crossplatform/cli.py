@@ -0,0 +1,274 @@
+from __future__ import annotations
+import argparse
+import os
+import sys
+from typing import Dict, List, Optional
+
+# Headless editor on top of save_loader. Nothing here may import PySide6, so
+# scripted edits start quickly and work on machines without a display. Run with:
+#   python -m crossplatform.cli info path/to/game
+#   python -m crossplatform.cli set-credits path/to/game 50000
+#   python -m crossplatform.cli diff backup/game path/to/game
+
+try:
+    from .models import Character, SaveData
+    from .save_loader import load_save, save_to_disk, load_storage_containers, get_ship_owner
+    from .batch_edit import SaveEditBatch, SkillEdit, AttributeEdit, TraitEdit, StorageEdit, GlobalsEdit, EditOp
+    from .id_collections import DefaultAttributeIDs, DefaultSkillIDs, DefaultTraitIDs, DefaultStorageIDs
+except ImportError:
+    # Fallback for when running as standalone (PyInstaller)
+    from models import Character, SaveData
+    from save_loader import load_save, save_to_disk, load_storage_containers, get_ship_owner
+    from batch_edit import SaveEditBatch, SkillEdit, AttributeEdit, TraitEdit, StorageEdit, GlobalsEdit, EditOp
+    from id_collections import DefaultAttributeIDs, DefaultSkillIDs, DefaultTraitIDs, DefaultStorageIDs
+
+
+# Values the GUI's "Set All" buttons use
+MAX_SKILL_LEVEL = 8
+MAX_ATTRIBUTE_POINTS = 5
+
+
+def resolve_id(names: Dict[int, str], value: str, kind: str) -> int:
+    """Turn a numeric id or a (case-insensitive) name from an id_collections table into an id."""
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    wanted = value.strip().lower()
+    matches = [id_ for id_, name in names.items() if name.lower() == wanted]
+    if len(matches) != 1:
+        raise ValueError(f"Unknown {kind} '{value}'.")
+    return matches[0]
+
+
+def select_crew(save: SaveData, crew: Optional[str], ship_sid: Optional[int]) -> List[Character]:
+    """Crew matching --crew (entId or name) and --ship; everyone if neither is given."""
+    selected = [c for c in save.characters if ship_sid is None or c.ship_sid == ship_sid]
+    if crew is not None:
+        try:
+            ent_id = int(crew)
+            selected = [c for c in selected if c.entity_id == ent_id]
+        except ValueError:
+            selected = [c for c in selected if c.name.lower() == crew.strip().lower()]
+    if not selected:
+        raise ValueError("No crew member matches the selection.")
+    return selected
+
+
+def _cmd_info(save: SaveData, args: argparse.Namespace) -> List[EditOp]:
+    print(f"File:      {save.path}")
+    print(f"Credits:   {save.credits}")
+    print(f"Sandbox:   {'on' if save.sandbox else 'off'}")
+    print(f"Prestige:  {save.prestige_points}")
+    print(f"Crew:      {len(save.characters)}")
+    crew_per_ship: Dict[int, int] = {}
+    for c in save.characters:
+        crew_per_ship[c.ship_sid] = crew_per_ship.get(c.ship_sid, 0) + 1
+    print(f"{'sid':>6}  {'owner':<10} {'size':>7} {'crew':>5}  name")
+    for ship in save.ships:
+        size = f"{ship.sx // 28}x{ship.sy // 28}"
+        owner = get_ship_owner(save, ship.sid) or "-"
+        print(f"{ship.sid:>6}  {owner:<10} {size:>7} {crew_per_ship.get(ship.sid, 0):>5}  {ship.sname}")
+    return []
+
+
+def _cmd_crew(save: SaveData, args: argparse.Namespace) -> List[EditOp]:
+    for c in select_crew(save, None, args.ship):
+        line = f"{c.entity_id:>8}  {c.ship_sid:>6}  {c.name}"
+        if args.verbose:
+            skills = ", ".join(f"{s.name} {s.value}" for s in c.skills)
+            traits = ", ".join(t.name for t in c.traits)
+            line += f"\n          skills: {skills}\n          traits: {traits}"
+        print(line)
+    return []
+
+
+def _cmd_storage(save: SaveData, args: argparse.Namespace) -> List[EditOp]:
+    for i, container in enumerate(load_storage_containers(save, args.ship)):
+        total = sum(item.quantity for item in container.items)
+        print(f"[{i}] {container.display_name}: {len(container.items)} stacks, {total} items")
+        if args.verbose:
+            for item in container.items:
+                print(f"      {item.element_id:>6}  {item.quantity:>6}  {DefaultStorageIDs.get(item.element_id, '')}")
+    return []
+
+
+def _cmd_set_credits(save: SaveData, args: argparse.Namespace) -> List[EditOp]:
+    return [GlobalsEdit(credits=args.amount)]
+
+
+def _cmd_set_prestige(save: SaveData, args: argparse.Namespace) -> List[EditOp]:
+    return [GlobalsEdit(prestige_points=args.points)]
+
+
+def _cmd_set_sandbox(save: SaveData, args: argparse.Namespace) -> List[EditOp]:
+    return [GlobalsEdit(sandbox=args.state == "on")]
+
+
+def _cmd_set_skill(save: SaveData, args: argparse.Namespace) -> List[EditOp]:
+    skill_id = resolve_id(DefaultSkillIDs, args.skill, "skill")
+    return [SkillEdit(c.entity_id, skill_id, args.level) for c in select_crew(save, args.crew, args.ship)]
+
+
+def _cmd_set_attribute(save: SaveData, args: argparse.Namespace) -> List[EditOp]:
+    attr_id = resolve_id(DefaultAttributeIDs, args.attribute, "attribute")
+    return [AttributeEdit(c.entity_id, attr_id, args.points) for c in select_crew(save, args.crew, args.ship)]
+
+
+def _cmd_add_trait(save: SaveData, args: argparse.Namespace) -> List[EditOp]:
+    trait_id = resolve_id(DefaultTraitIDs, args.trait, "trait")
+    return [TraitEdit(c.entity_id, trait_id, remove=args.remove) for c in select_crew(save, args.crew, args.ship)]
+
+
+def _cmd_max_crew(save: SaveData, args: argparse.Namespace) -> List[EditOp]:
+    ops: List[EditOp] = []
+    for c in select_crew(save, args.crew, args.ship):
+        ops.extend(SkillEdit(c.entity_id, skill_id, MAX_SKILL_LEVEL) for skill_id in DefaultSkillIDs)
+        ops.extend(AttributeEdit(c.entity_id, attr_id, MAX_ATTRIBUTE_POINTS) for attr_id in DefaultAttributeIDs)
+    return ops
+
+
+def _cmd_add_item(save: SaveData, args: argparse.Namespace) -> List[EditOp]:
+    item_id = resolve_id(DefaultStorageIDs, args.item, "item")
+    return [StorageEdit(args.ship, args.container, item_id, args.quantity, mode="add")]
+
+
+def _cmd_set_item(save: SaveData, args: argparse.Namespace) -> List[EditOp]:
+    item_id = resolve_id(DefaultStorageIDs, args.item, "item")
+    return [StorageEdit(args.ship, args.container, item_id, args.quantity, mode="set")]
+
+
+def _cmd_catalog(args: argparse.Namespace) -> int:
+    # catalog and save_diff bring in multiprocessing and sqlite3, so only the commands that use them import them
+    try:
+        from .catalog import SaveCatalog, DEFAULT_DB_NAME
+    except ImportError:
+        # Fallback for when running as standalone (PyInstaller)
+        from catalog import SaveCatalog, DEFAULT_DB_NAME
+    db_path = args.db or os.path.join(args.directory, DEFAULT_DB_NAME)
+    with SaveCatalog(db_path) as catalog:
+        stats = catalog.scan(args.directory, workers=args.workers)
+        print(f"{stats['parsed']} parsed, {stats['unchanged']} unchanged, {stats['removed']} removed "
+              f"in {stats['ms']} ms (index: {db_path})")
+        if args.quiet:
+            return 0
+        print(f"{'credits':>10} {'sandbox':>7} {'prestige':>8} {'ships':>5} {'crew':>5} {'storage':>8}  path")
+        for s in catalog.entries(args.directory):
+            if s.error:
+                print(f"{'':>10} {'':>7} {'':>8} {'':>5} {'':>5} {'':>8}  {s.path}  [{s.error}]")
+                continue
+            print(f"{s.credits:>10} {'on' if s.sandbox else 'off':>7} {s.prestige_points:>8} {s.ships:>5} "
+                  f"{s.crew:>5} {s.storage_items:>8}  {s.path}")
+    return 0
+
+
+def _cmd_diff(args: argparse.Namespace) -> int:
+    try:
+        from .save_diff import diff_saves
+    except ImportError:
+        # Fallback for when running as standalone (PyInstaller)
+        from save_diff import diff_saves
+    try:
+        diff = diff_saves(args.old, args.new)
+    except (OSError, ValueError, SyntaxError) as ex:  # lxml parse errors are SyntaxErrors
+        print(f"error: {ex}", file=sys.stderr)
+        return 1
+    print(diff.report(limit=args.limit))
+    return 1 if diff.changes else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m crossplatform.cli", description="Space Haven save editor (headless)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def command(name: str, handler, help: str, edits: bool = True) -> argparse.ArgumentParser:
+        p = sub.add_parser(name, help=help)
+        p.add_argument("path", help='save file (named "game" in the save folder)')
+        if edits:
+            p.add_argument("-o", "--output", help="write the edited save here instead of overwriting path")
+            p.add_argument("--dry-run", action="store_true", help="apply the edits in memory but do not write")
+        p.set_defaults(handler=handler)
+        return p
+
+    def crew_selection(p: argparse.ArgumentParser) -> None:
+        p.add_argument("--crew", help="entId or name of one crew member (default: all selected crew)")
+        p.add_argument("--ship", type=int, help="only crew on the ship with this sid")
+
+    command("info", _cmd_info, "show globals and ships", edits=False)
+    p = command("crew", _cmd_crew, "list crew members", edits=False)
+    p.add_argument("--ship", type=int, help="only crew on the ship with this sid")
+    p.add_argument("-v", "--verbose", action="store_true", help="include skills and traits")
+    p = command("storage", _cmd_storage, "list a ship's storage containers", edits=False)
+    p.add_argument("--ship", type=int, required=True)
+    p.add_argument("-v", "--verbose", action="store_true", help="include every item stack")
+
+    p = command("set-credits", _cmd_set_credits, "set player credits")
+    p.add_argument("amount", type=int)
+    p = command("set-prestige", _cmd_set_prestige, "set Exodus Fleet prestige points")
+    p.add_argument("points", type=int)
+    p = command("set-sandbox", _cmd_set_sandbox, "turn sandbox mode on or off")
+    p.add_argument("state", choices=("on", "off"))
+
+    p = command("set-skill", _cmd_set_skill, "set a skill level for crew")
+    crew_selection(p)
+    p.add_argument("skill", help="skill id or name, e.g. Piloting")
+    p.add_argument("level", type=int)
+    p = command("set-attribute", _cmd_set_attribute, "set attribute points for crew")
+    crew_selection(p)
+    p.add_argument("attribute", help="attribute id or name, e.g. Bravery")
+    p.add_argument("points", type=int)
+    p = command("add-trait", _cmd_add_trait, "add (or with --remove, remove) a trait for crew")
+    crew_selection(p)
+    p.add_argument("trait", help="trait id or name")
+    p.add_argument("--remove", action="store_true")
+    p = command("max-crew", _cmd_max_crew,
+                f"set every skill to {MAX_SKILL_LEVEL} and every attribute to {MAX_ATTRIBUTE_POINTS}")
+    crew_selection(p)
+
+    p = sub.add_parser("catalog", help="index every save below a directory and list their summaries")
+    p.add_argument("directory")
+    p.add_argument("--db", help="SQLite index file (default: <directory>/save_catalog.sqlite)")
+    p.add_argument("--workers", type=int, help="parser processes (default: one per CPU)")
+    p.add_argument("-q", "--quiet", action="store_true", help="only update the index")
+    p.set_defaults(run=_cmd_catalog)
+
+    p = sub.add_parser("diff", help="list what differs between two saves, matching ships, crew and items by id")
+    p.add_argument("old")
+    p.add_argument("new")
+    p.add_argument("--limit", type=int, help="show at most this many differences")
+    p.set_defaults(run=_cmd_diff)
+
+    for name, handler, help in (("add-item", _cmd_add_item, "add items to a storage container"),
+                                ("set-item", _cmd_set_item, "set an item's quantity in a container (0 deletes)")):
+        p = command(name, handler, help)
+        p.add_argument("--ship", type=int, required=True, help="ship sid")
+        p.add_argument("--container", type=int, default=0, help="container index as listed by the storage command")
+        p.add_argument("item", help="item id or name")
+        p.add_argument("quantity", type=int)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if hasattr(args, "run"):
+        return args.run(args)
+    try:
+        save = load_save(args.path, streaming=True, lazy=True)
+        ops = args.handler(save, args)
+        if not ops:
+            return 0
+        SaveEditBatch(save, ops).apply()
+        if args.dry_run:
+            print(f"{len(ops)} edit(s) applied in memory; nothing written (--dry-run).")
+            return 0
+        save.path = args.output or args.path
+        save_to_disk(save)
+    except (OSError, ValueError, SyntaxError) as ex:  # lxml parse errors are SyntaxErrors
+        print(f"error: {ex}", file=sys.stderr)
+        return 1
+    print(f"{len(ops)} edit(s) written to {save.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
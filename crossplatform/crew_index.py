@@ -0,0 +1,103 @@
+from __future__ import annotations
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set
+
+if TYPE_CHECKING:
+    from .models import Character
+
+
+# Search index for the crew filter box. Every character is indexed under the
+# words of its name, trait names and condition names (case-insensitive):
+#
+#   - terms of one or two letters match words starting with them, through a
+#     table of one- and two-letter word prefixes
+#   - longer terms match anywhere inside a word: the entity ids sharing all of
+#     the term's trigrams are the candidates, checked against the indexed words
+#
+# A query matches characters that match every one of its terms, so typing
+# narrows the result without scanning the roster.
+
+PREFIX_LENGTH = 2
+GRAM_LENGTH = 3
+
+
+def _words(character: Character) -> List[str]:
+    texts = [character.name] + [t.name for t in character.traits] + [c.name for c in character.conditions]
+    return sorted({word for text in texts for word in text.casefold().split()})
+
+
+def _grams(word: str) -> Set[str]:
+    return {word[i:i + GRAM_LENGTH] for i in range(len(word) - GRAM_LENGTH + 1)}
+
+
+class CrewIndex:
+    """Prefix and trigram index over crew names, traits and conditions, keyed by entity id."""
+
+    def __init__(self, characters: Iterable[Character] = ()) -> None:
+        self._words: Dict[int, List[str]] = {}
+        self._prefixes: Dict[str, Set[int]] = defaultdict(set)
+        self._grams: Dict[str, Set[int]] = defaultdict(set)
+        for character in characters:
+            self.add(character)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __contains__(self, entity_id: int) -> bool:
+        return entity_id in self._words
+
+    def add(self, character: Character) -> None:
+        """Index a character, or re-index it after its name, traits or conditions changed."""
+        entity_id = character.entity_id
+        self.remove(entity_id)
+        words = _words(character)
+        self._words[entity_id] = words
+        for word in words:
+            for n in range(1, min(PREFIX_LENGTH, len(word)) + 1):
+                self._prefixes[word[:n]].add(entity_id)
+            for gram in _grams(word):
+                self._grams[gram].add(entity_id)
+
+    def remove(self, entity_id: int) -> None:
+        words = self._words.pop(entity_id, None)
+        if words is None:
+            return
+        for word in words:
+            for n in range(1, min(PREFIX_LENGTH, len(word)) + 1):
+                self._discard(self._prefixes, word[:n], entity_id)
+            for gram in _grams(word):
+                self._discard(self._grams, gram, entity_id)
+
+    @staticmethod
+    def _discard(table: Dict[str, Set[int]], key: str, entity_id: int) -> None:
+        ids = table.get(key)
+        if ids is not None:
+            ids.discard(entity_id)
+            if not ids:
+                del table[key]
+
+    def search(self, query: str) -> Optional[Set[int]]:
+        """Entity ids matching every term of query, or None for a blank query (everyone matches)."""
+        terms = sorted(set(query.casefold().split()), key=len, reverse=True)
+        if not terms:
+            return None
+        result: Optional[Set[int]] = None
+        # Longest terms first: they are the most selective, and later terms only narrow
+        for term in terms:
+            matches = self._match(term, result)
+            result = matches if result is None else result & matches
+            if not result:
+                return set()
+        return result
+
+    def _match(self, term: str, within: Optional[Set[int]]) -> Set[int]:
+        if len(term) <= PREFIX_LENGTH:
+            return set(self._prefixes.get(term, ()))
+        sets = sorted((self._grams.get(g, set()) for g in _grams(term)), key=len)
+        candidates = set(sets[0]) if within is None else sets[0] & within
+        for ids in sets[1:]:
+            if not candidates:
+                break
+            candidates &= ids
+        # Sharing every trigram does not guarantee the term occurs in one word
+        return {eid for eid in candidates if any(term in word for word in self._words[eid])}
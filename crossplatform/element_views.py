@@ -0,0 +1,252 @@
+from __future__ import annotations
+import sys
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    from .models import Ship, Character, DataProp, RelationshipInfo, StorageContainer, StorageItem
+    from .id_collections import DefaultSkillIDs, DefaultTraitIDs, DefaultAttributeIDs, ConditionsIDs
+except ImportError:
+    # Fallback for when running as standalone (PyInstaller)
+    from models import Ship, Character, DataProp, RelationshipInfo, StorageContainer, StorageItem
+    from id_collections import DefaultSkillIDs, DefaultTraitIDs, DefaultAttributeIDs, ConditionsIDs
+
+
+# Readers for the sections of a crew <pers> element and a storage <inv> element.
+# Shared by the eager loader and the lazy views below.
+
+
+def display_name(names: Dict[int, str], id_: int, prefix: str) -> str:
+    """Name for an id from an id_collections table; fallback names are interned so equal ids share one string."""
+    name = names.get(id_)
+    if name is None:
+        name = sys.intern(f"{prefix} {id_}")
+    return name
+
+
+def read_skills(pers) -> List[DataProp]:
+    skills: List[DataProp] = []
+    skills_el = pers.find("skills") if pers is not None else None
+    if skills_el is not None:
+        for s in skills_el.findall("s"):
+            try:
+                sk = int(s.get("sk", "0"))
+                lvl = int(s.get("level", "0"))
+            except ValueError:
+                continue
+            skills.append(DataProp(id=sk, name=display_name(DefaultSkillIDs, sk, "Skill"), value=lvl))
+    return skills
+
+
+def read_traits(pers) -> List[DataProp]:
+    traits: List[DataProp] = []
+    traits_el = pers.find("traits") if pers is not None else None
+    if traits_el is not None:
+        for t in traits_el.findall("t"):
+            try:
+                tid = int(t.get("id", "0"))
+            except ValueError:
+                continue
+            traits.append(DataProp(id=tid, name=display_name(DefaultTraitIDs, tid, "Trait")))
+    return traits
+
+
+def read_attributes(pers) -> List[DataProp]:
+    attributes: List[DataProp] = []
+    attrs_el = pers.find("attr") if pers is not None else None
+    if attrs_el is not None:
+        for a in attrs_el.findall("a"):
+            try:
+                aid = int(a.get("id", "0"))
+                pts = int(a.get("points", "0"))
+            except ValueError:
+                continue
+            attributes.append(DataProp(id=aid, name=display_name(DefaultAttributeIDs, aid, "Attr"), value=pts))
+    return attributes
+
+
+def read_conditions(pers) -> List[DataProp]:
+    conditions: List[DataProp] = []
+    conds_el = pers.find("conditions") if pers is not None else None
+    if conds_el is not None:
+        for ce in conds_el.findall("c"):
+            try:
+                cid = int(ce.get("id", "0"))
+            except ValueError:
+                continue
+            if cid in ConditionsIDs:
+                conditions.append(DataProp(id=cid, name=ConditionsIDs[cid]))
+    return conditions
+
+
+def read_relationships(pers, index: Optional[Dict[int, Character]] = None) -> List[RelationshipInfo]:
+    """Read relationships; target names are resolved from index when one is given."""
+    relationships: List[RelationshipInfo] = []
+    sociality = pers.find("sociality") if pers is not None else None
+    rels = sociality.find("relationships") if sociality is not None else None
+    if rels is not None:
+        for le in rels.findall("l"):
+            try:
+                target_id = int(le.get("targetId", "0"))
+                friendship = int(le.get("friendship", "0"))
+                attraction = int(le.get("attraction", "0"))
+                compatibility = int(le.get("compatibility", "0"))
+            except ValueError:
+                continue
+            if target_id:
+                target_name = relationship_target_name(index, target_id) if index is not None else ""
+                relationships.append(RelationshipInfo(target_id, target_name, friendship, attraction, compatibility))
+    return relationships
+
+
+def relationship_target_name(index: Dict[int, Character], target_id: int) -> str:
+    target = index.get(target_id)
+    return target.name if target else sys.intern(f"Unknown ID ({target_id})")
+
+
+def read_inventory(inv) -> Tuple[List[StorageItem], Dict[int, list]]:
+    """Read an <inv> element into its item list and an elementaryId -> [<s> element, StorageItem] index.
+
+    Stacks with no quantity are indexed with a None item so edits can still find
+    their element; the first <s> for an id wins.
+    """
+    items: List[StorageItem] = []
+    index: Dict[int, list] = {}
+    for s in inv.iterchildren("s"):
+        try:
+            item_id = int(s.get("elementaryId", "0"))
+            qty = int(s.get("inStorage", "0"))
+        except ValueError:
+            continue
+        if item_id in index:
+            continue
+        item = None
+        if qty > 0:
+            item = StorageItem(element_id=item_id, quantity=qty)
+            items.append(item)
+        index[item_id] = [s, item]
+    return items, index
+
+
+def has_storage_items(inv) -> bool:
+    """True if read_inventory(inv) would return any items, without building the list."""
+    for s in inv.iterchildren("s"):
+        try:
+            int(s.get("elementaryId", "0"))
+            qty = int(s.get("inStorage", "0"))
+        except ValueError:
+            continue
+        if qty > 0:
+            return True
+    return False
+
+
+class LazySection:
+    """Descriptor that builds a list with reader(obj) on first access and caches it in the "_<name>" slot.
+
+    Used by the views here and by save_cache's CachedCharacter. Assigning to the attribute replaces the cached list, so the update_* functions
+    in save_loader work on views exactly as they do on eager models.
+    """
+
+    def __init__(self, reader: Callable[[object], list]) -> None:
+        self.reader = reader
+        self.slot = ""
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.slot = "_" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = getattr(obj, self.slot, None)
+        if value is None:
+            value = self.reader(obj)
+            setattr(obj, self.slot, value)
+        return value
+
+    def __set__(self, obj, value) -> None:
+        setattr(obj, self.slot, value)
+
+
+class CharacterView(Character):
+    """Character backed by its <c> element; pers sections are read on first access."""
+
+    __slots__ = ("element", "_index", "_skills", "_traits", "_attributes", "_conditions", "_relationships")
+
+    skills = LazySection(lambda self: read_skills(self._pers()))
+    traits = LazySection(lambda self: read_traits(self._pers()))
+    attributes = LazySection(lambda self: read_attributes(self._pers()))
+    conditions = LazySection(lambda self: read_conditions(self._pers()))
+    relationships = LazySection(lambda self: read_relationships(self._pers(), self._index))
+
+    def __init__(self, element, entity_id: int, ship_sid: int, index: Dict[int, Character]) -> None:
+        self.element = element
+        self.name = sys.intern(element.get("name") or "Unknown")
+        self.entity_id = entity_id
+        self.ship_sid = ship_sid
+        self.stats = []
+        self._index = index
+
+    def _pers(self):
+        return self.element.find("pers")
+
+    def section_loaded(self, name: str) -> bool:
+        return getattr(self, "_" + name, None) is not None
+
+    def reload(self) -> None:
+        """Forget cached sections so the next access reads the element again."""
+        self._skills = self._traits = self._attributes = self._conditions = self._relationships = None
+
+
+class ShipView(Ship):
+    """Ship whose name and size are read from and written to its <ship> element."""
+
+    def __init__(self, element, sid: int) -> None:
+        self.element = element
+        self.sid = sid
+        self.storage_items = []
+
+    @property
+    def sname(self) -> str:
+        return self.element.get("sname") or "Unnamed Ship"
+
+    @sname.setter
+    def sname(self, value: str) -> None:
+        self.element.set("sname", value)
+
+    @property
+    def sx(self) -> int:
+        return int(self.element.get("sx", "0") or 0)
+
+    @sx.setter
+    def sx(self, value: int) -> None:
+        self.element.set("sx", str(value))
+
+    @property
+    def sy(self) -> int:
+        return int(self.element.get("sy", "0") or 0)
+
+    @sy.setter
+    def sy(self, value: int) -> None:
+        self.element.set("sy", str(value))
+
+
+class StorageContainerView(StorageContainer):
+    """StorageContainer whose item list and index are read from its <inv> element on first access."""
+
+    items = LazySection(lambda self: self._read_inventory()[0])
+    item_index = LazySection(lambda self: self._read_inventory()[1])
+
+    def __init__(self, display_name: str, feat_element, inv_element, parent_ent_id: Optional[int] = None,
+                 parent_obj_id: Optional[str] = None, ship_sid: Optional[int] = None) -> None:
+        self.display_name = display_name
+        self.feat_element = feat_element
+        self.inv_element = inv_element
+        self.parent_ent_id = parent_ent_id
+        self.parent_obj_id = parent_obj_id
+        self.ship_sid = ship_sid
+
+    def _read_inventory(self) -> Tuple[List[StorageItem], Dict[int, list]]:
+        items, index = read_inventory(self.inv_element)
+        self._items = items
+        self._item_index = index
+        return items, index
@@ -0,0 +1,178 @@
+from __future__ import annotations
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+
+
+class EditJournal:
+    """Applies XML mutations and records each one as a small inverse delta.
+
+    Every change save_loader makes to the document goes through set(), append()
+    and remove(), so any run of edits can be rolled back without copying the tree.
+
+    Entries recorded inside transaction() form one undo step. undo() reverts the
+    newest step and keeps the reverted values so redo() can apply it again; both
+    cost time proportional to the entries in the step. Entries recorded outside
+    a transaction are undone together as a single step.
+
+    Every change to the tree is made while holding lock, so a background reader
+    of the tree (the storage prefetch) can hold it to see no half-made edits.
+    """
+
+    def __init__(self, lock: Optional[threading.RLock] = None) -> None:
+        self.lock = lock if lock is not None else threading.RLock()
+        # ("set", element, key, old_value) | ("insert", parent, child) | ("remove", parent, child, index)
+        self._entries: List[Tuple] = []
+        # Length of the journal when the tree last matched the file on disk; None once rollback goes past it
+        self._clean: Optional[int] = 0
+        # (start, end, label) of each undo step, oldest first
+        self._steps: List[Tuple[int, int, str]] = []
+        # (label, forward entries) of undone steps, most recently undone last
+        self._redo: List[Tuple[str, List[Tuple]]] = []
+        self._depth = 0
+        self._replaying = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _record(self, entry: Tuple) -> None:
+        self._entries.append(entry)
+        if not self._replaying:
+            self._redo.clear()
+
+    def set(self, el, key: str, value: str) -> None:
+        old = el.get(key)
+        if old == value:
+            return
+        with self.lock:
+            el.set(key, value)
+        self._record(("set", el, key, old))
+
+    def append(self, parent, child) -> None:
+        with self.lock:
+            parent.append(child)
+        self._record(("insert", parent, child))
+
+    def remove(self, parent, child) -> None:
+        with self.lock:
+            index = parent.index(child)
+            parent.remove(child)
+        self._record(("remove", parent, child, index))
+
+    @contextmanager
+    def transaction(self, label: str) -> Iterator[None]:
+        """Group the changes made inside the block into one undo step; nested blocks join the outer one."""
+        start = len(self._entries)
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+        if self._depth == 0 and len(self._entries) > start:
+            self._steps.append((start, len(self._entries), label))
+
+    def undo_label(self) -> Optional[str]:
+        """Label of the step undo() would revert, or None if there is nothing to undo."""
+        step = self._last_step()
+        return step[2] if step is not None else None
+
+    def redo_label(self) -> Optional[str]:
+        return self._redo[-1][0] if self._redo else None
+
+    def _last_step(self) -> Optional[Tuple[int, int, str]]:
+        end = self._steps[-1][1] if self._steps else 0
+        if len(self._entries) > end:
+            return end, len(self._entries), "Edit"
+        return self._steps[-1] if self._steps else None
+
+    def undo(self) -> Optional[Tuple[str, List[object]]]:
+        """Revert the newest step; returns its label and the elements that changed, or None."""
+        if self._depth:
+            raise ValueError("Cannot undo while a transaction is open.")
+        step = self._last_step()
+        if step is None:
+            return None
+        start, _end, label = step
+        # The redo entries are read while reverting, when the tree is as each entry left it:
+        # a child inserted and removed again within the step is only in the tree at that point
+        forward: List[Tuple] = []
+        touched = self._revert(start, forward)
+        forward.reverse()
+        self._redo.append((label, forward))
+        return label, touched
+
+    def redo(self) -> Optional[Tuple[str, List[object]]]:
+        """Apply the most recently undone step again; returns its label and the elements that changed, or None."""
+        if self._depth:
+            raise ValueError("Cannot redo while a transaction is open.")
+        if not self._redo:
+            return None
+        label, forward = self._redo.pop()
+        start = len(self._entries)
+        touched: List[object] = []
+        self._replaying = True
+        try:
+            for entry in forward:
+                kind, el = entry[0], entry[1]
+                if kind == "set":
+                    self.set(el, entry[2], entry[3])
+                elif kind == "insert":
+                    with self.lock:
+                        el.insert(entry[3], entry[2])
+                    self._record(("insert", el, entry[2]))
+                else:
+                    self.remove(el, entry[2])
+                touched.append(el)
+        finally:
+            self._replaying = False
+        self._steps.append((start, len(self._entries), label))
+        return label, touched
+
+    def mark(self) -> int:
+        """Position to pass to rollback() later."""
+        return len(self._entries)
+
+    def mark_clean(self) -> None:
+        """Record that the tree now matches the file on disk."""
+        self._clean = len(self._entries)
+
+    def changes_since_clean(self) -> Optional[List[Tuple]]:
+        """Entries recorded since mark_clean(), or None if some of those changes were rolled back."""
+        if self._clean is None:
+            return None
+        return self._entries[self._clean:]
+
+    def rollback(self, mark: int = 0) -> List[object]:
+        """Undo every change recorded after mark, newest first; returns the elements that changed."""
+        return self._revert(mark, None)
+
+    def _revert(self, mark: int, forward: Optional[List[Tuple]]) -> List[object]:
+        """rollback(), also appending to forward (newest first) the entries that would apply each change again."""
+        touched: List[object] = []
+        with self.lock:
+            while len(self._entries) > mark:
+                entry = self._entries[-1]
+                kind, el = entry[0], entry[1]
+                if kind == "set":
+                    key, old = entry[2], entry[3]
+                    if forward is not None:
+                        forward.append(("set", el, key, el.get(key)))
+                    if old is None:
+                        el.attrib.pop(key, None)
+                    else:
+                        el.set(key, old)
+                elif kind == "insert":
+                    if forward is not None:
+                        forward.append(("insert", el, entry[2], el.index(entry[2])))
+                    el.remove(entry[2])
+                else:
+                    if forward is not None:
+                        forward.append(("remove", el, entry[2]))
+                    el.insert(entry[3], entry[2])
+                # Only drop the entry once its change is reverted, so a failure leaves the journal matching the tree
+                self._entries.pop()
+                if self._clean is not None and len(self._entries) < self._clean:
+                    self._clean = None
+                touched.append(el)
+        self._steps = [(start, min(end, mark), label) for start, end, label in self._steps if start < mark]
+        return touched
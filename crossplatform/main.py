@@ -1,10 +1,18 @@
 from __future__ import annotations
+import time
+
+# Reference point for --profile-startup
+_STARTED = time.perf_counter()
+
+import functools
+import importlib
 import sys
+import threading
 from pathlib import Path
-from typing import Optional, List
+from typing import TYPE_CHECKING, Callable, Dict, Optional, List, Tuple
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QAction
+from PySide6.QtCore import Qt, QEvent, QObject, QRunnable, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QAction, QFontDatabase, QKeySequence
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -20,36 +28,26 @@ from PySide6.QtWidgets import (
     QTabWidget,
     QListWidget,
     QListWidgetItem,
+    QListView,
     QSpinBox,
     QTableWidget,
     QTableWidgetItem,
+    QTableView,
+    QHeaderView,
     QMessageBox,
     QDialog,
     QDialogButtonBox,
     QTextEdit,
     QGroupBox,
+    QProgressBar,
 )
 
+_QT_IMPORTED = time.perf_counter()
+
 try:
-    from .models import SaveData, Ship, StorageContainer, Character, DataProp
-    from .save_loader import (
-        load_save,
-        save_to_disk,
-        load_storage_containers,
-        update_globals_in_memory,
-        add_item_to_container,
-        delete_item_from_container,
-        update_item_quantity,
-        update_ship_size,
-        update_character_attribute,
-        update_character_skill,
-        add_character_trait,
-        remove_character_trait,
-        remove_character_condition,
-        update_character_relationship,
-        create_new_crew_member,
-    )
     from .id_collections import DefaultStorageIDs, DefaultAttributeIDs, DefaultSkillIDs, DefaultTraitIDs
+    from .table_models import CrewListModel, DataPropTableModel, RelationshipTableModel, StorageTableModel
+    from .crew_index import CrewIndex
 except ImportError:
     # Fallback for when running as standalone (PyInstaller)
     import sys
@@ -59,25 +57,131 @@ except ImportError:
         # PyInstaller sets _MEIPASS to the temp folder
         sys.path.insert(0, sys._MEIPASS)
     sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-    from models import SaveData, Ship, StorageContainer, Character, DataProp
-    from save_loader import (
-        load_save,
-        save_to_disk,
-        load_storage_containers,
-        update_globals_in_memory,
-        add_item_to_container,
-        delete_item_from_container,
-        update_item_quantity,
-        update_ship_size,
-        update_character_attribute,
-        update_character_skill,
-        add_character_trait,
-        remove_character_trait,
-        remove_character_condition,
-        update_character_relationship,
-        create_new_crew_member,
-    )
     from id_collections import DefaultStorageIDs, DefaultAttributeIDs, DefaultSkillIDs, DefaultTraitIDs
+    from table_models import CrewListModel, DataPropTableModel, RelationshipTableModel, StorageTableModel
+    from crew_index import CrewIndex
+
+if TYPE_CHECKING:
+    from .models import SaveData, Ship, StorageContainer, Character, DataProp
+
+_IMPORTED = time.perf_counter()
+
+# Modules only needed once a save is opened, and what they bring in (lxml,
+# lzma, json), are imported on first use so the window appears sooner.
+# The PyInstaller builds list them as hidden imports.
+_deferred_imports: List[Tuple[str, float, float]] = []  # (module, started, finished)
+
+
+class _LazyModule:
+    """Stands in for a sibling module, importing it on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr: str):
+        if self._module is None:
+            started = time.perf_counter()
+            if __package__:
+                self._module = importlib.import_module(f".{self._name}", __package__)
+            else:
+                # Standalone (PyInstaller): sibling modules are top-level
+                self._module = importlib.import_module(self._name)
+            _deferred_imports.append((self._name, started, time.perf_counter()))
+        value = getattr(self._module, attr)
+        # Later lookups find it without coming through here
+        setattr(self, attr, value)
+        return value
+
+
+models = _LazyModule("models")
+save_loader = _LazyModule("save_loader")
+save_cache = _LazyModule("save_cache")
+backups = _LazyModule("backups")
+save_diff = _LazyModule("save_diff")
+
+
+class _BackgroundSignals(QObject):
+    """Delivers the results of background loads, saves and backups to the GUI thread."""
+    loaded = Signal(int, object)
+    cached = Signal(int, object)
+    failed = Signal(int, str)
+    saved = Signal(int, object)
+    save_failed = Signal(int, str)
+    compared = Signal(int, object)
+    compare_failed = Signal(int, str)
+    progress = Signal(int, int)
+    cancelled = Signal(int)
+    backup_done = Signal(str)
+    backup_failed = Signal(str)
+
+
+class _Task(QRunnable):
+    """Runs work(progress) on the thread pool and emits done(generation, result) or failed(generation, message).
+
+    The progress callback forwards whole percentages and raises
+    OperationCancelled once cancel() has been called.
+    """
+
+    def __init__(self, kind: str, work, generation: int, signals: _BackgroundSignals, done, failed) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.kind = kind
+        self._work = work
+        self._generation = generation
+        self._signals = signals
+        self._done = done
+        self._failed = failed
+        self._cancel = threading.Event()
+        self._percent = -1
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def _progress(self, done: int, total: int) -> None:
+        if self._cancel.is_set():
+            raise save_loader.OperationCancelled()
+        percent = min(100, done * 100 // total) if total else 0
+        if percent != self._percent:
+            self._percent = percent
+            self._signals.progress.emit(self._generation, percent)
+
+    def run(self) -> None:
+        try:
+            result = self._work(self._progress)
+        except Exception as ex:
+            if self._is_cancellation(ex):
+                self._signals.cancelled.emit(self._generation)
+            else:
+                self._failed.emit(self._generation, str(ex))
+            return
+        self._done.emit(self._generation, result)
+
+    @staticmethod
+    def _is_cancellation(ex: Exception) -> bool:
+        # If save_loader itself failed to import, report that error rather than raising it again here
+        try:
+            return isinstance(ex, save_loader.OperationCancelled)
+        except ImportError:
+            return False
+
+
+def _undo_step(label: str):
+    """Record everything a MainWindow handler changes in the save as one Edit -> Undo step."""
+    def wrap(handler):
+        # Qt passes signal arguments the handler may not take (e.g. clicked's checked flag)
+        arg_count = handler.__code__.co_argcount - 1
+
+        @functools.wraps(handler)
+        def run(self, *args):
+            if self.save is None or self.save.xml_doc is None:
+                return handler(self, *args[:arg_count])
+            with self.save.journal.transaction(label):
+                result = handler(self, *args[:arg_count])
+            self._update_undo_actions()
+            return result
+        return run
+    return wrap
 
 
 class MainWindow(QMainWindow):
@@ -89,9 +193,38 @@ class MainWindow(QMainWindow):
         self.save: Optional[SaveData] = None
         self.current_containers: list[StorageContainer] = []
         self.backup_enabled: bool = False
+        self.cache_enabled: bool = False
+        # Incremented per load or save so results of an abandoned task are ignored
+        self._task_generation = 0
+        self._task: Optional[_Task] = None
+        # What to show again if a load is cancelled or fails
+        self._save_before_load: Optional[SaveData] = None
+        self._signals = _BackgroundSignals(self)
+        self._signals.loaded.connect(self._on_background_loaded)
+        self._signals.cached.connect(self._on_cached_loaded)
+        self._signals.failed.connect(self._on_background_failed)
+        self._signals.saved.connect(self._on_background_saved)
+        self._signals.save_failed.connect(self._on_background_save_failed)
+        self._signals.progress.connect(self._on_task_progress)
+        self._signals.compared.connect(self._on_background_compared)
+        self._signals.compare_failed.connect(self._on_background_compare_failed)
+        self._signals.cancelled.connect(self._on_task_cancelled)
+        self._signals.backup_done.connect(self._on_backup_done)
+        self._signals.backup_failed.connect(self._on_backup_failed)
+        self._backup_thread: Optional[threading.Thread] = None
 
         self._init_menu()
 
+        # Load/save progress, shown in the status bar while a task runs
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setMaximumWidth(200)
+        self.btn_cancel_task = QPushButton("Cancel")
+        self.btn_cancel_task.clicked.connect(self._on_cancel_task)
+        self.statusBar().addPermanentWidget(self.progress_bar)
+        self.statusBar().addPermanentWidget(self.btn_cancel_task)
+        self.progress_bar.hide()
+        self.btn_cancel_task.hide()
+
         central = QWidget()
         self.setCentralWidget(central)
         root = QVBoxLayout(central)
@@ -136,13 +269,52 @@ class MainWindow(QMainWindow):
         ship_box.addWidget(btn_update_size)
         root.addLayout(ship_box)
 
-        # Tabs
+        # Tabs. A page is built the first time it is shown (see _add_deferred_tab), so
+        # only the Crew list and the Attributes table are built at startup. The models
+        # behind the tables exist from the start, so loading, editing and undo update
+        # them whether or not their page has been built yet.
+        self._page_builders: Dict[QWidget, Callable[[QWidget], None]] = {}
+        self.crew_model = CrewListModel(self)
+        self.attributes_model = DataPropTableModel(
+            DefaultAttributeIDs, ["Attr ID", "Attr Name", "Value"], self._on_attribute_edited, self)
+        self.skills_model = DataPropTableModel(
+            DefaultSkillIDs, ["Skill ID", "Skill Name", "Level"], self._on_skill_edited, self)
+        self.relationships_model = RelationshipTableModel(self._on_relationship_edited, self)
+        self.storage_model = StorageTableModel(self._on_storage_quantity_edited, self)
+        # Widgets filled straight from the save; None until their page is built
+        self.tbl_traits: Optional[QTableWidget] = None
+        self.lst_conditions: Optional[QListWidget] = None
+        self.cmb_containers: Optional[QComboBox] = None
+        self.lbl_total_items: Optional[QLabel] = None
+
+        self.current_character: Optional[Character] = None
+        # Crew of the selected ship sorted by name, and the filter index over all
+        # crew, built on first use after each load
+        self._ship_crew: List[Character] = []
+        self.crew_index: Optional[CrewIndex] = None
+
         self.tabs = QTabWidget()
         root.addWidget(self.tabs)
+        self._add_deferred_tab(self.tabs, "Crew", self._build_crew_page)
+        self._add_deferred_tab(self.tabs, "Storage", self._build_storage_page)
+
+    def _add_deferred_tab(self, tabs: QTabWidget, title: str, build: Callable[[QWidget], None]) -> None:
+        """Add an empty page that build(page) fills the first time it becomes the current tab."""
+        page = QWidget()
+        if tabs.count() == 0:
+            tabs.currentChanged.connect(lambda index: self._build_page(tabs, index))
+        self._page_builders[page] = build
+        # The first tab added becomes current, which builds it right away
+        tabs.addTab(page, title)
 
-        # Crew tab with full editing
-        crew_tab = QWidget()
-        crew_layout = QHBoxLayout(crew_tab)
+    def _build_page(self, tabs: QTabWidget, index: int) -> None:
+        page = tabs.widget(index)
+        build = self._page_builders.pop(page, None)
+        if build is not None:
+            build(page)
+
+    def _build_crew_page(self, page: QWidget) -> None:
+        crew_layout = QHBoxLayout(page)
         
         # Left: Crew list
         left_panel = QWidget()
@@ -150,45 +322,53 @@ class MainWindow(QMainWindow):
         left_layout.addWidget(QLabel("Crew Members"))
         self.lbl_crew_count = QLabel("Total Crew: 0")
         left_layout.addWidget(self.lbl_crew_count)
-        self.lst_crew = QListWidget()
-        self.lst_crew.currentRowChanged.connect(self._on_crew_selected)
+        self.txt_crew_filter = QLineEdit()
+        self.txt_crew_filter.setPlaceholderText("Filter by name, trait or condition")
+        self.txt_crew_filter.setClearButtonEnabled(True)
+        self.txt_crew_filter.textChanged.connect(self._apply_crew_filter)
+        left_layout.addWidget(self.txt_crew_filter)
+        self.lst_crew = QListView()
+        self.lst_crew.setUniformItemSizes(True)
+        self.lst_crew.setModel(self.crew_model)
+        self.lst_crew.selectionModel().currentRowChanged.connect(
+            lambda current, _previous: self._on_crew_selected(current.row()))
         left_layout.addWidget(self.lst_crew)
         btn_add_crew = QPushButton("Create New Crew Member...")
         btn_add_crew.clicked.connect(self._on_add_new_crew)
         left_layout.addWidget(btn_add_crew)
-        left_layout.setStretch(2, 1)
+        left_layout.setStretch(3, 1)
         crew_layout.addWidget(left_panel)
         
         # Right: Tabs for editing
         self.crew_tabs = QTabWidget()
-        
-        # Attributes tab
-        attrs_widget = QWidget()
-        attrs_layout = QVBoxLayout(attrs_widget)
+        self._add_deferred_tab(self.crew_tabs, "Attributes", self._build_attributes_page)
+        self._add_deferred_tab(self.crew_tabs, "Skills", self._build_skills_page)
+        self._add_deferred_tab(self.crew_tabs, "Traits", self._build_traits_page)
+        self._add_deferred_tab(self.crew_tabs, "Conditions", self._build_conditions_page)
+        self._add_deferred_tab(self.crew_tabs, "Relationships", self._build_relationships_page)
+        crew_layout.addWidget(self.crew_tabs)
+        crew_layout.setStretch(1, 1)
+
+    def _build_attributes_page(self, page: QWidget) -> None:
+        attrs_layout = QVBoxLayout(page)
         btn_set_all_attrs = QPushButton("Set All Attributes to 5")
         btn_set_all_attrs.clicked.connect(self._on_set_all_attributes)
         attrs_layout.addWidget(btn_set_all_attrs)
-        self.tbl_attributes = QTableWidget(0, 3)
-        self.tbl_attributes.setHorizontalHeaderLabels(["Attr ID", "Attr Name", "Value"])
-        self.tbl_attributes.itemChanged.connect(self._on_attribute_changed)
+        self.tbl_attributes = QTableView()
+        self.tbl_attributes.setModel(self.attributes_model)
         attrs_layout.addWidget(self.tbl_attributes)
-        self.crew_tabs.addTab(attrs_widget, "Attributes")
-        
-        # Skills tab
-        skills_widget = QWidget()
-        skills_layout = QVBoxLayout(skills_widget)
+
+    def _build_skills_page(self, page: QWidget) -> None:
+        skills_layout = QVBoxLayout(page)
         btn_set_all_skills = QPushButton("Set All Skills to 8")
         btn_set_all_skills.clicked.connect(self._on_set_all_skills)
         skills_layout.addWidget(btn_set_all_skills)
-        self.tbl_skills = QTableWidget(0, 3)
-        self.tbl_skills.setHorizontalHeaderLabels(["Skill ID", "Skill Name", "Level"])
-        self.tbl_skills.itemChanged.connect(self._on_skill_changed)
+        self.tbl_skills = QTableView()
+        self.tbl_skills.setModel(self.skills_model)
         skills_layout.addWidget(self.tbl_skills)
-        self.crew_tabs.addTab(skills_widget, "Skills")
-        
-        # Traits tab
-        traits_widget = QWidget()
-        traits_layout = QVBoxLayout(traits_widget)
+
+    def _build_traits_page(self, page: QWidget) -> None:
+        traits_layout = QVBoxLayout(page)
         traits_layout.addWidget(QLabel("Current Traits:"))
         self.tbl_traits = QTableWidget(0, 1)
         self.tbl_traits.setHorizontalHeaderLabels(["Trait Name"])
@@ -207,52 +387,31 @@ class MainWindow(QMainWindow):
         manage_layout.addWidget(btn_add_trait)
         manage_layout.addWidget(btn_del_trait)
         traits_layout.addLayout(manage_layout)
-        self.crew_tabs.addTab(traits_widget, "Traits")
-        
-        # Conditions tab
-        conditions_widget = QWidget()
-        conditions_layout = QVBoxLayout(conditions_widget)
+        self._show_traits()
+
+    def _build_conditions_page(self, page: QWidget) -> None:
+        conditions_layout = QVBoxLayout(page)
         conditions_layout.addWidget(QLabel("Current Conditions:"))
         self.lst_conditions = QListWidget()
         conditions_layout.addWidget(self.lst_conditions)
         btn_del_condition = QPushButton("Delete Selected Condition")
         btn_del_condition.clicked.connect(self._on_delete_condition)
         conditions_layout.addWidget(btn_del_condition)
-        self.crew_tabs.addTab(conditions_widget, "Conditions")
-        
-        # Relationships tab
-        rels_widget = QWidget()
-        rels_layout = QVBoxLayout(rels_widget)
+        self._show_conditions()
+
+    def _build_relationships_page(self, page: QWidget) -> None:
+        rels_layout = QVBoxLayout(page)
         rels_layout.addWidget(QLabel("Current Relationships:"))
-        self.tbl_relationships = QTableWidget(0, 4)
-        self.tbl_relationships.setHorizontalHeaderLabels(["Target", "Friendship", "Attraction", "Compatibility"])
-        self.tbl_relationships.itemChanged.connect(self._on_relationship_changed)
+        self.tbl_relationships = QTableView()
+        self.tbl_relationships.setModel(self.relationships_model)
+        # Every relationship in one scrolling view; click a header to sort by that column
+        self.tbl_relationships.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.tbl_relationships.setSortingEnabled(True)
+        self.tbl_relationships.sortByColumn(0, Qt.AscendingOrder)
         rels_layout.addWidget(self.tbl_relationships)
-        paging_layout = QHBoxLayout()
-        self.btn_rel_prev = QPushButton("< Previous")
-        self.btn_rel_prev.clicked.connect(self._on_rel_prev)
-        self.btn_rel_next = QPushButton("Next >")
-        self.btn_rel_next.clicked.connect(self._on_rel_next)
-        self.lbl_rel_page = QLabel("Page 0 of 0")
-        paging_layout.addWidget(self.btn_rel_prev)
-        paging_layout.addWidget(self.lbl_rel_page)
-        paging_layout.addWidget(self.btn_rel_next)
-        paging_layout.addStretch()
-        rels_layout.addLayout(paging_layout)
-        self.crew_tabs.addTab(rels_widget, "Relationships")
-        
-        crew_layout.addWidget(self.crew_tabs)
-        crew_layout.setStretch(1, 1)
-        
-        self.current_character: Optional[Character] = None
-        self.relationships_page = 1
-        self.relationships_page_size = 20
-        
-        self.tabs.addTab(crew_tab, "Crew")
 
-        # Storage tab
-        storage_tab = QWidget()
-        storage_layout = QVBoxLayout(storage_tab)
+    def _build_storage_page(self, page: QWidget) -> None:
+        storage_layout = QVBoxLayout(page)
         top_row = QHBoxLayout()
         top_row.addWidget(QLabel("Select Container:"))
         self.cmb_containers = QComboBox()
@@ -262,9 +421,8 @@ class MainWindow(QMainWindow):
         top_row.addWidget(self.lbl_total_items)
         storage_layout.addLayout(top_row)
 
-        self.tbl_storage = QTableWidget(0, 3)
-        self.tbl_storage.setHorizontalHeaderLabels(["Item Name", "Quantity", "Item ID"])
-        self.tbl_storage.itemChanged.connect(self._on_storage_item_changed)
+        self.tbl_storage = QTableView()
+        self.tbl_storage.setModel(self.storage_model)
         storage_layout.addWidget(self.tbl_storage)
 
         add_row = QHBoxLayout()
@@ -284,8 +442,7 @@ class MainWindow(QMainWindow):
         add_row.addWidget(btn_add)
         add_row.addWidget(btn_del)
         storage_layout.addLayout(add_row)
-
-        self.tabs.addTab(storage_tab, "Storage")
+        self._show_containers()
 
     def _init_menu(self) -> None:
         m = self.menuBar()
@@ -294,14 +451,27 @@ class MainWindow(QMainWindow):
         act_open.triggered.connect(self._on_open)
         act_save = QAction("Save", self)
         act_save.triggered.connect(self._on_save)
+        act_compare = QAction("Compare With...", self)
+        act_compare.triggered.connect(self._on_compare)
         act_exit = QAction("Exit", self)
         act_exit.triggered.connect(self.close)
         file_menu.addAction(act_open)
         file_menu.addAction(act_save)
+        file_menu.addAction(act_compare)
         file_menu.addSeparator()
         file_menu.addAction(act_exit)
         
         edit_menu = m.addMenu("Edit")
+        self.act_undo = QAction("Undo", self)
+        self.act_undo.setShortcut(QKeySequence.Undo)
+        self.act_undo.triggered.connect(self._on_undo)
+        self.act_redo = QAction("Redo", self)
+        self.act_redo.setShortcut(QKeySequence.Redo)
+        self.act_redo.triggered.connect(self._on_redo)
+        edit_menu.addAction(self.act_undo)
+        edit_menu.addAction(self.act_redo)
+        edit_menu.addSeparator()
+        self._update_undo_actions()
         act_settings = QAction("Settings", self)
         act_settings.triggered.connect(self._on_settings)
         edit_menu.addAction(act_settings)
@@ -316,21 +486,185 @@ class MainWindow(QMainWindow):
         help_menu.addAction(act_about)
 
     def _on_open(self) -> None:
+        if self._task is not None and self._task.kind == "save":
+            QMessageBox.warning(self, "Open", "Wait for the save to finish.")
+            return
         dlg = QFileDialog(self)
         dlg.setNameFilters(["Space Haven Save (game *sav)", "All Files (*)"])
         dlg.setFileMode(QFileDialog.ExistingFile)
         if dlg.exec() != QFileDialog.Accepted:
             return
         path = dlg.selectedFiles()[0]
-        try:
-            self.save = load_save(path)
-        except Exception as ex:
-            QMessageBox.critical(self, "Load Error", str(ex))
+        if self.backup_enabled:
+            self._start_backup(path)
+        if self._task is None:
+            self._save_before_load = self.save
+        self._cancel_task()
+        self.statusBar().showMessage(f"Loading {Path(path).name}...")
+        use_cache = self.cache_enabled
+        signals = self._signals
+        # The generation _start_task gives this load, for the cached data it may report first
+        generation = self._task_generation + 1
+
+        def work(progress) -> SaveData:
+            # Checking the sidecar hashes the whole save, so it is done here rather than on the GUI thread
+            cached = save_cache.load_cached(path) if use_cache else None
+            if cached is not None:
+                signals.cached.emit(generation, cached)
+            save = save_loader.load_save(path, streaming=True, lazy=True, progress=progress)
+            if use_cache and cached is None:
+                try:
+                    save_cache.write_cache(save)
+                except OSError:
+                    pass  # the cache is only an optimization
+            return save
+
+        self._start_task("load", work, self._signals.loaded, self._signals.failed)
+        assert generation == self._task_generation
+
+    def _start_task(self, kind: str, work, done, failed) -> None:
+        """Run a load or save on the thread pool; editing is disabled until it finishes."""
+        self._task_generation += 1
+        self._task = _Task(kind, work, self._task_generation, self._signals, done, failed)
+        self.centralWidget().setEnabled(False)
+        # Busy indicator until the first progress report
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.show()
+        self.btn_cancel_task.show()
+        QThreadPool.globalInstance().start(self._task)
+
+    def _cancel_task(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _finish_task(self, generation: int) -> bool:
+        """Clear the progress display for a task that finished; False if it was abandoned."""
+        if self._task is None or generation != self._task_generation:
+            return False
+        self._task = None
+        self.progress_bar.hide()
+        self.btn_cancel_task.hide()
+        self.centralWidget().setEnabled(True)
+        return True
+
+    def _on_task_progress(self, generation: int, percent: int) -> None:
+        if self._task is not None and generation == self._task_generation:
+            self.progress_bar.setRange(0, 100)
+            self.progress_bar.setValue(percent)
+
+    def _on_cancel_task(self) -> None:
+        if self._task is not None:
+            self.btn_cancel_task.hide()
+            self.statusBar().showMessage("Cancelling...")
+            self._task.cancel()
+
+    def _on_task_cancelled(self, generation: int) -> None:
+        kind = self._task.kind if self._task is not None else None
+        if not self._finish_task(generation):
+            return
+        if kind == "load":
+            self._restore_after_failed_load()
+            self.statusBar().showMessage("Load cancelled.", 5000)
+        elif kind == "compare":
+            self.statusBar().showMessage("Comparison cancelled.", 5000)
+        else:
+            self.statusBar().showMessage("Save cancelled; the file was not changed.", 5000)
+
+    def _after_load(self) -> None:
+        assert self.save is not None
+        self.centralWidget().setEnabled(True)
+        # Warm the per-ship storage cache so switching ships later is instant
+        threading.Thread(target=save_loader.prefetch_storage_containers, args=(self.save,), daemon=True).start()
+        self.statusBar().showMessage(
+            f"Loaded {Path(self.save.path).name}: {self.save.file_size / (1024 * 1024):.1f} MB in "
+            f"{self.save.load_seconds:.2f}s ({self.save.load_throughput_mb_s:.1f} MB/s)"
+        )
+
+    def _on_background_loaded(self, generation: int, save: SaveData) -> None:
+        if not self._finish_task(generation):
             return
+        # Keep the selected ship when the real save replaces cached data
+        sid = self.cmb_ships.currentData() if self.save is not None and self.save.xml_doc is None else None
+        self.save = save
+        self._save_before_load = None
         self._populate_after_load()
+        idx = self.cmb_ships.findData(sid)
+        if idx > 0:
+            self.cmb_ships.setCurrentIndex(idx)
+        self._after_load()
+
+    def _on_cached_loaded(self, generation: int, cached: SaveData) -> None:
+        """Show a save's cached data, read-only, while its load task goes on parsing the file."""
+        if self._task is None or generation != self._task_generation:
+            return
+        self.save = cached
+        self._populate_after_load()
+        self.statusBar().showMessage(f"Showing cached data for {Path(cached.path).name}, loading the save...")
+
+    def _on_background_failed(self, generation: int, message: str) -> None:
+        if not self._finish_task(generation):
+            return
+        self._restore_after_failed_load()
+        self.statusBar().clearMessage()
+        QMessageBox.critical(self, "Load Error", message)
+
+    def _restore_after_failed_load(self) -> None:
+        """Go back to the save that was open before, in place of any cached data shown meanwhile."""
+        previous, self._save_before_load = self._save_before_load, None
+        if self.save is previous:
+            return
+        self.save = previous
+        if previous is not None:
+            self._populate_after_load()
+        else:
+            # Cached data of the abandoned save is still on screen; keep it read-only
+            self.centralWidget().setEnabled(False)
+
+    def _start_backup(self, path: str) -> None:
+        """Back up the save folder on a background thread (see backups); unchanged saves cost nothing."""
+        signals = self._signals
+        previous = self._backup_thread
+
+        def work() -> None:
+            # Backups run one at a time, in the order they were started
+            if previous is not None:
+                previous.join()
+            try:
+                snapshot = backups.backup_save(path)
+            except Exception as ex:
+                signals.backup_failed.emit(str(ex))
+                return
+            if snapshot:
+                signals.backup_done.emit(snapshot)
+
+        self._backup_thread = threading.Thread(target=work, daemon=True)
+        self._backup_thread.start()
+
+    def _after_backup(self, work):
+        """Wrap a task's work so it first waits, on the worker thread, for the backup in progress."""
+        backup = self._backup_thread
+
+        def run(progress):
+            # The backup must read the files before anything overwrites them
+            while backup is not None and backup.is_alive():
+                progress(0, 0)  # raises OperationCancelled if the task was cancelled meanwhile
+                backup.join(0.05)
+            return work(progress)
+        return run
+
+    def _on_backup_done(self, snapshot: str) -> None:
+        self.statusBar().showMessage(f"Backup saved: {snapshot}", 5000)
+
+    def _on_backup_failed(self, message: str) -> None:
+        QMessageBox.warning(self, "Backup Error", f"Backup failed: {message}")
 
     def _populate_after_load(self) -> None:
         assert self.save is not None
+        self._update_undo_actions()
+        # Built on the first non-blank filter: indexing reads every crew member's traits and
+        # conditions, which would load those sections of all the lazy character views
+        self.crew_index = None
         # Globals
         self.txt_credits.setText(str(self.save.credits))
         self.txt_prestige.setText(str(self.save.prestige_points))
@@ -349,12 +683,104 @@ class MainWindow(QMainWindow):
         if not self.save:
             QMessageBox.warning(self, "Save", "No file loaded.")
             return
-        try:
-            save_to_disk(self.save)
-            QMessageBox.information(self, "Save", "File saved successfully.")
-        except Exception as ex:
-            QMessageBox.critical(self, "Save Error", str(ex))
+        if self._task is not None or self.save.xml_doc is None:
+            QMessageBox.warning(self, "Save", "Wait for the current load or save to finish.")
+            return
+        save = self.save
+        self.statusBar().showMessage(f"Saving {Path(save.path).name}...")
+        self._start_task("save", self._after_backup(lambda progress: save_loader.save_to_disk(save, progress=progress)),
+                         self._signals.saved, self._signals.save_failed)
+
+    def _on_background_saved(self, generation: int, _result: object) -> None:
+        if not self._finish_task(generation):
+            return
+        self.statusBar().clearMessage()
+        QMessageBox.information(self, "Save", "File saved successfully.")
+
+    def _on_background_save_failed(self, generation: int, message: str) -> None:
+        if not self._finish_task(generation):
+            return
+        self.statusBar().clearMessage()
+        QMessageBox.critical(self, "Save Error", message)
+
+    def _update_undo_actions(self) -> None:
+        journal = self.save.journal if self.save is not None and self.save.xml_doc is not None else None
+        undo = journal.undo_label() if journal is not None else None
+        redo = journal.redo_label() if journal is not None else None
+        self.act_undo.setEnabled(undo is not None)
+        self.act_undo.setText(f"Undo {undo}" if undo else "Undo")
+        self.act_redo.setEnabled(redo is not None)
+        self.act_redo.setText(f"Redo {redo}" if redo else "Redo")
+
+    def _on_undo(self) -> None:
+        self._step_history(save_loader.undo_edit, "Undone")
+
+    def _on_redo(self) -> None:
+        self._step_history(save_loader.redo_edit, "Redone")
+
+    def _step_history(self, step, verb: str) -> None:
+        if not self.save or self.save.xml_doc is None or self._task is not None:
+            return
+        label = step(self.save)
+        if label is None:
+            return
+        self._refresh_views()
+        self._update_undo_actions()
+        self.statusBar().showMessage(f"{verb}: {label}", 3000)
+
+    def _refresh_views(self) -> None:
+        """Redisplay globals and the selected ship, container and crew member after undo or redo."""
+        assert self.save is not None
+        self.txt_credits.setText(str(self.save.credits))
+        self.txt_prestige.setText(str(self.save.prestige_points))
+        self.chk_sandbox.setChecked(self.save.sandbox)
+        container = self.cmb_containers.currentIndex() if self.cmb_containers is not None else -1
+        ent_id = self.current_character.entity_id if self.current_character else None
+        # Undo and redo can add or remove crew and change their traits and conditions
+        self.crew_index = None
+        self._on_ship_changed(self.cmb_ships.currentIndex())
+        if self.cmb_containers is not None and 0 < container < self.cmb_containers.count():
+            self.cmb_containers.setCurrentIndex(container)
+        self._select_crew_member(ent_id)
+
+    def _on_compare(self) -> None:
+        """Compare the open save (including unsaved edits) with another save file, e.g. a backup."""
+        if self._task is not None:
+            QMessageBox.warning(self, "Compare", "Wait for the current load or save to finish.")
+            return
+        old = self.save if self.save is not None and self.save.xml_doc is not None else None
+        if old is None:
+            old = self._pick_save_file("Select the first save")
+            if old is None:
+                return
+        new = self._pick_save_file("Select the save to compare with")
+        if new is None:
+            return
+        self.statusBar().showMessage(f"Comparing with {new}...")
+        self._start_task("compare", lambda progress: save_diff.diff_saves(old, new, progress=progress),
+                         self._signals.compared, self._signals.compare_failed)
+
+    def _pick_save_file(self, title: str) -> Optional[str]:
+        dlg = QFileDialog(self, title)
+        dlg.setNameFilters(["Space Haven Save (game *sav)", "All Files (*)"])
+        dlg.setFileMode(QFileDialog.ExistingFile)
+        if dlg.exec() != QFileDialog.Accepted:
+            return None
+        return dlg.selectedFiles()[0]
 
+    def _on_background_compared(self, generation: int, diff) -> None:
+        if not self._finish_task(generation):
+            return
+        self.statusBar().clearMessage()
+        DiffDialog(f"{diff.old_path}\n{diff.new_path}\n\n{diff.report(limit=5000)}", self).exec()
+
+    def _on_background_compare_failed(self, generation: int, message: str) -> None:
+        if not self._finish_task(generation):
+            return
+        self.statusBar().clearMessage()
+        QMessageBox.critical(self, "Compare Error", message)
+
+    @_undo_step("Update Global Settings")
     def _on_update_globals(self) -> None:
         if not self.save:
             QMessageBox.warning(self, "Globals", "No file loaded.")
@@ -369,7 +795,7 @@ class MainWindow(QMainWindow):
             prestige = int(self.txt_prestige.text())
         except Exception:
             pass
-        update_globals_in_memory(self.save, credits, self.chk_sandbox.isChecked(), prestige)
+        save_loader.update_globals_in_memory(self.save, credits, self.chk_sandbox.isChecked(), prestige)
         QMessageBox.information(self, "Globals", "Global settings updated in memory. Use File -> Save to persist.")
 
     def _current_ship(self) -> Optional[Ship]:
@@ -384,23 +810,14 @@ class MainWindow(QMainWindow):
             self.lbl_owner.setText("Owner:")
             self.lbl_ship_size.setText("Size:")
             self.lbl_canvas_size.setText("Canvas Size:")
-            self.lst_crew.clear()
-            self.cmb_containers.clear()
-            self.tbl_storage.setRowCount(0)
+            self._ship_crew = []
+            self.crew_model.set_characters([])
+            self.current_containers = []
+            self._show_containers()
             return
         # Owner
         # Minimal owner view: pull <settings owner="..."> if present
-        owner = "Unknown"
-        try:
-            root = self.save.xml_doc.getroot() if self.save and self.save.xml_doc is not None else None
-            if root is not None:
-                ship_el = root.find(f".//ship[@sid='{ship.sid}']")
-                if ship_el is not None:
-                    settings = ship_el.find("settings")
-                    if settings is not None and settings.get("owner"):
-                        owner = settings.get("owner")
-        except Exception:
-            pass
+        owner = save_loader.get_ship_owner(self.save, ship.sid) or "Unknown"
         self.lbl_owner.setText(f"Owner: {owner}")
         self.lbl_ship_size.setText(f"Size: {ship.sx}x{ship.sy}")
         self.lbl_canvas_size.setText(f"Canvas Size: {ship.sx // 28} W x {ship.sy // 28} H squares")
@@ -408,25 +825,18 @@ class MainWindow(QMainWindow):
         self.spin_h.setValue(max(1, ship.sy // 28))
 
         # Crew list for ship
-        self.lst_crew.blockSignals(True)
-        self.lst_crew.clear()
-        if self.save:
-            ship_crew = [c for c in self.save.characters if c.ship_sid == ship.sid]
-            self.lst_crew.addItems([c.name for c in sorted(ship_crew, key=lambda c: c.name)])
-            self.lbl_crew_count.setText(f"Total Crew: {len(ship_crew)}")
-            # Store character references
-            for i, char in enumerate(sorted(ship_crew, key=lambda c: c.name)):
-                item = self.lst_crew.item(i)
-                if item:
-                    item.setData(Qt.UserRole, char.entity_id)
-        else:
-            self.lbl_crew_count.setText("Total Crew: 0")
-        self.lst_crew.blockSignals(False)
+        self._ship_crew = sorted((c for c in self.save.characters if c.ship_sid == ship.sid), key=lambda c: c.name)
         self.current_character = None
-        self._clear_crew_editors()
+        self._apply_crew_filter()
 
         # Storage containers
-        self.current_containers = load_storage_containers(self.save, ship.sid)
+        self.current_containers = save_loader.load_storage_containers(self.save, ship.sid)
+        self._show_containers()
+
+    def _show_containers(self) -> None:
+        """List the ship's containers on the Storage page, once it is built, and show the first."""
+        if self.cmb_containers is None:
+            return
         self.cmb_containers.blockSignals(True)
         self.cmb_containers.clear()
         for c in self.current_containers:
@@ -436,33 +846,25 @@ class MainWindow(QMainWindow):
             self.cmb_containers.setCurrentIndex(0)
             self._on_container_changed(0)
         else:
-            self.tbl_storage.setRowCount(0)
+            self.storage_model.set_container(None)
             self.lbl_total_items.setText("(No Items)")
 
     def _current_container(self) -> Optional[StorageContainer]:
-        if not self.current_containers or self.cmb_containers.currentIndex() < 0:
+        if not self.current_containers or self.cmb_containers is None or self.cmb_containers.currentIndex() < 0:
             return None
         return self.current_containers[self.cmb_containers.currentIndex()]
 
     def _on_container_changed(self, idx: int) -> None:
-        cont = self._current_container()
-        self.tbl_storage.blockSignals(True)
-        self.tbl_storage.setRowCount(0)
-        total = 0
-        if cont:
-            rows = len(cont.items)
-            self.tbl_storage.setRowCount(rows)
-            for r, it in enumerate(sorted(cont.items, key=lambda i: DefaultStorageIDs.get(i.element_id, str(i.element_id)))):
-                name = DefaultStorageIDs.get(it.element_id, f"Unknown Item ({it.element_id})")
-                self.tbl_storage.setItem(r, 0, QTableWidgetItem(name))
-                qty_item = QTableWidgetItem(str(it.quantity))
-                qty_item.setData(Qt.UserRole, it.element_id)
-                self.tbl_storage.setItem(r, 1, qty_item)
-                self.tbl_storage.setItem(r, 2, QTableWidgetItem(str(it.element_id)))
-                total += it.quantity
-        self.tbl_storage.blockSignals(False)
+        self.storage_model.set_container(self._current_container())
+        self._update_total_items()
+
+    def _update_total_items(self) -> None:
+        if self.lbl_total_items is None:
+            return
+        total = self.storage_model.total_quantity()
         self.lbl_total_items.setText(f"Total Items: {total}" if total > 0 else "(No Items)")
 
+    @_undo_step("Add Item")
     def _on_add_item(self) -> None:
         if not self.save:
             QMessageBox.warning(self, "Storage", "No file loaded.")
@@ -480,10 +882,12 @@ class MainWindow(QMainWindow):
         if qty <= 0:
             QMessageBox.warning(self, "Storage", "Quantity must be positive.")
             return
-        add_item_to_container(self.save, cont, item_id, qty)
-        self._on_container_changed(self.cmb_containers.currentIndex())
+        save_loader.add_item_to_container(self.save, cont, item_id, qty)
+        self.storage_model.reload()
+        self._update_total_items()
         QMessageBox.information(self, "Storage", "Item added/updated in memory. Use File -> Save to persist.")
 
+    @_undo_step("Delete Item")
     def _on_delete_selected(self) -> None:
         if not self.save:
             QMessageBox.warning(self, "Storage", "No file loaded.")
@@ -492,183 +896,134 @@ class MainWindow(QMainWindow):
         if not cont:
             QMessageBox.warning(self, "Storage", "Select a container first.")
             return
-        row = self.tbl_storage.currentRow()
-        if row < 0:
+        item_id = self.storage_model.item_id(self.tbl_storage.currentIndex().row())
+        if item_id is None:
             QMessageBox.warning(self, "Storage", "Select a row to delete.")
             return
-        try:
-            item_id = int(self.tbl_storage.item(row, 2).text())
-        except Exception:
-            return
-        delete_item_from_container(self.save, cont, item_id)
-        self._on_container_changed(self.cmb_containers.currentIndex())
+        save_loader.delete_item_from_container(self.save, cont, item_id)
+        self.storage_model.reload()
+        self._update_total_items()
 
-    def _on_storage_item_changed(self, item: QTableWidgetItem) -> None:
-        if item.column() != 1:
-            return
+    @_undo_step("Change Item Quantity")
+    def _on_storage_quantity_edited(self, item_id: int, qty: int) -> None:
         cont = self._current_container()
         if not self.save or not cont:
             return
-        try:
-            item_id = int(self.tbl_storage.item(item.row(), 2).text())
-            qty = int(item.text())
-        except Exception:
-            return
-        update_item_quantity(self.save, cont, item_id, qty)
-        self._on_container_changed(self.cmb_containers.currentIndex())
+        save_loader.update_item_quantity(self.save, cont, item_id, qty)
+        self._update_total_items()
 
+    @_undo_step("Update Ship Size")
     def _on_update_size(self) -> None:
         ship = self._current_ship()
         if not self.save or not ship:
             return
         w = self.spin_w.value()
         h = self.spin_h.value()
-        update_ship_size(self.save, ship, w, h)
+        save_loader.update_ship_size(self.save, ship, w, h)
         # Refresh labels
         self._on_ship_changed(self.cmb_ships.currentIndex())
 
+    def _apply_crew_filter(self) -> None:
+        """Show the selected ship's crew matching the filter box, keeping the selection if it still matches."""
+        text = self.txt_crew_filter.text()
+        if text.strip() and self.save:
+            matches = self._ensure_crew_index().search(text)
+            shown = [c for c in self._ship_crew if c.entity_id in matches]
+            self.lbl_crew_count.setText(f"Total Crew: {len(self._ship_crew)} ({len(shown)} shown)")
+        else:
+            shown = self._ship_crew
+            self.lbl_crew_count.setText(f"Total Crew: {len(self._ship_crew)}")
+        ent_id = self.current_character.entity_id if self.current_character else None
+        self.crew_model.set_characters(shown)
+        if not self._select_crew_member(ent_id):
+            self.current_character = None
+            self._clear_crew_editors()
+
+    def _ensure_crew_index(self) -> Optional[CrewIndex]:
+        if self.crew_index is None and self.save:
+            self.crew_index = CrewIndex(self.save.characters)
+        return self.crew_index
+
+    def _select_crew_member(self, ent_id: Optional[int]) -> bool:
+        row = self.crew_model.row_of(ent_id) if ent_id is not None else -1
+        if row < 0:
+            return False
+        self.lst_crew.setCurrentIndex(self.crew_model.index(row))
+        return True
+
+    def _index_current_crew_member(self) -> None:
+        """Keep the filter index in step after the current crew member's traits or conditions change."""
+        if self.crew_index is not None and self.current_character:
+            self.crew_index.add(self.current_character)
+
     def _current_crew_member(self) -> Optional[Character]:
         """Get the currently selected crew member."""
-        if not self.save or self.lst_crew.currentRow() < 0:
-            return None
-        item = self.lst_crew.currentItem()
-        if item is None:
+        if not self.save:
             return None
-        ent_id = item.data(Qt.UserRole)
-        return next((c for c in self.save.characters if c.entity_id == ent_id), None)
+        return self.crew_model.character(self.lst_crew.currentIndex().row())
 
     def _on_crew_selected(self, row: int) -> None:
         """Handle crew member selection."""
-        self.current_character = self._current_crew_member()
+        character = self._current_crew_member()
+        if character is not None and character is self.current_character:
+            # Reselected after the filter changed; the editors already show it
+            return
+        self.current_character = character
         if not self.current_character:
             self._clear_crew_editors()
             return
         
-        # Attributes
-        self.tbl_attributes.blockSignals(True)
-        self.tbl_attributes.setRowCount(0)
-        # Ensure all attributes exist (fill with defaults if missing)
-        attrs_to_show = []
-        for aid, name in sorted(DefaultAttributeIDs.items()):
-            attr = next((a for a in self.current_character.attributes if a.id == aid), None)
-            if attr:
-                attrs_to_show.append(attr)
-            else:
-                attrs_to_show.append(DataProp(id=aid, name=name, value=0))
-        self.tbl_attributes.setRowCount(len(attrs_to_show))
-        for r, attr in enumerate(attrs_to_show):
-            self.tbl_attributes.setItem(r, 0, QTableWidgetItem(str(attr.id)))
-            self.tbl_attributes.setItem(r, 1, QTableWidgetItem(attr.name))
-            val_item = QTableWidgetItem(str(attr.value))
-            val_item.setData(Qt.UserRole, attr.id)
-            self.tbl_attributes.setItem(r, 2, val_item)
-        self.tbl_attributes.blockSignals(False)
-        
-        # Skills
-        self.tbl_skills.blockSignals(True)
-        self.tbl_skills.setRowCount(0)
-        skills_to_show = []
-        for sid, name in sorted(DefaultSkillIDs.items()):
-            skill = next((s for s in self.current_character.skills if s.id == sid), None)
-            if skill:
-                skills_to_show.append(skill)
-            else:
-                skills_to_show.append(DataProp(id=sid, name=name, value=0))
-        self.tbl_skills.setRowCount(len(skills_to_show))
-        for r, skill in enumerate(skills_to_show):
-            self.tbl_skills.setItem(r, 0, QTableWidgetItem(str(skill.id)))
-            self.tbl_skills.setItem(r, 1, QTableWidgetItem(skill.name))
-            lvl_item = QTableWidgetItem(str(skill.value))
-            lvl_item.setData(Qt.UserRole, skill.id)
-            self.tbl_skills.setItem(r, 2, lvl_item)
-        self.tbl_skills.blockSignals(False)
-        
-        # Traits
+        self.attributes_model.set_props(self.current_character.attributes)
+        self.skills_model.set_props(self.current_character.skills)
+
+        self._show_traits()
+        self._show_conditions()
+        # Relationships
+        self.relationships_model.set_relationships(self.current_character.relationships)
+
+    def _show_traits(self) -> None:
+        """Fill the Traits page, once it is built, from the current crew member."""
+        if self.tbl_traits is None:
+            return
+        traits = self.current_character.traits if self.current_character else []
         self.tbl_traits.blockSignals(True)
-        self.tbl_traits.setRowCount(len(self.current_character.traits))
-        for r, trait in enumerate(self.current_character.traits):
+        self.tbl_traits.setRowCount(len(traits))
+        for r, trait in enumerate(traits):
             self.tbl_traits.setItem(r, 0, QTableWidgetItem(trait.name))
             self.tbl_traits.item(r, 0).setData(Qt.UserRole, trait.id)
         self.tbl_traits.blockSignals(False)
-        
-        # Conditions
+
+    def _show_conditions(self) -> None:
+        """Fill the Conditions page, once it is built, from the current crew member."""
+        if self.lst_conditions is None:
+            return
         self.lst_conditions.clear()
-        for cond in self.current_character.conditions:
+        for cond in self.current_character.conditions if self.current_character else []:
             item = QListWidgetItem(cond.name)
             item.setData(Qt.UserRole, cond.id)
             self.lst_conditions.addItem(item)
-        
-        # Relationships - load first page
-        self.relationships_page = 1
-        self._load_relationships_page()
 
     def _clear_crew_editors(self) -> None:
         """Clear all crew editing widgets."""
-        self.tbl_attributes.setRowCount(0)
-        self.tbl_skills.setRowCount(0)
-        self.tbl_traits.setRowCount(0)
-        self.lst_conditions.clear()
-        self.tbl_relationships.setRowCount(0)
-        self.lbl_rel_page.setText("Page 0 of 0")
-        self.btn_rel_prev.setEnabled(False)
-        self.btn_rel_next.setEnabled(False)
-
-    def _load_relationships_page(self) -> None:
-        """Load the current page of relationships."""
-        if not self.current_character:
-            return
-        rels = sorted(self.current_character.relationships, key=lambda r: r.target_name)
-        total = len(rels)
-        total_pages = max(1, (total + self.relationships_page_size - 1) // self.relationships_page_size)
-        self.relationships_page = max(1, min(self.relationships_page, total_pages))
-        
-        start = (self.relationships_page - 1) * self.relationships_page_size
-        end = start + self.relationships_page_size
-        page_rels = rels[start:end]
-        
-        self.tbl_relationships.blockSignals(True)
-        self.tbl_relationships.setRowCount(len(page_rels))
-        for r, rel in enumerate(page_rels):
-            self.tbl_relationships.setItem(r, 0, QTableWidgetItem(rel.target_name))
-            self.tbl_relationships.item(r, 0).setData(Qt.UserRole, rel.target_id)
-            self.tbl_relationships.item(r, 0).setFlags(Qt.ItemIsEnabled)  # Read-only
-            f_item = QTableWidgetItem(str(rel.friendship))
-            f_item.setData(Qt.UserRole, rel.target_id)
-            self.tbl_relationships.setItem(r, 1, f_item)
-            a_item = QTableWidgetItem(str(rel.attraction))
-            a_item.setData(Qt.UserRole, rel.target_id)
-            self.tbl_relationships.setItem(r, 2, a_item)
-            c_item = QTableWidgetItem(str(rel.compatibility))
-            c_item.setData(Qt.UserRole, rel.target_id)
-            self.tbl_relationships.setItem(r, 3, c_item)
-        self.tbl_relationships.blockSignals(False)
-        
-        self.lbl_rel_page.setText(f"Page {self.relationships_page} of {total_pages}")
-        self.btn_rel_prev.setEnabled(self.relationships_page > 1)
-        self.btn_rel_next.setEnabled(self.relationships_page < total_pages)
+        self.attributes_model.set_props(None)
+        self.skills_model.set_props(None)
+        self._show_traits()
+        self._show_conditions()
+        self.relationships_model.set_relationships([])
 
-    def _on_attribute_changed(self, item: QTableWidgetItem) -> None:
+    @_undo_step("Change Attribute")
+    def _on_attribute_edited(self, attr_id: int, value: int) -> None:
         """Handle attribute value change."""
-        if not self.save or not self.current_character or item.column() != 2:
-            return
-        try:
-            attr_id = item.data(Qt.UserRole)
-            value = int(item.text())
-        except Exception:
-            return
-        update_character_attribute(self.save, self.current_character, attr_id, value)
+        if self.save and self.current_character:
+            save_loader.update_character_attribute(self.save, self.current_character, attr_id, value)
 
-    def _on_skill_changed(self, item: QTableWidgetItem) -> None:
+    @_undo_step("Change Skill")
+    def _on_skill_edited(self, skill_id: int, level: int) -> None:
         """Handle skill level change."""
-        if not self.save or not self.current_character or item.column() != 2:
-            return
-        try:
-            skill_id = item.data(Qt.UserRole)
-            level = int(item.text())
-        except Exception:
-            return
-        update_character_skill(self.save, self.current_character, skill_id, level)
+        if self.save and self.current_character:
+            save_loader.update_character_skill(self.save, self.current_character, skill_id, level)
 
+    @_undo_step("Add Trait")
     def _on_add_trait(self) -> None:
         """Add a trait to the current character."""
         if not self.save or not self.current_character:
@@ -677,15 +1032,11 @@ class MainWindow(QMainWindow):
         trait_id = self.cmb_add_trait.currentData()
         if trait_id is None:
             return
-        add_character_trait(self.save, self.current_character, trait_id)
-        # Refresh traits table
-        self.tbl_traits.blockSignals(True)
-        self.tbl_traits.setRowCount(len(self.current_character.traits))
-        for r, trait in enumerate(self.current_character.traits):
-            self.tbl_traits.setItem(r, 0, QTableWidgetItem(trait.name))
-            self.tbl_traits.item(r, 0).setData(Qt.UserRole, trait.id)
-        self.tbl_traits.blockSignals(False)
+        save_loader.add_character_trait(self.save, self.current_character, trait_id)
+        self._index_current_crew_member()
+        self._show_traits()
 
+    @_undo_step("Delete Trait")
     def _on_delete_trait(self) -> None:
         """Delete the selected trait."""
         if not self.save or not self.current_character:
@@ -699,15 +1050,11 @@ class MainWindow(QMainWindow):
         if item is None:
             return
         trait_id = item.data(Qt.UserRole)
-        remove_character_trait(self.save, self.current_character, trait_id)
-        # Refresh
-        self.tbl_traits.blockSignals(True)
-        self.tbl_traits.setRowCount(len(self.current_character.traits))
-        for r, trait in enumerate(self.current_character.traits):
-            self.tbl_traits.setItem(r, 0, QTableWidgetItem(trait.name))
-            self.tbl_traits.item(r, 0).setData(Qt.UserRole, trait.id)
-        self.tbl_traits.blockSignals(False)
+        save_loader.remove_character_trait(self.save, self.current_character, trait_id)
+        self._index_current_crew_member()
+        self._show_traits()
 
+    @_undo_step("Delete Condition")
     def _on_delete_condition(self) -> None:
         """Delete the selected condition."""
         if not self.save or not self.current_character:
@@ -718,45 +1065,18 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Conditions", "Select a condition to delete.")
             return
         cond_id = item.data(Qt.UserRole)
-        remove_character_condition(self.save, self.current_character, cond_id)
+        save_loader.remove_character_condition(self.save, self.current_character, cond_id)
+        self._index_current_crew_member()
         # Refresh
         self.lst_conditions.takeItem(self.lst_conditions.currentRow())
 
-    def _on_relationship_changed(self, item: QTableWidgetItem) -> None:
+    @_undo_step("Change Relationship")
+    def _on_relationship_edited(self, target_id: int, field: str, value: int) -> None:
         """Handle relationship value change."""
-        if not self.save or not self.current_character or item.column() == 0:
-            return
-        try:
-            target_id = item.data(Qt.UserRole)
-            col = item.column()
-            if col == 1:  # Friendship
-                friendship = int(item.text())
-                update_character_relationship(self.save, self.current_character, target_id, friendship=friendship)
-            elif col == 2:  # Attraction
-                attraction = int(item.text())
-                update_character_relationship(self.save, self.current_character, target_id, attraction=attraction)
-            elif col == 3:  # Compatibility
-                compatibility = int(item.text())
-                update_character_relationship(self.save, self.current_character, target_id, compatibility=compatibility)
-        except Exception:
-            pass
-
-    def _on_rel_prev(self) -> None:
-        """Go to previous relationships page."""
-        if self.relationships_page > 1:
-            self.relationships_page -= 1
-            self._load_relationships_page()
-
-    def _on_rel_next(self) -> None:
-        """Go to next relationships page."""
-        if not self.current_character:
-            return
-        total = len(self.current_character.relationships)
-        total_pages = max(1, (total + self.relationships_page_size - 1) // self.relationships_page_size)
-        if self.relationships_page < total_pages:
-            self.relationships_page += 1
-            self._load_relationships_page()
+        if self.save and self.current_character:
+            save_loader.update_character_relationship(self.save, self.current_character, target_id, **{field: value})
 
+    @_undo_step("Set All Attributes")
     def _on_set_all_attributes(self) -> None:
         """Set all attributes to 5 for the current character."""
         if not self.save or not self.current_character:
@@ -764,15 +1084,10 @@ class MainWindow(QMainWindow):
             return
         # Set all known attributes to 5
         for attr_id in DefaultAttributeIDs.keys():
-            update_character_attribute(self.save, self.current_character, attr_id, 5)
-        # Refresh table
-        self.tbl_attributes.blockSignals(True)
-        for r in range(self.tbl_attributes.rowCount()):
-            item = self.tbl_attributes.item(r, 2)
-            if item:
-                item.setText("5")
-        self.tbl_attributes.blockSignals(False)
+            save_loader.update_character_attribute(self.save, self.current_character, attr_id, 5)
+        self.attributes_model.refresh_values()
 
+    @_undo_step("Set All Skills")
     def _on_set_all_skills(self) -> None:
         """Set all skills to 8 for the current character."""
         if not self.save or not self.current_character:
@@ -780,15 +1095,10 @@ class MainWindow(QMainWindow):
             return
         # Set all known skills to 8
         for skill_id in DefaultSkillIDs.keys():
-            update_character_skill(self.save, self.current_character, skill_id, 8)
-        # Refresh table
-        self.tbl_skills.blockSignals(True)
-        for r in range(self.tbl_skills.rowCount()):
-            item = self.tbl_skills.item(r, 2)
-            if item:
-                item.setText("8")
-        self.tbl_skills.blockSignals(False)
+            save_loader.update_character_skill(self.save, self.current_character, skill_id, 8)
+        self.skills_model.refresh_values()
 
+    @_undo_step("Create Crew Member")
     def _on_add_new_crew(self) -> None:
         """Open dialog to create a new crew member."""
         if not self.save:
@@ -802,10 +1112,12 @@ class MainWindow(QMainWindow):
         dlg = NewCrewDialog(self)
         if dlg.exec() == QDialog.Accepted:
             try:
-                create_new_crew_member(
+                character = save_loader.create_new_crew_member(
                     self.save, ship.sid, dlg.name,
                     dlg.attributes, dlg.skills, dlg.traits
                 )
+                if self.crew_index is not None:
+                    self.crew_index.add(character)
                 # Refresh crew list
                 self._on_ship_changed(self.cmb_ships.currentIndex())
                 QMessageBox.information(self, "Crew", f"Crew member '{dlg.name}' added (in memory). Use File -> Save to persist.")
@@ -816,9 +1128,12 @@ class MainWindow(QMainWindow):
         """Open settings dialog."""
         dlg = SettingsDialog(self)
         dlg.set_backup(self.backup_enabled)
+        dlg.set_cache(self.cache_enabled)
         if dlg.exec() == QDialog.Accepted:
             self.backup_enabled = dlg.backup_enabled()
-            QMessageBox.information(self, "Settings", f"Backup on open setting: {'Enabled' if self.backup_enabled else 'Disabled'}. Change takes effect next time you open a file.")
+            self.cache_enabled = dlg.cache_enabled()
+            QMessageBox.information(self, "Settings", f"Backup on open setting: {'Enabled' if self.backup_enabled else 'Disabled'}. "
+                                    f"Save cache: {'Enabled' if self.cache_enabled else 'Disabled'}. Change takes effect next time you open a file.")
 
     def _on_help(self) -> None:
         """Open help window."""
@@ -848,10 +1163,18 @@ class MainWindow(QMainWindow):
             "- Navigate to your save game folder. The typical path is:",
             "  Steam\\steamapps\\common\\SpaceHaven\\savegames\\[YourSaveGameName]\\save\\",
             "- Select the file named 'game' (it usually has no file extension).",
-            "- Backups: If enabled in Settings, a timestamped backup will be created",
-            "  automatically when opening saves.",
+            "- Backups: If enabled in Settings, the save folder is backed up automatically",
+            "  when opening saves, into savegames\\editor_backups. Unchanged saves are not",
+            "  stored twice, and the 10 most recent backups of each save are kept.",
             "- File -> Save: IMPORTANT! Click this after making edits to permanently write",
             "  your changes back to the 'game' file.",
+            "- Loading and saving run in the background with a progress bar in the status",
+            "  bar. Cancel stops them; a cancelled save leaves the file unchanged.",
+            "- File -> Compare With...: Lists what differs between the open save (with any",
+            "  unsaved edits) and another save, e.g. a backup or an autosave. Ships, crew",
+            "  and storage are matched by their IDs.",
+            "- Edit -> Undo / Redo (Ctrl+Z / Ctrl+Y): Step back and forth through your",
+            "  edits since the save was opened. Each button or table edit is one step.",
             "",
             "--- Editing Your Save ---",
             "- Global Settings (Top Section):",
@@ -868,6 +1191,8 @@ class MainWindow(QMainWindow):
             "",
             "--- Crew Tab Details ---",
             "- Crew List (Left): Select a crew member. The list shows names; total count is above.",
+            "- Filter box (above the list): Type to narrow the list to crew whose name, traits or",
+            "      conditions contain every word typed, e.g. 'fast jo' or 'wounded'.",
             "- Create New Crew Member: Button below the list opens a window to add a new character.",
             "- Editing Tabs (Right - Attributes, Skills, Traits, Conditions, Relationships):",
             "  - Attributes/Skills: Double-click a cell in the 'Value' or 'Level' column to edit.",
@@ -1004,7 +1329,7 @@ class NewCrewDialog(QDialog):
         if any(t.id == tid for t in self.traits_list):
             return
         name = DefaultTraitIDs[tid]
-        self.traits_list.append(DataProp(id=tid, name=name))
+        self.traits_list.append(models.DataProp(id=tid, name=name))
         self._refresh_traits_list()
     
     def _remove_trait(self) -> None:
@@ -1065,7 +1390,7 @@ class NewCrewDialog(QDialog):
                 aid = item.data(Qt.UserRole)
                 name_item = self.tbl_attrs.item(r, 1)
                 name = name_item.text() if name_item else f"Attr {aid}"
-                attrs.append(DataProp(id=aid, name=name, value=int(item.text())))
+                attrs.append(models.DataProp(id=aid, name=name, value=int(item.text())))
         return attrs
     
     @property
@@ -1077,7 +1402,7 @@ class NewCrewDialog(QDialog):
                 sid = item.data(Qt.UserRole)
                 name_item = self.tbl_skills.item(r, 1)
                 name = name_item.text() if name_item else f"Skill {sid}"
-                skills.append(DataProp(id=sid, name=name, value=int(item.text())))
+                skills.append(models.DataProp(id=sid, name=name, value=int(item.text())))
         return skills
     
     @property
@@ -1094,6 +1419,8 @@ class SettingsDialog(QDialog):
         layout = QVBoxLayout(self)
         self.chk_backup = QCheckBox("Enable automatic backup when opening saves")
         layout.addWidget(self.chk_backup)
+        self.chk_cache = QCheckBox("Cache opened saves for faster reopening (writes game.editcache next to the save)")
+        layout.addWidget(self.chk_cache)
         
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         buttons.accepted.connect(self.accept)
@@ -1106,6 +1433,12 @@ class SettingsDialog(QDialog):
     def backup_enabled(self) -> bool:
         return self.chk_backup.isChecked()
 
+    def set_cache(self, enabled: bool) -> None:
+        self.chk_cache.setChecked(enabled)
+
+    def cache_enabled(self) -> bool:
+        return self.chk_cache.isChecked()
+
 
 class HelpDialog(QDialog):
     def __init__(self, help_text: str, parent=None) -> None:
@@ -1124,6 +1457,25 @@ class HelpDialog(QDialog):
         layout.addWidget(buttons)
 
 
+class DiffDialog(QDialog):
+    def __init__(self, report: str, parent=None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Compare Saves")
+        self.resize(900, 600)
+
+        layout = QVBoxLayout(self)
+        text = QTextEdit()
+        text.setReadOnly(True)
+        text.setLineWrapMode(QTextEdit.NoWrap)
+        text.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        text.setPlainText(report)
+        layout.addWidget(text)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok)
+        buttons.accepted.connect(self.accept)
+        layout.addWidget(buttons)
+
+
 class AboutDialog(QDialog):
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
@@ -1144,9 +1496,59 @@ class AboutDialog(QDialog):
         layout.addWidget(buttons)
 
 
+class _StartupProfiler(QObject):
+    """Prints the --profile-startup breakdown once the main window has painted."""
+
+    def __init__(self, window: MainWindow, marks: List[Tuple[str, float]]) -> None:
+        super().__init__(window)
+        self._window = window
+        self._marks = marks
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event) -> bool:
+        if event.type() == QEvent.Paint:
+            self._window.removeEventFilter(self)
+            # Report once this paint, and the child widgets' in the same pass, are done
+            QTimer.singleShot(0, self._report)
+        return False
+
+    def _report(self) -> None:
+        self._marks.append(("show and first paint", time.perf_counter()))
+        report = startup_report(self._marks)
+        # Windowed builds have no console (print is then a no-op), so show the total too
+        print(report, flush=True)
+        self._window.statusBar().showMessage(
+            f"Startup: {(self._marks[-1][1] - _STARTED) * 1000:.0f} ms to first paint", 10000)
+
+
+def startup_report(marks: List[Tuple[str, float]]) -> str:
+    """Time of each startup phase (label, finished at) since main.py started, and the deferred imports so far."""
+    lines = ["Startup profile (ms)"]
+    previous = _STARTED
+    for label, finished in marks:
+        lines.append(f"  {label:<28}{(finished - previous) * 1000:8.1f}")
+        previous = finished
+    lines.append(f"  {'total to first paint':<28}{(previous - _STARTED) * 1000:8.1f}")
+    lines.append("Imported on first use:")
+    for name, started, finished in _deferred_imports:
+        lines.append(f"  {name:<28}{(finished - started) * 1000:8.1f}  at {(started - _STARTED) * 1000:.1f}"
+                     + ("  (before first paint)" if started < previous else ""))
+    if not _deferred_imports:
+        lines.append("  (none yet; opening a save imports the loader)")
+    return "\n".join(lines)
+
+
 def main() -> None:
+    profile = "--profile-startup" in sys.argv
+    if profile:
+        sys.argv.remove("--profile-startup")
+    marks = [("import PySide6", _QT_IMPORTED), ("import editor modules", _IMPORTED)]
     app = QApplication(sys.argv)
+    marks.append(("create QApplication", time.perf_counter()))
     win = MainWindow()
+    marks.append(("build main window", time.perf_counter()))
+    # Held here: PySide would otherwise collect the Python side of the event filter
+    profiler = _StartupProfiler(win, marks) if profile else None
     win.show()
     sys.exit(app.exec())
 
@@ -1,9 +1,16 @@
 from __future__ import annotations
+import threading
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+try:
+    from .journal import EditJournal
+except ImportError:
+    # Fallback for when running as standalone (PyInstaller)
+    from journal import EditJournal
 
-@dataclass
+
+@dataclass(slots=True)
 class DataProp:
     id: int
     name: str
@@ -11,7 +18,7 @@ class DataProp:
     max_value: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RelationshipInfo:
     target_id: int
     target_name: str
@@ -20,7 +27,7 @@ class RelationshipInfo:
     compatibility: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Character:
     name: str
     entity_id: int
@@ -33,7 +40,7 @@ class Character:
     relationships: List[RelationshipInfo] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageItem:
     element_id: int
     quantity: int
@@ -46,6 +53,9 @@ class StorageContainer:
     items: List[StorageItem] = field(default_factory=list)
     parent_ent_id: Optional[int] = None
     parent_obj_id: Optional[str] = None
+    ship_sid: Optional[int] = None
+    inv_element: Optional[object] = None  # the <inv> under feat_element
+    item_index: Dict[int, list] = field(default_factory=dict)  # elementaryId -> [<s> element, StorageItem or None]
 
 
 @dataclass
@@ -67,5 +77,30 @@ class SaveData:
     characters: List[Character] = field(default_factory=list)
     current_ship_sid: Optional[int] = None
     xml_doc: Optional[object] = None  # lxml.etree._ElementTree
+    lazy_models: bool = False  # ships/characters/containers are element_views instead of copies
+    character_index: Dict[int, Character] = field(default_factory=dict)  # entId -> Character
+    character_elements: Dict[int, object] = field(default_factory=dict)  # entId -> <c> lxml element
+    ship_elements: Dict[int, object] = field(default_factory=dict)  # sid -> <ship> lxml element
+    storage_cache: Dict[int, List[StorageContainer]] = field(default_factory=dict)  # sid -> containers
+    ship_owners: Dict[int, Optional[str]] = field(default_factory=dict)  # sid -> owner, for saves restored from save_cache
+    journal: EditJournal = field(default_factory=EditJournal, repr=False, compare=False)
+    # Guards storage_cache and the tree: the journal holds it for every change, the storage prefetch while it reads
+    storage_lock: threading.RLock = field(default_factory=threading.RLock, repr=False, compare=False)
+    file_size: int = 0
+    load_seconds: float = 0.0
+    # The file the tree currently matches byte-for-byte apart from journaled edits (see splice_writer)
+    source_path: Optional[str] = None
+    source_size: int = 0
+    source_mtime_ns: int = 0
+
+    def __post_init__(self) -> None:
+        self.journal.lock = self.storage_lock
+
+    @property
+    def load_throughput_mb_s(self) -> float:
+        """Parse throughput of the last load in MB/s (0 if not measured)."""
+        if self.load_seconds <= 0:
+            return 0.0
+        return self.file_size / (1024 * 1024) / self.load_seconds
 
 
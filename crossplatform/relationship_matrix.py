@@ -0,0 +1,165 @@
+from __future__ import annotations
+from typing import Dict, List, Optional, Tuple
+
+# NumPy is an optional dependency, only needed for bulk relationship editing
+import numpy as np
+from lxml import etree
+
+try:
+    from .models import SaveData, Character, RelationshipInfo
+    from .element_views import CharacterView, relationship_target_name
+except ImportError:
+    # Fallback for when running as standalone (PyInstaller)
+    from models import SaveData, Character, RelationshipInfo
+    from element_views import CharacterView, relationship_target_name
+
+
+FIELDS = ("friendship", "attraction", "compatibility")
+
+
+class RelationshipMatrix:
+    """Friendship, attraction and compatibility of a ship's crew as N x N arrays.
+
+    Row i holds what crew member i feels about each crew member j, in the order
+    of entity_ids. Edit the arrays directly or with the helpers below, then call
+    write_back() to push changed cells to the <l> elements and the in-memory
+    models in a single pass. Relationships with characters on other ships are
+    not included.
+    """
+
+    def __init__(self, save: SaveData, ship_sid: int) -> None:
+        self.save = save
+        self.ship_sid = ship_sid
+        self.crew: List[Character] = [c for c in save.characters if c.ship_sid == ship_sid]
+        self.entity_ids: List[int] = [c.entity_id for c in self.crew]
+        self.positions: Dict[int, int] = {ent: i for i, ent in enumerate(self.entity_ids)}
+        n = len(self.crew)
+        self.friendship = np.zeros((n, n), dtype=np.int32)
+        self.attraction = np.zeros((n, n), dtype=np.int32)
+        self.compatibility = np.zeros((n, n), dtype=np.int32)
+        # True where an <l> element exists for the pair
+        self.present = np.zeros((n, n), dtype=bool)
+        # Missing pairs that set_all(include_missing=True) asked to create, even with unchanged values
+        self._create = np.zeros((n, n), dtype=bool)
+        self._elements: Dict[Tuple[int, int], object] = {}
+
+        for i, ch in enumerate(self.crew):
+            rels = self._relationships_element(ch, create=False)
+            if rels is None:
+                continue
+            for le in rels.iterchildren("l"):
+                try:
+                    j = self.positions.get(int(le.get("targetId", "0")))
+                    values = [int(le.get(name, "0")) for name in FIELDS]
+                except ValueError:
+                    continue
+                if j is None or (i, j) in self._elements:
+                    continue
+                self.friendship[i, j], self.attraction[i, j], self.compatibility[i, j] = values
+                self.present[i, j] = True
+                self._elements[(i, j)] = le
+        self._snapshot = {name: getattr(self, name).copy() for name in FIELDS}
+
+    def __len__(self) -> int:
+        return len(self.crew)
+
+    def set_all(self, field: str, value: int, include_missing: bool = False) -> None:
+        """Set one field for every pair, e.g. set_all("friendship", 100).
+
+        By default only existing relationships are changed; include_missing also
+        creates relationships between crew members who have none yet.
+        """
+        arr = self._field(field)
+        if include_missing:
+            mask = ~self.present
+            np.fill_diagonal(mask, False)
+            self._create |= mask
+        arr[self.present | self._create] = value
+
+    def clamp(self, low: Optional[int] = None, high: Optional[int] = None, fields: Tuple[str, ...] = FIELDS) -> None:
+        """Clamp existing relationship values into [low, high], e.g. clamp(low=0) to drop negatives."""
+        if low is None and high is None:
+            return
+        for name in fields:
+            arr = self._field(name)
+            arr[self.present] = np.clip(arr[self.present], low, high)
+
+    def changed_pairs(self) -> np.ndarray:
+        """(i, j) index pairs whose values differ from the save, as an array of shape (k, 2)."""
+        changed = self._create & ~self.present
+        for name in FIELDS:
+            changed |= getattr(self, name) != self._snapshot[name]
+        np.fill_diagonal(changed, False)
+        return np.argwhere(changed)
+
+    def write_back(self) -> int:
+        """Write every changed cell to the XML and the models; returns the number of pairs written.
+
+        Raises ValueError, writing nothing, if a relationship has to be created for a
+        character without a <pers> element; changed_pairs() still lists every change.
+        """
+        pairs = self.changed_pairs()
+        missing = sorted({self.entity_ids[i] for i, j in pairs.tolist()
+                          if (i, j) not in self._elements and self._pers(self.crew[i]) is None})
+        if missing:
+            raise ValueError(f"Cannot add relationships for entId {', '.join(map(str, missing))}: "
+                             f"no <pers> element. Nothing was written.")
+        model_rels: Dict[int, Dict[int, RelationshipInfo]] = {}
+        for i, j in pairs.tolist():
+            ch = self.crew[i]
+            target_id = self.entity_ids[j]
+            values = [int(getattr(self, name)[i, j]) for name in FIELDS]
+
+            le = self._elements.get((i, j))
+            if le is None:
+                rels = self._relationships_element(ch, create=True)
+                le = etree.Element("l")
+                le.set("targetId", str(target_id))
+                self.save.journal.append(rels, le)
+                self._elements[(i, j)] = le
+                self.present[i, j] = True
+            for name, value in zip(FIELDS, values):
+                self.save.journal.set(le, name, str(value))
+
+            # Lazy views that have not read their relationships yet will pick the change up from the XML
+            if isinstance(ch, CharacterView) and not ch.section_loaded("relationships"):
+                continue
+            by_target = model_rels.get(i)
+            if by_target is None:
+                by_target = model_rels[i] = {r.target_id: r for r in ch.relationships}
+            rel = by_target.get(target_id)
+            if rel is None:
+                rel = RelationshipInfo(target_id, relationship_target_name(self.save.character_index, target_id), *values)
+                ch.relationships.append(rel)
+                by_target[target_id] = rel
+            else:
+                rel.friendship, rel.attraction, rel.compatibility = values
+
+        self._snapshot = {name: getattr(self, name).copy() for name in FIELDS}
+        self._create[:] = False
+        return len(pairs)
+
+    def _field(self, name: str) -> np.ndarray:
+        if name not in FIELDS:
+            raise ValueError(f"Unknown relationship field '{name}'. Expected one of: {', '.join(FIELDS)}")
+        return getattr(self, name)
+
+    def _pers(self, ch: Character):
+        char_el = self.save.character_elements.get(ch.entity_id)
+        return char_el.find("pers") if char_el is not None else None
+
+    def _relationships_element(self, ch: Character, create: bool):
+        pers = self._pers(ch)
+        if pers is None:
+            return None
+        sociality = pers.find("sociality")
+        if sociality is None:
+            if not create:
+                return None
+            sociality = etree.Element("sociality")
+            self.save.journal.append(pers, sociality)
+        relationships = sociality.find("relationships")
+        if relationships is None and create:
+            relationships = etree.Element("relationships")
+            self.save.journal.append(sociality, relationships)
+        return relationships
@@ -0,0 +1,172 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+import struct
+import sys
+import zlib
+from typing import Optional, Tuple
+
+try:
+    from .models import SaveData, Ship, Character, DataProp, RelationshipInfo, StorageContainer, StorageItem
+    from .save_loader import load_storage_containers, get_ship_owner
+    from .element_views import (
+        read_skills,
+        read_traits,
+        read_attributes,
+        read_conditions,
+        read_relationships,
+        relationship_target_name,
+        display_name,
+        LazySection,
+    )
+    from .id_collections import DefaultSkillIDs, DefaultTraitIDs, DefaultAttributeIDs, ConditionsIDs
+    from .sidecars import CACHE_SUFFIX
+except ImportError:
+    # Fallback for when running as standalone (PyInstaller)
+    from models import SaveData, Ship, Character, DataProp, RelationshipInfo, StorageContainer, StorageItem
+    from save_loader import load_storage_containers, get_ship_owner
+    from element_views import (
+        read_skills,
+        read_traits,
+        read_attributes,
+        read_conditions,
+        read_relationships,
+        relationship_target_name,
+        display_name,
+        LazySection,
+    )
+    from id_collections import DefaultSkillIDs, DefaultTraitIDs, DefaultAttributeIDs, ConditionsIDs
+    from sidecars import CACHE_SUFFIX
+
+
+# Opt-in sidecar cache of the models extracted from a save, written next to it
+# as "<save>.editcache". A cached SaveData has no xml_doc: it is for showing the
+# save while the real tree loads, not for editing.
+#
+# The payload is zlib-compressed JSON of plain lists and numbers. Saves (and so
+# their sidecars) get shared, so the cache must not be able to run code when
+# read, as unpickling could; anything malformed is treated as a cache miss.
+
+_MAGIC = b"SHEC"
+_VERSION = 2
+# magic, format version, size, mtime_ns, blake2b digest
+_HEADER = struct.Struct("<4sBqq32s")
+
+
+class CachedCharacter(Character):
+    """Character restored from the cache; relationships, by far the bulk of a save, are built on first access."""
+
+    __slots__ = ("_cached_relationships", "_index", "_relationships")
+
+    relationships = LazySection(lambda self: [
+        RelationshipInfo(t, relationship_target_name(self._index, t), f, a, c)
+        for t, f, a, c in zip(*[iter(self._cached_relationships)] * 4)
+    ])
+
+
+def cache_path(save_path: str) -> str:
+    return save_path + CACHE_SUFFIX
+
+
+def file_digest(path: str) -> bytes:
+    h = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.digest()
+
+
+def _file_key(path: str) -> Tuple[int, int]:
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+
+def write_cache(save: SaveData) -> str:
+    """Write the sidecar cache for a freshly loaded save; returns the cache path.
+
+    Character sections are read straight from the elements, so lazy views are
+    left untouched.
+    """
+    assert save.xml_doc is not None
+    size, mtime_ns = _file_key(save.path)
+    ships = [(s.sid, s.sname, s.sx, s.sy, get_ship_owner(save, s.sid)) for s in save.ships]
+    characters = []
+    for c in save.characters:
+        char_el = save.character_elements.get(c.entity_id)
+        pers = char_el.find("pers") if char_el is not None else None
+        characters.append((
+            c.name, c.entity_id, c.ship_sid,
+            [(s.id, s.value) for s in read_skills(pers)],
+            [t.id for t in read_traits(pers)],
+            [(a.id, a.value) for a in read_attributes(pers)],
+            [cond.id for cond in read_conditions(pers)],
+            # Flattened to (target, friendship, attraction, compatibility) runs: one list of numbers decodes
+            # several times faster than thousands of four-item lists
+            [v for r in read_relationships(pers) for v in (r.target_id, r.friendship, r.attraction, r.compatibility)],
+        ))
+    # A list of pairs rather than a dict: JSON object keys would turn the sids into strings
+    storage = [
+        (s.sid, [(cont.display_name, cont.parent_ent_id, cont.parent_obj_id,
+                  [(i.element_id, i.quantity) for i in cont.items])
+                 for cont in load_storage_containers(save, s.sid)])
+        for s in save.ships
+    ]
+    payload = (save.credits, save.sandbox, save.prestige_points, ships, characters, storage)
+    header = _HEADER.pack(_MAGIC, _VERSION, size, mtime_ns, file_digest(save.path))
+    target = cache_path(save.path)
+    tmp = target + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(header)
+        f.write(zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"), 6))
+    os.replace(tmp, target)
+    return target
+
+
+def load_cached(path: str) -> Optional[SaveData]:
+    """SaveData restored from the sidecar cache, or None if there is none, it is malformed or the save has changed."""
+    try:
+        with open(cache_path(path), "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                return None
+            magic, version, size, mtime_ns, digest = _HEADER.unpack(header)
+            if (magic, version) != (_MAGIC, _VERSION):
+                return None
+            if (size, mtime_ns) != _file_key(path) or digest != file_digest(path):
+                return None
+            payload = json.loads(zlib.decompress(f.read()))
+        return _restore(path, size, payload)
+    except (OSError, zlib.error, ValueError, TypeError, KeyError, IndexError, AttributeError):
+        return None
+
+
+def _restore(path: str, size: int, payload) -> SaveData:
+    credits, sandbox, prestige, ships, characters, storage = payload
+    save = SaveData(path=path, credits=credits, sandbox=sandbox, prestige_points=prestige, file_size=size)
+    for sid, sname, sx, sy, owner in ships:
+        save.ships.append(Ship(sid=sid, sname=sname, sx=sx, sy=sy))
+        save.ship_owners[sid] = owner
+    for name, ent_id, ship_sid, skills, traits, attrs, conds, rels in characters:
+        ch = CachedCharacter(
+            name=sys.intern(name), entity_id=ent_id, ship_sid=ship_sid,
+            skills=[DataProp(id=k, name=display_name(DefaultSkillIDs, k, "Skill"), value=v) for k, v in skills],
+            traits=[DataProp(id=t, name=display_name(DefaultTraitIDs, t, "Trait")) for t in traits],
+            attributes=[DataProp(id=a, name=display_name(DefaultAttributeIDs, a, "Attr"), value=v) for a, v in attrs],
+            # Like the loader, leave out condition ids this version does not know
+            conditions=[DataProp(id=c, name=ConditionsIDs[c]) for c in conds if c in ConditionsIDs],
+        )
+        # The dataclass __init__ stored an empty list; clear it so the first access builds the real one
+        ch._relationships = None
+        ch._cached_relationships = rels
+        ch._index = save.character_index
+        save.characters.append(ch)
+        save.character_index[ent_id] = ch
+    for sid, containers in storage:
+        save.storage_cache[sid] = [
+            StorageContainer(display_name=name, feat_element=None,
+                             items=[StorageItem(element_id=e, quantity=q) for e, q in items],
+                             parent_ent_id=ent_id, parent_obj_id=obj_id, ship_sid=sid)
+            for name, ent_id, obj_id, items in containers
+        ]
+    return save
@@ -0,0 +1,200 @@
+from __future__ import annotations
+import hashlib
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union
+from lxml import etree
+
+try:
+    from .models import SaveData
+    from .save_loader import ProgressCallback, ProgressFile
+except ImportError:
+    # Fallback for when running as standalone (PyInstaller)
+    from models import SaveData
+    from save_loader import ProgressCallback, ProgressFile
+
+
+# Structural diff between two saves, e.g. an autosave and a backup. Elements are
+# matched by identity rather than position: ships by sid, crew and other
+# entities by entId, storage stacks by elementaryId, relationships by targetId,
+# skills by sk and traits, attributes and conditions by id (see _KEY_ATTRIBUTES).
+# Other elements are matched by tag and position among their siblings. Matched
+# subtrees whose serialized bytes hash the same are skipped without being
+# walked, so the cost follows the size of what changed, not of the save.
+
+_KEY_ATTRIBUTES: Dict[str, Tuple[str, ...]] = {
+    "ship": ("sid",),
+    "c": ("entId", "id"),
+    "e": ("entId",),
+    "s": ("elementaryId", "sk"),
+    "l": ("targetId",),
+}
+_DEFAULT_KEY_ATTRIBUTES = ("entId", "id")
+# Shown next to the key so ships and crew are recognizable in the report
+_NAME_ATTRIBUTES = ("sname", "name")
+
+
+@dataclass
+class Change:
+    kind: str  # "added", "removed" or "changed"
+    path: str
+    attribute: Optional[str] = None  # "#text" for element text
+    old: Optional[str] = None
+    new: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self.kind == "added":
+            return f"+ {self.path}"
+        if self.kind == "removed":
+            return f"- {self.path}"
+        return f"~ {self.path} @{self.attribute}: {_show(self.old)} -> {_show(self.new)}"
+
+
+@dataclass
+class SaveDiff:
+    old_path: str
+    new_path: str
+    changes: List[Change] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def report(self, limit: Optional[int] = None) -> str:
+        """One line per change (at most limit of them) and a summary line."""
+        counts = {kind: sum(1 for c in self.changes if c.kind == kind) for kind in ("added", "removed", "changed")}
+        lines = [str(c) for c in self.changes[:limit]]
+        if limit is not None and len(self.changes) > limit:
+            lines.append(f"... {len(self.changes) - limit} more")
+        lines.append(f"{len(self.changes)} difference(s): {counts['added']} added, {counts['removed']} removed, "
+                     f"{counts['changed']} changed ({self.seconds:.2f}s)")
+        return "\n".join(lines)
+
+
+def diff_saves(old: Union[str, SaveData], new: Union[str, SaveData],
+               progress: Optional[ProgressCallback] = None) -> SaveDiff:
+    """Compare two saves, given as file paths or loaded SaveData (whose in-memory tree is used).
+
+    progress, if given, reports the bytes read while parsing the files.
+    """
+    started = time.perf_counter()
+    sources = [s for s in (old, new) if not isinstance(s, SaveData)]
+    total = sum(os.path.getsize(s) for s in sources)
+    done = [0]
+
+    def root_of(source: Union[str, SaveData]):
+        if isinstance(source, SaveData):
+            if source.xml_doc is None:
+                raise ValueError("The save has not finished loading.")
+            return source.xml_doc.getroot()
+        if progress is None:
+            return etree.parse(source).getroot()
+        offset = done[0]
+        with open(source, "rb") as f:
+            root = etree.parse(ProgressFile(f, total, lambda n, _t: progress(offset + n, total))).getroot()
+        done[0] += os.path.getsize(source)
+        return root
+
+    result = SaveDiff(old_path=_path_of(old), new_path=_path_of(new))
+    if len(sources) == 2 and _same_file_contents(old, new):
+        result.seconds = time.perf_counter() - started
+        return result
+    old_root, new_root = root_of(old), root_of(new)
+    if old_root.tag != new_root.tag:
+        result.changes.append(Change("changed", "", "#tag", old_root.tag, new_root.tag))
+    else:
+        _diff_elements(old_root, new_root, old_root.tag, result.changes)
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+def _path_of(source: Union[str, SaveData]) -> str:
+    return source.path if isinstance(source, SaveData) else source
+
+
+def _show(value: Optional[str]) -> str:
+    return "(none)" if value is None else f'"{value}"'
+
+
+def _same_file_contents(a: str, b: str) -> bool:
+    if os.path.getsize(a) != os.path.getsize(b):
+        return False
+    digests = []
+    for path in (a, b):
+        h = hashlib.blake2b(digest_size=32)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(chunk)
+        digests.append(h.digest())
+    return digests[0] == digests[1]
+
+
+def _digest(el) -> bytes:
+    return hashlib.blake2b(etree.tostring(el, with_tail=False), digest_size=16).digest()
+
+
+def _keyed_children(el) -> Dict[tuple, object]:
+    """Element children by match key: (tag, key attribute, value, n), the n-th child with that identity."""
+    children: Dict[tuple, object] = {}
+    seen: Dict[tuple, int] = {}
+    for child in el:
+        if not isinstance(child.tag, str):
+            continue  # comments and processing instructions
+        attrs = _KEY_ATTRIBUTES.get(child.tag, _DEFAULT_KEY_ATTRIBUTES)
+        name = next((a for a in attrs if child.get(a) is not None), None)
+        identity = (child.tag, name, child.get(name) if name else None)
+        n = seen.get(identity, 0)
+        seen[identity] = n + 1
+        children[identity + (n,)] = child
+    return children
+
+
+def _label(key: tuple, el, repeated: bool) -> str:
+    tag, name, value, n = key
+    if name is None:
+        return f"{tag}[{n + 1}]" if repeated else tag
+    label = f"{tag}[{name}={value}"
+    display = next((el.get(a) for a in _NAME_ATTRIBUTES if el.get(a)), None)
+    if display:
+        label += f' "{display}"'
+    return label + (f" #{n + 1}]" if n else "]")
+
+
+def _diff_elements(old, new, path: str, out: List[Change]) -> None:
+    changes_before = len(out)
+    for key, value in old.attrib.items():
+        if new.get(key) != value:
+            out.append(Change("changed", path, key, value, new.get(key)))
+    for key, value in new.attrib.items():
+        if key not in old.attrib:
+            out.append(Change("changed", path, key, None, value))
+    if (old.text or "").strip() != (new.text or "").strip():
+        out.append(Change("changed", path, "#text", old.text, new.text))
+
+    old_children = _keyed_children(old)
+    new_children = _keyed_children(new)
+    # Unkeyed tags that occur more than once get a position in their label
+    repeated = {k[0] for k in list(old_children) + list(new_children) if k[1] is None and k[3] > 0}
+    # old and new differ (that is why we are here). If their attributes, text and child keys
+    # match, the difference is in some child pair, so when all other pairs hash equal, the
+    # remaining one need not be hashed. Leave the child with the most children for last,
+    # which skips hashing e.g. <ships> inside <game>.
+    deferred = None
+    if len(out) == changes_before and old_children.keys() == new_children.keys() and old_children:
+        deferred = max(old_children, key=lambda k: len(old_children[k]))
+    found: Dict[tuple, List[Change]] = {}
+    for key, child in old_children.items():
+        other = new_children.get(key)
+        if other is None:
+            found[key] = [Change("removed", f"{path}/{_label(key, child, key[0] in repeated)}")]
+        elif key != deferred and _digest(child) != _digest(other):
+            found[key] = []
+            _diff_elements(child, other, f"{path}/{_label(key, child, key[0] in repeated)}", found[key])
+    if deferred is not None:
+        child, other = old_children[deferred], new_children[deferred]
+        if not found or _digest(child) != _digest(other):
+            found[deferred] = []
+            _diff_elements(child, other, f"{path}/{_label(deferred, child, deferred[0] in repeated)}", found[deferred])
+    for key in old_children:
+        out.extend(found.get(key, ()))
+    for key, child in new_children.items():
+        if key not in old_children:
+            out.append(Change("added", f"{path}/{_label(key, child, key[0] in repeated)}"))
@@ -1,26 +1,178 @@
 from __future__ import annotations
-from typing import List, Optional
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Set
 from lxml import etree
 
 try:
     from .models import SaveData, Ship, Character, DataProp, RelationshipInfo, StorageContainer, StorageItem
-    from .id_collections import DefaultSkillIDs, DefaultTraitIDs, DefaultAttributeIDs, DefaultStorageIDs, ConditionsIDs
+    from .id_collections import DefaultSkillIDs, DefaultTraitIDs, DefaultAttributeIDs, DefaultStorageIDs
+    from .element_views import (
+        CharacterView, ShipView, StorageContainerView, read_skills, read_traits, read_attributes, read_conditions,
+        read_relationships, read_inventory, has_storage_items, relationship_target_name, display_name,
+    )
+    from .splice_writer import splice_to_disk
 except ImportError:
     # Fallback for when running as standalone (PyInstaller)
     from models import SaveData, Ship, Character, DataProp, RelationshipInfo, StorageContainer, StorageItem
-    from id_collections import DefaultSkillIDs, DefaultTraitIDs, DefaultAttributeIDs, DefaultStorageIDs, ConditionsIDs
+    from id_collections import DefaultSkillIDs, DefaultTraitIDs, DefaultAttributeIDs, DefaultStorageIDs
+    from element_views import (
+        CharacterView, ShipView, StorageContainerView, read_skills, read_traits, read_attributes, read_conditions,
+        read_relationships, read_inventory, has_storage_items, relationship_target_name, display_name,
+    )
+    from splice_writer import splice_to_disk
+
+
+# progress(done, total) is called with the bytes read or written so far; raising
+# OperationCancelled from it aborts the load or save
+ProgressCallback = Callable[[int, int], None]
+
+
+class OperationCancelled(Exception):
+    """Raised by a progress callback to abort load_save or save_to_disk."""
+
+
+class ProgressFile:
+    """Binary file wrapper that reports the bytes read or written through a progress callback."""
+
+    def __init__(self, f, total: int, progress: ProgressCallback) -> None:
+        self._f = f
+        self._total = total
+        self._progress = progress
+        self._done = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._f.read(size)
+        self._done += len(data)
+        self._progress(self._done, self._total)
+        return data
+
+    def write(self, data: bytes) -> int:
+        n = self._f.write(data)
+        self._done += len(data)
+        self._progress(self._done, self._total)
+        return n
+
+
+def load_save(path: str, streaming: bool = False, lazy: bool = False,
+              progress: Optional[ProgressCallback] = None) -> SaveData:
+    """Load a save file into a SaveData model.
 
+    With streaming=True the document is read with a single forward iterparse
+    pass that builds the models as each <ship> and <c> element completes,
+    instead of parsing first and searching the finished tree afterwards.
+    Either way the load time and file size are recorded on the SaveData so
+    throughput can be compared between the two paths.
 
-def load_save(path: str) -> SaveData:
+    With lazy=True ships, characters and storage containers are views over
+    their elements (see element_views) that only read skills, traits,
+    relationships and items when first accessed.
+
+    progress, if given, is called as the file is read (see ProgressCallback).
+    """
+    started = time.perf_counter()
+    st = os.stat(path)
+    save = SaveData(path=path, file_size=st.st_size, lazy_models=lazy,
+                    source_path=path, source_size=st.st_size, source_mtime_ns=st.st_mtime_ns)
+    f = open(path, "rb") if progress is not None else None
+    try:
+        source = ProgressFile(f, st.st_size, progress) if f is not None else path
+        if streaming:
+            _load_streaming(save, source)
+        else:
+            _load_tree(save, source)
+    finally:
+        if f is not None:
+            f.close()
+    save.load_seconds = time.perf_counter() - started
+    return save
+
+
+def _load_tree(save: SaveData, source) -> None:
     parser = etree.XMLParser(remove_blank_text=False)
-    xml_doc = etree.parse(path, parser)
+    xml_doc = etree.parse(source, parser)
     root = xml_doc.getroot()
     if root.tag != "game":
         raise ValueError("Invalid Space Haven save: missing root <game> element")
 
-    save = SaveData(path=path, xml_doc=xml_doc)
+    save.xml_doc = xml_doc
+    _read_globals(save, root)
 
-    # Globals
+    # Ships and their crews in a single walk; the first occurrence of a sid/entId wins
+    ships: List[Ship] = []
+    seen_sids: Set[int] = set()
+    characters: Dict[int, Character] = {}
+    for ship_el in root.iter("ship"):
+        try:
+            sid = int(ship_el.get("sid", "0") or 0)
+        except ValueError:
+            continue
+        if sid != 0 and sid not in seen_sids:
+            seen_sids.add(sid)
+            save.ship_elements[sid] = ship_el
+            ships.append(_read_ship(ship_el, sid, save.lazy_models))
+        chars_parent = ship_el.find("characters")
+        if chars_parent is None:
+            continue
+        for c in chars_parent.iterchildren("c"):
+            ch = _read_character(c, sid, characters, save.lazy_models)
+            if ch is not None:
+                characters[ch.entity_id] = ch
+                save.character_elements[ch.entity_id] = c
+
+    save.ships = ships
+    save.characters = list(characters.values())
+    save.character_index = characters
+    resolve_relationship_names(save)
+
+
+def _load_streaming(save: SaveData, source) -> None:
+    ships: List[Ship] = []
+    seen_sids: Set[int] = set()
+    characters: Dict[int, Character] = {}
+    # (element, sid) for every <ship> currently open, innermost last
+    open_ships: List[tuple] = []
+
+    context = etree.iterparse(source, events=("start", "end"), tag=("ship", "c"), remove_blank_text=False)
+    for event, el in context:
+        if el.tag == "ship":
+            if event == "end":
+                open_ships.pop()
+                continue
+            try:
+                sid = int(el.get("sid", "0") or 0)
+            except ValueError:
+                sid = 0
+            open_ships.append((el, sid))
+            if sid == 0 or sid in seen_sids:
+                continue
+            seen_sids.add(sid)
+            save.ship_elements[sid] = el
+            ships.append(_read_ship(el, sid, save.lazy_models))
+        elif event == "end" and open_ships:
+            # Only <ship>/<characters>/<c> is a crew member; condition <c> elements also land here
+            parent = el.getparent()
+            ship_el, ship_sid = open_ships[-1]
+            if parent is None or parent.tag != "characters" or parent.getparent() is not ship_el:
+                continue
+            ch = _read_character(el, ship_sid, characters, save.lazy_models)
+            if ch is not None:
+                characters[ch.entity_id] = ch
+                save.character_elements[ch.entity_id] = el
+
+    root = context.root
+    if root is None or root.tag != "game":
+        raise ValueError("Invalid Space Haven save: missing root <game> element")
+    save.xml_doc = root.getroottree()
+    _read_globals(save, root)
+    save.ships = ships
+    save.characters = list(characters.values())
+    save.character_index = characters
+    resolve_relationship_names(save)
+
+
+def _read_globals(save: SaveData, root) -> None:
     bank = root.find("playerBank")
     if bank is not None and bank.get("ca") is not None:
         try:
@@ -47,106 +199,196 @@ def load_save(path: str) -> SaveData:
     except Exception:
         pass
 
-    # Ships
-    ships: List[Ship] = []
-    for ship_el in root.findall(".//ship"):
-        try:
-            sid = int(ship_el.get("sid", "0"))
-        except ValueError:
-            continue
-        if sid == 0:
-            continue
-        sname = ship_el.get("sname") or "Unnamed Ship"
-        sx = int(ship_el.get("sx", "0") or 0)
-        sy = int(ship_el.get("sy", "0") or 0)
-        if not any(s.sid == sid for s in ships):
-            ships.append(Ship(sid=sid, sname=sname, sx=sx, sy=sy))
-    save.ships = ships
 
-    # Characters
-    characters: List[Character] = []
-    for ship_el in root.findall(".//ship"):
-        ship_sid = int(ship_el.get("sid", "0") or 0)
-        chars_parent = ship_el.find("characters")
-        if chars_parent is None:
+def _read_ship(ship_el, sid: int, lazy: bool) -> Ship:
+    if lazy:
+        return ShipView(ship_el, sid)
+    sname = ship_el.get("sname") or "Unnamed Ship"
+    sx = int(ship_el.get("sx", "0") or 0)
+    sy = int(ship_el.get("sy", "0") or 0)
+    return Ship(sid=sid, sname=sname, sx=sx, sy=sy)
+
+
+def _read_character(c, ship_sid: int, characters: Dict[int, Character], lazy: bool) -> Optional[Character]:
+    """Build a Character from a <c> crew element, or None if it is invalid or already loaded.
+
+    characters maps entId to the crew loaded so far. Relationship target names
+    are left for resolve_relationship_names, since targets may appear later.
+    """
+    name = sys.intern(c.get("name") or "Unknown")
+    try:
+        ent_id = int(c.get("entId", "0"))
+    except ValueError:
+        ent_id = 0
+    if ent_id == 0 or ent_id in characters:
+        return None
+    if lazy:
+        # Names resolve against the finished index whenever relationships are first read
+        return CharacterView(c, ent_id, ship_sid, characters)
+    ch = Character(name=name, entity_id=ent_id, ship_sid=ship_sid)
+
+    pers = c.find("pers")
+    ch.skills = read_skills(pers)
+    ch.traits = read_traits(pers)
+    ch.attributes = read_attributes(pers)
+    ch.conditions = read_conditions(pers)
+    ch.relationships = read_relationships(pers)
+    return ch
+
+
+def resolve_relationship_names(save: SaveData, target_ids: Optional[Set[int]] = None) -> None:
+    """Fill in RelationshipInfo.target_name from the entId index.
+
+    Runs after loading so targets defined later in the document resolve too.
+    Pass target_ids to only refresh relationships pointing at those characters.
+    """
+    index = save.character_index
+    for ch in save.characters:
+        if isinstance(ch, CharacterView) and not ch.section_loaded("relationships"):
             continue
-        for c in chars_parent.findall("c"):
-            name = c.get("name") or "Unknown"
-            try:
-                ent_id = int(c.get("entId", "0"))
-            except ValueError:
-                ent_id = 0
-            if ent_id == 0 or any(ch.entity_id == ent_id for ch in characters):
+        for rel in ch.relationships:
+            if target_ids is not None and rel.target_id not in target_ids:
                 continue
-            ch = Character(name=name, entity_id=ent_id, ship_sid=ship_sid)
-
-            pers = c.find("pers")
-            # Skills
-            skills_el = pers.find("skills") if pers is not None else None
-            if skills_el is not None:
-                for s in skills_el.findall("s"):
-                    try:
-                        sk = int(s.get("sk", "0"))
-                        lvl = int(s.get("level", "0"))
-                    except ValueError:
-                        continue
-                    ch.skills.append(DataProp(id=sk, name=DefaultSkillIDs.get(sk, f"Skill {sk}"), value=lvl))
-            # Traits
-            traits_el = pers.find("traits") if pers is not None else None
-            if traits_el is not None:
-                for t in traits_el.findall("t"):
-                    try:
-                        tid = int(t.get("id", "0"))
-                    except ValueError:
-                        continue
-                    ch.traits.append(DataProp(id=tid, name=DefaultTraitIDs.get(tid, f"Trait {tid}")))
-            # Attributes
-            attrs_el = pers.find("attr") if pers is not None else None
-            if attrs_el is not None:
-                for a in attrs_el.findall("a"):
-                    try:
-                        aid = int(a.get("id", "0"))
-                        pts = int(a.get("points", "0"))
-                    except ValueError:
-                        continue
-                    ch.attributes.append(DataProp(id=aid, name=DefaultAttributeIDs.get(aid, f"Attr {aid}"), value=pts))
-            # Conditions
-            conds_el = pers.find("conditions") if pers is not None else None
-            if conds_el is not None:
-                for ce in conds_el.findall("c"):
-                    try:
-                        cid = int(ce.get("id", "0"))
-                    except ValueError:
-                        continue
-                    if cid in ConditionsIDs:
-                        ch.conditions.append(DataProp(id=cid, name=ConditionsIDs[cid]))
-            # Relationships
-            sociality = pers.find("sociality") if pers is not None else None
-            rels = sociality.find("relationships") if sociality is not None else None
-            if rels is not None:
-                for le in rels.findall("l"):
-                    try:
-                        target_id = int(le.get("targetId", "0"))
-                        friendship = int(le.get("friendship", "0"))
-                        attraction = int(le.get("attraction", "0"))
-                        compatibility = int(le.get("compatibility", "0"))
-                    except ValueError:
-                        continue
-                    if target_id:
-                        target = next((c2 for c2 in characters if c2.entity_id == target_id), None)
-                        target_name = target.name if target else f"Unknown ID ({target_id})"
-                        ch.relationships.append(RelationshipInfo(target_id, target_name, friendship, attraction, compatibility))
-
-            characters.append(ch)
-
-    save.characters = characters
-    return save
+            rel.target_name = relationship_target_name(index, rel.target_id)
 
 
-def load_storage_containers(save: SaveData, ship_sid: int) -> List[StorageContainer]:
+def refresh_character(save: SaveData, character: Character) -> None:
+    """Re-read a character's skills, traits, attributes, conditions and relationships from its element."""
+    if isinstance(character, CharacterView):
+        character.reload()
+        return
+    char_el = save.character_elements.get(character.entity_id)
+    pers = char_el.find("pers") if char_el is not None else None
+    character.skills = read_skills(pers)
+    character.traits = read_traits(pers)
+    character.attributes = read_attributes(pers)
+    character.conditions = read_conditions(pers)
+    character.relationships = read_relationships(pers, save.character_index)
+
+
+def refresh_models(save: SaveData, elements: List[object]) -> None:
+    """Bring the models back in line with the XML after the given elements changed outside the update_* functions.
+
+    Used after EditJournal.rollback(): globals are re-read, affected characters and
+    ships are refreshed, crew added or removed under <characters> are reconciled,
+    and the storage cache of affected ships is dropped.
+    """
     assert save.xml_doc is not None
     root = save.xml_doc.getroot()
-    ship_el = root.find(f".//ship[@sid='{ship_sid}']")
+    ent_ids: Set[int] = set()
+    ship_sids: Set[int] = set()
+    crew_nodes: List[object] = []
+    for el in elements:
+        node = el
+        while node is not None and node is not root:
+            if node.tag == "characters" and node is el:
+                crew_nodes.append(node)
+            elif node.tag == "c" and node.getparent() is not None and node.getparent().tag == "characters":
+                try:
+                    ent_ids.add(int(node.get("entId", "0")))
+                except ValueError:
+                    pass
+            elif node.tag == "ship":
+                sid = next((sid for sid, ship_el in save.ship_elements.items() if ship_el is node), None)
+                if sid is not None:
+                    ship_sids.add(sid)
+                    break
+            node = node.getparent()
+
+    _read_globals(save, root)
+    for node in crew_nodes:
+        _reconcile_crew(save, node)
+    for ent_id in ent_ids:
+        character = save.character_index.get(ent_id)
+        if character is not None and save.character_elements.get(ent_id) is not None:
+            refresh_character(save, character)
+    with save.storage_lock:
+        for sid in ship_sids:
+            save.storage_cache.pop(sid, None)
+    for ship in save.ships:
+        if ship.sid in ship_sids and not isinstance(ship, ShipView):
+            fresh = _read_ship(save.ship_elements[ship.sid], ship.sid, lazy=False)
+            ship.sname, ship.sx, ship.sy = fresh.sname, fresh.sx, fresh.sy
+
+
+def undo_edit(save: SaveData) -> Optional[str]:
+    """Undo the newest edit step (see EditJournal.undo) and refresh the models; returns its label or None."""
+    result = save.journal.undo()
+    if result is None:
+        return None
+    label, touched = result
+    refresh_models(save, touched)
+    return label
+
+
+def redo_edit(save: SaveData) -> Optional[str]:
+    """Redo the most recently undone edit step and refresh the models; returns its label or None."""
+    result = save.journal.redo()
+    if result is None:
+        return None
+    label, touched = result
+    refresh_models(save, touched)
+    return label
+
+
+def _reconcile_crew(save: SaveData, characters_node) -> None:
+    """Add or drop Character models so they match the <c> children of a ship's <characters> node."""
+    ship_el = characters_node.getparent()
+    ship_sid = next((sid for sid, el in save.ship_elements.items() if el is ship_el), None)
+    if ship_sid is None:
+        return
+    present = {id(c) for c in characters_node.iterchildren("c")}
+    removed = {ent for ent, el in save.character_elements.items()
+               if save.character_index[ent].ship_sid == ship_sid and id(el) not in present}
+    for ent in removed:
+        del save.character_elements[ent]
+        del save.character_index[ent]
+    if removed:
+        save.characters = [c for c in save.characters if c.entity_id not in removed]
+    added: Set[int] = set()
+    for c in characters_node.iterchildren("c"):
+        ch = _read_character(c, ship_sid, save.character_index, save.lazy_models)
+        if ch is not None:
+            save.characters.append(ch)
+            save.character_index[ch.entity_id] = ch
+            save.character_elements[ch.entity_id] = c
+            added.add(ch.entity_id)
+    if removed or added:
+        resolve_relationship_names(save, removed | added)
+    for ent in added:
+        ch = save.character_index[ent]
+        if not isinstance(ch, CharacterView):
+            ch.relationships = read_relationships(save.character_elements[ent].find("pers"), save.character_index)
+
+
+def load_storage_containers(save: SaveData, ship_sid: int) -> List[StorageContainer]:
+    """Return the storage containers of a ship, cached per sid until a storage edit invalidates them."""
+    with save.storage_lock:
+        containers = save.storage_cache.get(ship_sid)
+        if containers is None:
+            assert save.xml_doc is not None
+            containers = _find_storage_containers(save, ship_sid)
+            save.storage_cache[ship_sid] = containers
+        return containers
+
+
+def prefetch_storage_containers(save: SaveData) -> None:
+    """Fill the storage cache for every ship; meant to run on a background thread after load."""
+    for sid in list(save.ship_elements):
+        load_storage_containers(save, sid)
+
+
+def invalidate_storage_cache(save: SaveData, ship_sid: Optional[int] = None) -> None:
+    """Drop the cached containers of one ship, or of all ships if ship_sid is None."""
+    with save.storage_lock:
+        if ship_sid is None:
+            save.storage_cache.clear()
+        else:
+            save.storage_cache.pop(ship_sid, None)
+
+
+def _find_storage_containers(save: SaveData, ship_sid: int) -> List[StorageContainer]:
+    ship_el = save.ship_elements.get(ship_sid)
     if ship_el is None:
         return []
 
@@ -177,35 +419,44 @@ def load_storage_containers(save: SaveData, ship_sid: int) -> List[StorageContai
             elif parent_obj:
                 display = f"Storage (Type: {parent_obj}) - {idx + 1}"
 
-        cont = StorageContainer(display_name=display, feat_element=feat, parent_ent_id=parent_ent, parent_obj_id=parent_obj)
-        for s in inv.findall("s"):
-            try:
-                item_id = int(s.get("elementaryId", "0"))
-                qty = int(s.get("inStorage", "0"))
-            except ValueError:
-                continue
-            if qty > 0:
-                cont.items.append(StorageItem(element_id=item_id, quantity=qty))
-        if cont.items:
-            containers.append(cont)
+        if save.lazy_models:
+            if has_storage_items(inv):
+                containers.append(StorageContainerView(display, feat, inv, parent_ent, parent_obj, ship_sid))
+        else:
+            cont = StorageContainer(display_name=display, feat_element=feat, parent_ent_id=parent_ent,
+                                    parent_obj_id=parent_obj, ship_sid=ship_sid, inv_element=inv)
+            cont.items, cont.item_index = read_inventory(inv)
+            if cont.items:
+                containers.append(cont)
         idx += 1
     return containers
 
 
+def get_ship_owner(save: SaveData, ship_sid: int) -> Optional[str]:
+    """Return the owner recorded in a ship's <settings>, or None if not set."""
+    ship_el = save.ship_elements.get(ship_sid)
+    if ship_el is None:
+        return save.ship_owners.get(ship_sid)
+    settings = ship_el.find("settings")
+    if settings is None:
+        return None
+    return settings.get("owner") or None
+
+
 def update_globals_in_memory(save: SaveData, credits: Optional[int], sandbox: Optional[bool], prestige_points: Optional[int]) -> None:
     assert save.xml_doc is not None
     root = save.xml_doc.getroot()
     if credits is not None:
         bank = root.find("playerBank")
         if bank is not None:
-            bank.set("ca", str(credits))
+            save.journal.set(bank, "ca", str(credits))
             save.credits = credits
     if sandbox is not None:
         settings = root.find("settings")
         if settings is not None:
             diff = settings.find("diff")
             if diff is not None:
-                diff.set("sandbox", "true" if sandbox else "false")
+                save.journal.set(diff, "sandbox", "true" if sandbox else "false")
                 save.sandbox = sandbox
     if prestige_points is not None:
         ql1 = root.find("questLines")
@@ -213,80 +464,101 @@ def update_globals_in_memory(save: SaveData, credits: Optional[int], sandbox: Op
         if ql2 is not None:
             for l in ql2.findall("l"):
                 if l.get("type") == "ExodusFleet":
-                    l.set("playerPrestigePoints", str(prestige_points))
+                    save.journal.set(l, "playerPrestigePoints", str(prestige_points))
                     save.prestige_points = prestige_points
                     break
 
 
 def add_item_to_container(save: SaveData, container: StorageContainer, item_id: int, qty: int) -> None:
     assert save.xml_doc is not None
-    inv = container.feat_element.find(".//inv")
-    if inv is None:
-        inv = etree.Element("inv")
-        container.feat_element.append(inv)
-    s = next((e for e in inv.findall("s") if e.get("elementaryId") == str(item_id)), None)
-    if s is None:
-        s = etree.Element("s")
-        s.set("elementaryId", str(item_id))
-        s.set("inStorage", str(qty))
-        s.set("onTheWayIn", "0")
-        s.set("onTheWayOut", "0")
-        inv.append(s)
-    else:
-        current = int(s.get("inStorage", "0") or 0)
-        s.set("inStorage", str(current + qty))
-
-    found = next((i for i in container.items if i.element_id == item_id), None)
-    if found:
-        found.quantity += qty
-    else:
-        container.items.append(StorageItem(element_id=item_id, quantity=qty))
+    with save.storage_lock:
+        # The container list of this ship may change (e.g. a container emptied), so rebuild it next time
+        save.storage_cache.pop(container.ship_sid, None)
+        inv = _container_inv(save, container, create=True)
+        entry = container.item_index.get(item_id)
+        if entry is None:
+            s = etree.Element("s")
+            s.set("elementaryId", str(item_id))
+            s.set("inStorage", str(qty))
+            s.set("onTheWayIn", "0")
+            s.set("onTheWayOut", "0")
+            save.journal.append(inv, s)
+            entry = container.item_index[item_id] = [s, None]
+        else:
+            s = entry[0]
+            current = int(s.get("inStorage", "0") or 0)
+            save.journal.set(s, "inStorage", str(current + qty))
+
+        if entry[1] is not None:
+            entry[1].quantity += qty
+        else:
+            entry[1] = StorageItem(element_id=item_id, quantity=qty)
+            container.items.append(entry[1])
 
 
 def delete_item_from_container(save: SaveData, container: StorageContainer, item_id: int) -> None:
     assert save.xml_doc is not None
-    inv = container.feat_element.find(".//inv")
-    if inv is None:
-        return
-    s = next((e for e in inv.findall("s") if e.get("elementaryId") == str(item_id)), None)
-    if s is not None:
-        inv.remove(s)
-    container.items = [i for i in container.items if i.element_id != item_id]
+    with save.storage_lock:
+        save.storage_cache.pop(container.ship_sid, None)
+        inv = _container_inv(save, container)
+        if inv is None:
+            return
+        _remove_stack(save, container, inv, item_id)
 
 
 def update_item_quantity(save: SaveData, container: StorageContainer, item_id: int, qty: int) -> None:
     assert save.xml_doc is not None
-    inv = container.feat_element.find(".//inv")
-    if inv is None:
-        return
-    s = next((e for e in inv.findall("s") if e.get("elementaryId") == str(item_id)), None)
-    if qty <= 0:
-        if s is not None:
-            inv.remove(s)
-        container.items = [i for i in container.items if i.element_id != item_id]
+    with save.storage_lock:
+        save.storage_cache.pop(container.ship_sid, None)
+        inv = _container_inv(save, container)
+        if inv is None:
+            return
+        if qty <= 0:
+            _remove_stack(save, container, inv, item_id)
+            return
+        entry = container.item_index.get(item_id)
+        if entry is None:
+            s = etree.Element("s")
+            s.set("elementaryId", str(item_id))
+            save.journal.append(inv, s)
+            entry = container.item_index[item_id] = [s, None]
+        save.journal.set(entry[0], "inStorage", str(qty))
+        if entry[1] is not None:
+            entry[1].quantity = qty
+        else:
+            entry[1] = StorageItem(element_id=item_id, quantity=qty)
+            container.items.append(entry[1])
+
+
+def _container_inv(save: SaveData, container: StorageContainer, create: bool = False):
+    """Return the container's <inv> element, optionally creating it."""
+    if container.inv_element is None:
+        container.inv_element = container.feat_element.find(".//inv")
+        if container.inv_element is None and create:
+            container.inv_element = etree.Element("inv")
+            save.journal.append(container.feat_element, container.inv_element)
+    return container.inv_element
+
+
+def _remove_stack(save: SaveData, container: StorageContainer, inv, item_id: int) -> None:
+    entry = container.item_index.pop(item_id, None)
+    if entry is None:
         return
-    if s is None:
-        s = etree.Element("s")
-        s.set("elementaryId", str(item_id))
-        inv.append(s)
-    s.set("inStorage", str(qty))
-    found = next((i for i in container.items if i.element_id == item_id), None)
-    if found:
-        found.quantity = qty
-    else:
-        container.items.append(StorageItem(element_id=item_id, quantity=qty))
+    s, item = entry
+    save.journal.remove(inv, s)
+    if item is not None:
+        container.items.remove(item)
 
 
 def update_ship_size(save: SaveData, ship: Ship, squares_w: int, squares_h: int) -> None:
     assert save.xml_doc is not None
     sx = squares_w * 28
     sy = squares_h * 28
-    root = save.xml_doc.getroot()
-    ship_el = root.find(f".//ship[@sid='{ship.sid}']")
+    ship_el = save.ship_elements.get(ship.sid)
     if ship_el is None:
         return
-    ship_el.set("sx", str(sx))
-    ship_el.set("sy", str(sy))
+    save.journal.set(ship_el, "sx", str(sx))
+    save.journal.set(ship_el, "sy", str(sy))
     ship.sx = sx
     ship.sy = sy
 
@@ -294,8 +566,7 @@ def update_ship_size(save: SaveData, ship: Ship, squares_w: int, squares_h: int)
 def update_character_attribute(save: SaveData, character: Character, attr_id: int, value: int) -> None:
     """Update a character's attribute value in XML."""
     assert save.xml_doc is not None
-    root = save.xml_doc.getroot()
-    char_el = next((c for c in root.findall(".//c") if c.get("entId") == str(character.entity_id)), None)
+    char_el = save.character_elements.get(character.entity_id)
     if char_el is None:
         return
     pers = char_el.find("pers")
@@ -304,26 +575,25 @@ def update_character_attribute(save: SaveData, character: Character, attr_id: in
     attrs = pers.find("attr")
     if attrs is None:
         attrs = etree.Element("attr")
-        pers.append(attrs)
+        save.journal.append(pers, attrs)
     a_el = attrs.find(f"a[@id='{attr_id}']")
     if a_el is None:
         a_el = etree.Element("a")
         a_el.set("id", str(attr_id))
-        attrs.append(a_el)
-    a_el.set("points", str(value))
+        save.journal.append(attrs, a_el)
+    save.journal.set(a_el, "points", str(value))
     # Update in-memory model
     attr = next((a for a in character.attributes if a.id == attr_id), None)
     if attr:
         attr.value = value
     else:
-        character.attributes.append(DataProp(id=attr_id, name=DefaultAttributeIDs.get(attr_id, f"Attr {attr_id}"), value=value))
+        character.attributes.append(DataProp(id=attr_id, name=display_name(DefaultAttributeIDs, attr_id, "Attr"), value=value))
 
 
 def update_character_skill(save: SaveData, character: Character, skill_id: int, level: int) -> None:
     """Update a character's skill level in XML."""
     assert save.xml_doc is not None
-    root = save.xml_doc.getroot()
-    char_el = next((c for c in root.findall(".//c") if c.get("entId") == str(character.entity_id)), None)
+    char_el = save.character_elements.get(character.entity_id)
     if char_el is None:
         return
     pers = char_el.find("pers")
@@ -332,26 +602,25 @@ def update_character_skill(save: SaveData, character: Character, skill_id: int,
     skills = pers.find("skills")
     if skills is None:
         skills = etree.Element("skills")
-        pers.append(skills)
+        save.journal.append(pers, skills)
     s_el = skills.find(f"s[@sk='{skill_id}']")
     if s_el is None:
         s_el = etree.Element("s")
         s_el.set("sk", str(skill_id))
-        skills.append(s_el)
-    s_el.set("level", str(level))
+        save.journal.append(skills, s_el)
+    save.journal.set(s_el, "level", str(level))
     # Update in-memory model
     skill = next((s for s in character.skills if s.id == skill_id), None)
     if skill:
         skill.value = level
     else:
-        character.skills.append(DataProp(id=skill_id, name=DefaultSkillIDs.get(skill_id, f"Skill {skill_id}"), value=level))
+        character.skills.append(DataProp(id=skill_id, name=display_name(DefaultSkillIDs, skill_id, "Skill"), value=level))
 
 
 def add_character_trait(save: SaveData, character: Character, trait_id: int) -> None:
     """Add a trait to a character."""
     assert save.xml_doc is not None
-    root = save.xml_doc.getroot()
-    char_el = next((c for c in root.findall(".//c") if c.get("entId") == str(character.entity_id)), None)
+    char_el = save.character_elements.get(character.entity_id)
     if char_el is None:
         return
     pers = char_el.find("pers")
@@ -360,23 +629,22 @@ def add_character_trait(save: SaveData, character: Character, trait_id: int) ->
     traits = pers.find("traits")
     if traits is None:
         traits = etree.Element("traits")
-        pers.append(traits)
+        save.journal.append(pers, traits)
     # Check if already exists
     if traits.find(f"t[@id='{trait_id}']") is not None:
         return
     t_el = etree.Element("t")
     t_el.set("id", str(trait_id))
-    traits.append(t_el)
+    save.journal.append(traits, t_el)
     # Update in-memory model
     if not any(t.id == trait_id for t in character.traits):
-        character.traits.append(DataProp(id=trait_id, name=DefaultTraitIDs.get(trait_id, f"Trait {trait_id}")))
+        character.traits.append(DataProp(id=trait_id, name=display_name(DefaultTraitIDs, trait_id, "Trait")))
 
 
 def remove_character_trait(save: SaveData, character: Character, trait_id: int) -> None:
     """Remove a trait from a character."""
     assert save.xml_doc is not None
-    root = save.xml_doc.getroot()
-    char_el = next((c for c in root.findall(".//c") if c.get("entId") == str(character.entity_id)), None)
+    char_el = save.character_elements.get(character.entity_id)
     if char_el is None:
         return
     pers = char_el.find("pers")
@@ -386,7 +654,7 @@ def remove_character_trait(save: SaveData, character: Character, trait_id: int)
     if traits is not None:
         t_el = traits.find(f"t[@id='{trait_id}']")
         if t_el is not None:
-            traits.remove(t_el)
+            save.journal.remove(traits, t_el)
     # Update in-memory model
     character.traits = [t for t in character.traits if t.id != trait_id]
 
@@ -394,8 +662,7 @@ def remove_character_trait(save: SaveData, character: Character, trait_id: int)
 def remove_character_condition(save: SaveData, character: Character, condition_id: int) -> None:
     """Remove a condition from a character."""
     assert save.xml_doc is not None
-    root = save.xml_doc.getroot()
-    char_el = next((c for c in root.findall(".//c") if c.get("entId") == str(character.entity_id)), None)
+    char_el = save.character_elements.get(character.entity_id)
     if char_el is None:
         return
     pers = char_el.find("pers")
@@ -405,7 +672,7 @@ def remove_character_condition(save: SaveData, character: Character, condition_i
     if conditions is not None:
         c_el = conditions.find(f"c[@id='{condition_id}']")
         if c_el is not None:
-            conditions.remove(c_el)
+            save.journal.remove(conditions, c_el)
     # Update in-memory model
     character.conditions = [c for c in character.conditions if c.id != condition_id]
 
@@ -413,8 +680,7 @@ def remove_character_condition(save: SaveData, character: Character, condition_i
 def update_character_relationship(save: SaveData, character: Character, target_id: int, friendship: Optional[int] = None, attraction: Optional[int] = None, compatibility: Optional[int] = None) -> None:
     """Update a character's relationship values."""
     assert save.xml_doc is not None
-    root = save.xml_doc.getroot()
-    char_el = next((c for c in root.findall(".//c") if c.get("entId") == str(character.entity_id)), None)
+    char_el = save.character_elements.get(character.entity_id)
     if char_el is None:
         return
     pers = char_el.find("pers")
@@ -423,22 +689,22 @@ def update_character_relationship(save: SaveData, character: Character, target_i
     sociality = pers.find("sociality")
     if sociality is None:
         sociality = etree.Element("sociality")
-        pers.append(sociality)
+        save.journal.append(pers, sociality)
     relationships = sociality.find("relationships")
     if relationships is None:
         relationships = etree.Element("relationships")
-        sociality.append(relationships)
+        save.journal.append(sociality, relationships)
     l_el = relationships.find(f"l[@targetId='{target_id}']")
     if l_el is None:
         l_el = etree.Element("l")
         l_el.set("targetId", str(target_id))
-        relationships.append(l_el)
+        save.journal.append(relationships, l_el)
     if friendship is not None:
-        l_el.set("friendship", str(friendship))
+        save.journal.set(l_el, "friendship", str(friendship))
     if attraction is not None:
-        l_el.set("attraction", str(attraction))
+        save.journal.set(l_el, "attraction", str(attraction))
     if compatibility is not None:
-        l_el.set("compatibility", str(compatibility))
+        save.journal.set(l_el, "compatibility", str(compatibility))
     # Update in-memory model
     rel = next((r for r in character.relationships if r.target_id == target_id), None)
     if rel:
@@ -450,7 +716,7 @@ def update_character_relationship(save: SaveData, character: Character, target_i
             rel.compatibility = compatibility
     else:
         # Need target name
-        target_char = next((c for c in save.characters if c.entity_id == target_id), None)
+        target_char = save.character_index.get(target_id)
         target_name = target_char.name if target_char else f"Unknown ID ({target_id})"
         character.relationships.append(RelationshipInfo(
             target_id, target_name,
@@ -473,10 +739,10 @@ def create_new_crew_member(save: SaveData, ship_sid: int, name: str, attributes:
         next_id = int(id_counter_attr) + 1
     except ValueError:
         raise ValueError(f"Cannot parse 'idCounter' value '{id_counter_attr}'.")
-    root.set("idCounter", str(next_id))
+    save.journal.set(root, "idCounter", str(next_id))
     
     # Find ship and characters node
-    ship_el = next((s for s in root.findall(".//ship") if s.get("sid") == str(ship_sid)), None)
+    ship_el = save.ship_elements.get(ship_sid)
     if ship_el is None:
         raise ValueError(f"Ship with SID {ship_sid} not found.")
     characters_node = ship_el.find("characters")
@@ -541,25 +807,59 @@ def create_new_crew_member(save: SaveData, ship_sid: int, name: str, attributes:
                 rels.clear()
     
     # Add to XML
-    characters_node.append(new_char_el)
+    save.journal.append(characters_node, new_char_el)
     
     # Create in-memory character
-    new_char = Character(
-        name=name,
-        entity_id=next_id,
-        ship_sid=ship_sid,
-        attributes=[DataProp(id=a.id, name=a.name, value=a.value) for a in attributes],
-        skills=[DataProp(id=s.id, name=s.name, value=s.value) for s in skills],
-        traits=[DataProp(id=t.id, name=t.name) for t in traits],
-        conditions=[],
-        relationships=[]
-    )
+    if save.lazy_models:
+        new_char = CharacterView(new_char_el, next_id, ship_sid, save.character_index)
+    else:
+        new_char = Character(
+            name=name,
+            entity_id=next_id,
+            ship_sid=ship_sid,
+            attributes=[DataProp(id=a.id, name=display_name(DefaultAttributeIDs, a.id, "Attr"), value=a.value) for a in attributes],
+            skills=[DataProp(id=s.id, name=display_name(DefaultSkillIDs, s.id, "Skill"), value=s.value) for s in skills],
+            traits=[DataProp(id=t.id, name=display_name(DefaultTraitIDs, t.id, "Trait")) for t in traits],
+            conditions=[],
+            relationships=[]
+        )
     save.characters.append(new_char)
+    save.character_index[next_id] = new_char
+    save.character_elements[next_id] = new_char_el
+    resolve_relationship_names(save, {next_id})
     return new_char
 
 
-def save_to_disk(save: SaveData) -> None:
+def save_to_disk(save: SaveData, incremental: bool = True, progress: Optional[ProgressCallback] = None) -> None:
+    """Write the save to save.path.
+
+    If only attribute values changed since the file was loaded or last saved,
+    the changed start tags are spliced into a copy of the original bytes (see
+    splice_writer); otherwise the whole tree is serialized. Both write a
+    temporary file and swap it in, so a failed or cancelled save leaves the
+    file untouched. progress only reports the full serialization, measured
+    against the size the file had when loaded.
+    """
     assert save.xml_doc is not None
-    save.xml_doc.write(save.path, encoding="utf-8", pretty_print=False)
+    if not (incremental and splice_to_disk(save)):
+        _write_tree(save, progress)
+    st = os.stat(save.path)
+    save.source_path, save.source_size, save.source_mtime_ns = save.path, st.st_size, st.st_mtime_ns
+    save.journal.mark_clean()
+
+
+def _write_tree(save: SaveData, progress: Optional[ProgressCallback]) -> None:
+    tmp = save.path + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            target = ProgressFile(f, save.file_size, progress) if progress is not None else f
+            save.xml_doc.write(target, encoding="utf-8", pretty_print=False)
+        os.replace(tmp, save.path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
 
 
@@ -0,0 +1,85 @@
+from __future__ import annotations
+import os
+import sys
+import tempfile
+from typing import Callable, List, Tuple
+
+from lxml import etree
+
+try:
+    from .benchmarks import write_synthetic_save, measure_memory, memory_problems
+    from .id_collections import DefaultStorageIDs
+    from .save_loader import (
+        load_save, load_storage_containers, add_item_to_container, delete_item_from_container, undo_edit, redo_edit,
+    )
+except ImportError:
+    # Fallback for when running as standalone
+    from benchmarks import write_synthetic_save, measure_memory, memory_problems
+    from id_collections import DefaultStorageIDs
+    from save_loader import (
+        load_save, load_storage_containers, add_item_to_container, delete_item_from_container, undo_edit, redo_edit,
+    )
+
+
+# Regression checks for behaviour that is easy to break and hard to see in the
+# GUI, run by CI before building:
+#   python -m crossplatform.selftest
+# A check fails by raising, usually AssertionError with a description of what went wrong.
+
+
+def _expect(condition: bool, message: str) -> None:
+    # Not a bare assert, so the checks still run under python -O
+    if not condition:
+        raise AssertionError(message)
+
+
+def check_undo_insert_then_remove(tmp: str) -> None:
+    """An undo step that adds an element and removes it again can be undone and redone."""
+    path = os.path.join(tmp, "journal")
+    write_synthetic_save(path, 20)
+    save = load_save(path)
+    container = load_storage_containers(save, save.ships[0].sid)[0]
+    item_id = next(i for i in sorted(DefaultStorageIDs) if i not in {it.element_id for it in container.items})
+    before = etree.tostring(save.xml_doc)
+    with save.journal.transaction("Add and delete item"):
+        add_item_to_container(save, container, item_id, 5)
+        delete_item_from_container(save, container, item_id)
+        save.journal.set(save.xml_doc.getroot().find("playerBank"), "ca", "1")
+    after = etree.tostring(save.xml_doc)
+
+    _expect(undo_edit(save) == "Add and delete item", "undo did not revert the step")
+    _expect(etree.tostring(save.xml_doc) == before, "undo left the tree different from before the step")
+    _expect(save.journal.undo_label() is None, "the undone step is still on the undo stack")
+    _expect(redo_edit(save) == "Add and delete item", "redo did not apply the step")
+    _expect(etree.tostring(save.xml_doc) == after, "redo left the tree different from after the step")
+
+
+def check_lazy_memory(_tmp: str) -> None:
+    """Lazy models keep their memory savings over eager ones (see benchmarks.memory_problems)."""
+    characters = 300
+    problems = memory_problems(measure_memory(characters), characters)
+    _expect(not problems, "; ".join(problems))
+
+
+CHECKS: List[Tuple[str, Callable[[str], None]]] = [
+    ("undo insert then remove", check_undo_insert_then_remove),
+    ("lazy load memory", check_lazy_memory),
+]
+
+
+def main(argv: List[str] | None = None) -> int:
+    failed = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, check in CHECKS:
+            try:
+                check(tmp)
+            except Exception as ex:
+                failed += 1
+                print(f"FAIL {name}: {type(ex).__name__}: {ex}")
+            else:
+                print(f"ok   {name}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,5 @@
+# Suffixes of the files the editor keeps next to a save. This module imports
+# nothing, so code that only needs to recognise those files (backups) does not
+# load save_cache and, through it, the parser stack.
+
+CACHE_SUFFIX = ".editcache"  # save_cache's sidecar, "<save>.editcache"
@@ -0,0 +1,189 @@
+from __future__ import annotations
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    from .models import SaveData
+except ImportError:
+    # Fallback for when running as standalone (PyInstaller)
+    from models import SaveData
+
+
+# Incremental writer for save_to_disk. When every change since the file was
+# loaded (or last saved) is an attribute value, the changed elements' start tags
+# are located in the original bytes and replaced, and everything else is copied
+# through untouched. Anything it cannot do exactly (inserted or removed
+# elements, many changed elements, a file changed on disk, start tags that do
+# not serialize byte-for-byte as in the file) makes it decline so the caller falls
+# back to a full write.
+
+# Locating an element can take a few passes over the file, so beyond this many
+# changed elements a full serialization is faster
+MAX_SPLICED_ELEMENTS = 64
+
+_ESCAPES = (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;"),
+            ("\n", "&#10;"), ("\r", "&#13;"), ("\t", "&#9;"))
+
+
+def splice_to_disk(save: SaveData) -> bool:
+    """Write save.path by splicing changed start tags into the source file; False if not possible."""
+    assert save.xml_doc is not None
+    changes = save.journal.changes_since_clean()
+    if changes is None or save.source_path is None:
+        return False
+    if any(entry[0] != "set" for entry in changes):
+        return False
+    encoding = (save.xml_doc.docinfo.encoding or "UTF-8").upper()
+    if encoding not in ("UTF-8", "UTF8"):
+        return False
+
+    # Oldest recorded value per attribute is what the file on disk holds
+    originals: Dict[object, Dict[str, Optional[str]]] = {}
+    for _kind, el, key, old in changes:
+        originals.setdefault(el, {}).setdefault(key, old)
+    modified = [el for el, keys in originals.items() if any(el.get(k) != old for k, old in keys.items())]
+    if len(modified) > MAX_SPLICED_ELEMENTS:
+        return False
+    root = save.xml_doc.getroot()
+    if any(not _plain_element(el) or el.getroottree().getroot() is not root for el in modified):
+        return False
+
+    try:
+        st = os.stat(save.source_path)
+        if (st.st_size, st.st_mtime_ns) != (save.source_size, save.source_mtime_ns):
+            return False
+        with open(save.source_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return False
+    # _locate briefly puts the on-disk values back into the tree; keep the storage prefetch from reading them
+    with save.storage_lock:
+        targets = _locate(data, modified, originals)
+    if targets is None:
+        return False
+    view = memoryview(data)
+    parts: List[object] = []
+    pos = 0
+    for start, end, replacement in sorted(targets):
+        if start < pos:
+            return False
+        parts.append(view[pos:start])
+        parts.append(replacement)
+        pos = end
+    parts.append(view[pos:])
+
+    tmp = save.path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.writelines(parts)
+    os.replace(tmp, save.path)
+    return True
+
+
+def _plain_element(el) -> bool:
+    return isinstance(el.tag, str) and not el.tag.startswith("{") and not any(k.startswith("{") for k in el.attrib)
+
+
+def _locate(data: bytes, modified: List[object], originals: Dict[object, Dict[str, Optional[str]]]
+            ) -> Optional[List[Tuple[int, int, bytes]]]:
+    """(start, end, new bytes) for the start tag of each modified element, or None if one is not found."""
+    current = {el: list(el.attrib.items()) for el in modified}
+    # Match against the tree as it is on disk
+    for el in modified:
+        for key, old in originals[el].items():
+            if old is None:
+                el.attrib.pop(key, None)
+            else:
+                el.set(key, old)
+    try:
+        anchors: Dict[object, int] = {}
+        counts: Dict[bytes, int] = {}
+        targets: List[Tuple[int, int, bytes]] = []
+        for el in modified:
+            pos = _position(data, el, anchors, counts)
+            if pos is None:
+                return None
+            old_tag = _start_tag(el.tag, el.attrib.items())
+            targets.append((pos, pos + len(old_tag), _start_tag(el.tag, current[el])))
+        return targets
+    finally:
+        for el in modified:
+            el.attrib.clear()
+            for key, value in current[el]:
+                el.set(key, value)
+
+
+def _position(data: bytes, el, anchors: Dict[object, int], counts: Dict[bytes, int]) -> Optional[int]:
+    """Byte offset of el's start tag.
+
+    The nearest ancestor-or-self whose start tag occurs exactly once in the file
+    (or the root) serves as an anchor; el is then the n-th identical start tag
+    after the anchor, where n is counted in the anchor's subtree. Anchors are
+    remembered, so edits under the same character cost one search.
+    """
+    anchor = next((node for node in el.iterancestors() if node in anchors), None)
+    if el in anchors:
+        anchor = el
+    if anchor is None:
+        node = el
+        while True:
+            # Start tags without attributes (<pers>, <skills>, ...) are rarely unique, so don't scan for them
+            if not node.attrib and node.getparent() is not None:
+                node = node.getparent()
+                continue
+            pattern = _start_tag(node.tag, node.attrib.items())
+            if pattern not in counts:
+                counts[pattern] = data.count(pattern)
+            if counts[pattern] == 1 or node.getparent() is None:
+                pos = _find_start_tag(data, pattern, 0)
+                if pos < 0:
+                    return None
+                anchors[node] = pos
+                anchor = node
+                break
+            node = node.getparent()
+    if anchor is el:
+        return anchors[el]
+
+    attrs = list(el.attrib.items())
+    ordinal = 0
+    for other in anchor.iter(el.tag):
+        if other is el:
+            break
+        if list(other.attrib.items()) == attrs:
+            ordinal += 1
+    else:
+        return None
+    pattern = _start_tag(el.tag, attrs)
+    pos = anchors[anchor] - 1
+    for _ in range(ordinal + 1):
+        pos = _find_start_tag(data, pattern, pos + 1)
+        if pos < 0:
+            return None
+    # Markup inside comments or CDATA would throw off the count
+    if data.find(b"<!", anchors[anchor], pos) >= 0:
+        return None
+    return pos
+
+
+def _find_start_tag(data: bytes, pattern: bytes, start: int) -> int:
+    """Position of the next start tag that is exactly pattern (no further attributes), or -1."""
+    while True:
+        pos = data.find(pattern, start)
+        if pos < 0:
+            return -1
+        end = pos + len(pattern)
+        while end < len(data) and data[end] in b" \t\r\n":
+            end += 1
+        if end < len(data) and data[end] in b"/>":
+            return pos
+        start = pos + 1
+
+
+def _start_tag(tag: str, attrs: Iterable[Tuple[str, str]]) -> bytes:
+    """'<tag a="1" b="2"' as libxml2 serializes it, without the closing '>' or '/>'."""
+    out = ["<", tag]
+    for key, value in attrs:
+        for raw, escaped in _ESCAPES:
+            value = value.replace(raw, escaped)
+        out.append(f' {key}="{value}"')
+    return "".join(out).encode("utf-8")
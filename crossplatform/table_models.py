@@ -0,0 +1,340 @@
+from __future__ import annotations
+import bisect
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from PySide6.QtCore import Qt, QAbstractListModel, QAbstractTableModel, QModelIndex
+
+try:
+    from .id_collections import DefaultStorageIDs
+except ImportError:
+    # Fallback for when running as standalone (PyInstaller)
+    from id_collections import DefaultStorageIDs
+
+if TYPE_CHECKING:
+    # Only annotations use these, so building the window does not import models
+    from .models import Character, DataProp, RelationshipInfo, StorageContainer, StorageItem
+
+
+# Table models for the crew and storage editors. They read straight from the
+# Character and StorageContainer models, so nothing is copied into widget items.
+# A cell edit calls the model's edit callback (MainWindow applies it to the save
+# through save_loader) and then repaints only that cell.
+
+
+# data() runs for every visible cell and role on each repaint; comparing the role
+# against plain ints is far cheaper than against the Qt enum members
+_DISPLAY_ROLE = int(Qt.DisplayRole)
+_DISPLAY_ROLES = frozenset((_DISPLAY_ROLE, int(Qt.EditRole)))
+_USER_ROLE = int(Qt.UserRole)
+_EDIT_ROLE = int(Qt.EditRole)
+
+
+def _header(section: int, orientation, role: int, labels):
+    if role != _DISPLAY_ROLE:
+        return None
+    # Row numbers like QTableWidget shows
+    return labels[section] if orientation == Qt.Horizontal else str(section + 1)
+
+
+def _to_int(value) -> Optional[int]:
+    try:
+        return int(str(value).strip())
+    except ValueError:
+        return None
+
+
+class CrewListModel(QAbstractListModel):
+    """Names of a list of characters, in the order given; UserRole is the entity id."""
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._characters: List[Character] = []
+
+    def set_characters(self, characters: List[Character]) -> None:
+        self.beginResetModel()
+        self._characters = characters
+        self.endResetModel()
+
+    def character(self, row: int) -> Optional[Character]:
+        return self._characters[row] if 0 <= row < len(self._characters) else None
+
+    def row_of(self, entity_id: Optional[int]) -> int:
+        return next((r for r, c in enumerate(self._characters) if c.entity_id == entity_id), -1)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._characters)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == _DISPLAY_ROLE:
+            return self._characters[index.row()].name
+        if role == _USER_ROLE:
+            return self._characters[index.row()].entity_id
+        return None
+
+
+class DataPropTableModel(QAbstractTableModel):
+    """ID / name / value rows for every entry of a catalog such as DefaultSkillIDs.
+
+    Values come from the character's DataProp list; entries it lacks show as 0.
+    edit(id, value) is called when a value cell is edited.
+    """
+
+    def __init__(self, catalog: Dict[int, str], headers: List[str], edit: Callable[[int, int], None],
+                 parent=None) -> None:
+        super().__init__(parent)
+        self._rows = sorted(catalog.items())
+        self._headers = headers
+        self._edit = edit
+        self._props: List[DataProp] = []
+        self._values: Dict[int, int] = {}
+        self._loaded = False
+
+    def set_props(self, props: Optional[List[DataProp]]) -> None:
+        """Show a character's skills or attributes, or nothing for None."""
+        self.beginResetModel()
+        self._loaded = props is not None
+        self._props = props if props is not None else []
+        self._values = {p.id: p.value for p in self._props}
+        self.endResetModel()
+
+    def refresh_values(self) -> None:
+        """Re-read every value after a bulk change such as Set All, as one repaint of the value column."""
+        values = {p.id: p.value for p in self._props}
+        if values != self._values and self._rows:
+            self._values = values
+            self.dataChanged.emit(self.index(0, 2), self.index(len(self._rows) - 1, 2))
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() or not self._loaded else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else 3
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        return _header(section, orientation, role, self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role not in _DISPLAY_ROLES and role != _USER_ROLE or not index.isValid():
+            return None
+        prop_id, name = self._rows[index.row()]
+        if role == _USER_ROLE:
+            return prop_id
+        column = index.column()
+        if column == 0:
+            return str(prop_id)
+        if column == 1:
+            return name
+        return str(self._values.get(prop_id, 0))
+
+    def flags(self, index):
+        flags = super().flags(index)
+        return flags | Qt.ItemIsEditable if index.column() == 2 else flags
+
+    def setData(self, index, value, role=Qt.EditRole) -> bool:
+        number = _to_int(value)
+        if role != _EDIT_ROLE or index.column() != 2 or number is None:
+            return False
+        prop_id = self._rows[index.row()][0]
+        self._edit(prop_id, number)
+        self._values = {p.id: p.value for p in self._props}
+        self.dataChanged.emit(index, index)
+        return True
+
+
+class StorageTableModel(QAbstractTableModel):
+    """Item name / quantity / item id rows of one storage container, sorted by item name.
+
+    edit(item_id, quantity) is called when a quantity cell is edited.
+    """
+
+    HEADERS = ("Item Name", "Quantity", "Item ID")
+
+    def __init__(self, edit: Callable[[int, int], None], parent=None) -> None:
+        super().__init__(parent)
+        self._edit = edit
+        self._container: Optional[StorageContainer] = None
+        self._items: List[StorageItem] = []
+
+    def set_container(self, container: Optional[StorageContainer]) -> None:
+        self.beginResetModel()
+        self._container = container
+        self._items = self._sorted_items()
+        self.endResetModel()
+
+    def reload(self) -> None:
+        """Pick up items added to or removed from the container."""
+        self.set_container(self._container)
+
+    def total_quantity(self) -> int:
+        return sum(i.quantity for i in self._container.items) if self._container is not None else 0
+
+    def _sorted_items(self) -> List[StorageItem]:
+        if self._container is None:
+            return []
+        return sorted(self._container.items, key=lambda i: DefaultStorageIDs.get(i.element_id, str(i.element_id)))
+
+    def item_id(self, row: int) -> Optional[int]:
+        return self._items[row].element_id if 0 <= row < len(self._items) else None
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else 3
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        return _header(section, orientation, role, self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role not in _DISPLAY_ROLES and role != _USER_ROLE or not index.isValid():
+            return None
+        item = self._items[index.row()]
+        if role == _USER_ROLE:
+            return item.element_id
+        column = index.column()
+        if column == 0:
+            return DefaultStorageIDs.get(item.element_id, f"Unknown Item ({item.element_id})")
+        if column == 1:
+            return str(item.quantity)
+        return str(item.element_id)
+
+    def flags(self, index):
+        flags = super().flags(index)
+        return flags | Qt.ItemIsEditable if index.column() == 1 else flags
+
+    def setData(self, index, value, role=Qt.EditRole) -> bool:
+        number = _to_int(value)
+        if role != _EDIT_ROLE or index.column() != 1 or number is None:
+            return False
+        item = self._items[index.row()]
+        self._edit(item.element_id, number)
+        if self._container is None or item not in self._container.items:
+            # A quantity of 0 deletes the stack
+            self.reload()
+        else:
+            self.dataChanged.emit(index, index)
+        return True
+
+
+class RelationshipTableModel(QAbstractTableModel):
+    """Target / friendship / attraction / compatibility rows for all of a character's relationships.
+
+    The list is never re-sorted while the view scrolls or repaints. _order holds
+    positions into it in ascending order of the sort column, with _keys the
+    matching sort keys; view rows map to it from the front or, when sorting
+    descending, from the back. An edited value moves only its own row, found by
+    binary search in _keys.
+
+    edit(target_id, field, value) is called when a value cell is edited, with
+    field one of "friendship", "attraction" or "compatibility".
+    """
+
+    HEADERS = ("Target", "Friendship", "Attraction", "Compatibility")
+    FIELDS = (None, "friendship", "attraction", "compatibility")
+
+    def __init__(self, edit: Callable[[int, str, int], None], parent=None) -> None:
+        super().__init__(parent)
+        self._edit = edit
+        self._rels: List[RelationshipInfo] = []
+        self._order: List[int] = []
+        self._keys: List[tuple] = []
+        self._column = 0
+        self._descending = False
+
+    def set_relationships(self, rels: List[RelationshipInfo]) -> None:
+        self.beginResetModel()
+        self._rels = rels
+        self._build_index()
+        self.endResetModel()
+
+    def _key(self, rel: RelationshipInfo) -> tuple:
+        # target_id breaks ties, so every key is unique and a row's place is exact
+        field = self.FIELDS[self._column]
+        if field is None:
+            return (rel.target_name.casefold(), rel.target_id)
+        return (getattr(rel, field), rel.target_id)
+
+    def _build_index(self) -> None:
+        pairs = sorted((self._key(rel), n) for n, rel in enumerate(self._rels))
+        self._keys = [key for key, _n in pairs]
+        self._order = [n for _key, n in pairs]
+
+    def _position(self, row: int) -> int:
+        """Index into _order of a view row (and the reverse, as the mapping is its own inverse)."""
+        return len(self._order) - 1 - row if self._descending else row
+
+    def relationship(self, row: int) -> Optional[RelationshipInfo]:
+        if not 0 <= row < len(self._order):
+            return None
+        return self._rels[self._order[self._position(row)]]
+
+    def sort(self, column: int, order=Qt.AscendingOrder) -> None:
+        descending = order == Qt.DescendingOrder
+        if (column, descending) == (self._column, self._descending) or not 0 <= column < len(self.FIELDS):
+            return
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        rels = [self.relationship(index.row()) for index in persistent]
+        # Flipping the direction only changes which end rows are read from
+        if column != self._column:
+            self._column = column
+            self._build_index()
+        self._descending = descending
+        row_of = {id(self._rels[n]): self._position(pos) for pos, n in enumerate(self._order)}
+        self.changePersistentIndexList(
+            persistent, [self.index(row_of[id(rel)], index.column()) for rel, index in zip(rels, persistent)])
+        self.layoutChanged.emit()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else 4
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        return _header(section, orientation, role, self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role not in _DISPLAY_ROLES and role != _USER_ROLE or not index.isValid():
+            return None
+        rel = self._rels[self._order[self._position(index.row())]]
+        if role == _USER_ROLE:
+            return rel.target_id
+        field = self.FIELDS[index.column()]
+        return rel.target_name if field is None else str(getattr(rel, field))
+
+    def flags(self, index):
+        flags = super().flags(index)
+        return flags | Qt.ItemIsEditable if index.column() > 0 else flags
+
+    def setData(self, index, value, role=Qt.EditRole) -> bool:
+        number = _to_int(value)
+        if role != _EDIT_ROLE or index.column() == 0 or number is None:
+            return False
+        row = index.row()
+        rel = self.relationship(row)
+        self._edit(rel.target_id, self.FIELDS[index.column()], number)
+        self.dataChanged.emit(index, index)
+        if index.column() == self._column:
+            self._move_to_sorted_place(row)
+        return True
+
+    def _move_to_sorted_place(self, row: int) -> None:
+        old = self._position(row)
+        n = self._order[old]
+        key = self._key(self._rels[n])
+        del self._keys[old]
+        new = bisect.bisect_left(self._keys, key)
+        self._keys.insert(old, key)
+        if new == old:
+            return
+        new_row = self._position(new)
+        # beginMoveRows takes the destination in row numbers from before the move
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), new_row + 1 if new_row > row else new_row)
+        del self._keys[old]
+        del self._order[old]
+        self._keys.insert(new, key)
+        self._order.insert(new, n)
+        self.endMoveRows()